@@ -0,0 +1,97 @@
+"""Memory benchmark: the object-per-element layout hyperpy used to have against the incidence storage and the slotted
+Vertex/Hyperedge views.
+
+Run from the repository root with `python benchmarks/memory.py [n_vertices] [n_hyperedges] [hyperedge_size]`.
+"""
+import os
+import sys
+import tracemalloc
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from hypergraph_def import Hypergraph
+
+
+class DictVertex:
+    """The former Vertex layout: name-mangled attributes in a per-instance __dict__."""
+
+    def __init__(self, hype, name, weight):
+        self.__hype = hype
+        self.__name = name
+        self.__weight = weight
+
+
+class DictHyperedge:
+    """The former Hyperedge layout, holding a Python list of its vertices."""
+
+    def __init__(self, hype, name, vertices, weight):
+        self.__hype = hype
+        self.__name = name
+        self.__vertices = vertices
+        self.__weight = weight
+
+
+class DictView:
+    """A (hypergraph, id) view like Vertex, but without __slots__."""
+
+    def __init__(self, hype, index):
+        self.__hype = hype
+        self.__index = index
+
+
+def measure(build):
+    """Measure the memory retained by the result of a function.
+
+    Args:
+        build (function): Builds and returns the structure to measure.
+
+    Returns:
+        int: The number of bytes allocated by build and still alive once it returns.
+    """
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(n_vertices = 1000000, n_hyperedges = 200000, hyperedge_size = 10):
+    """Print the memory taken by a random hypergraph in each layout.
+
+    Args:
+        n_vertices (int, optional): The number of vertices. Defaults to 1000000.
+        n_hyperedges (int, optional): The number of hyperedges. Defaults to 200000.
+        hyperedge_size (int, optional): The number of vertices of every hyperedge. Defaults to 10.
+    """
+    rng = np.random.default_rng(0)
+    vertex_ids = rng.integers(0, n_vertices, n_hyperedges * hyperedge_size)
+    edge_ids = np.repeat(np.arange(n_hyperedges), hyperedge_size)
+    n_memberships = len(vertex_ids)
+
+    def objects():
+        vertices = [DictVertex(None, "v{}".format(i), 1.0) for i in range(n_vertices)]
+        members = vertex_ids.tolist()
+        return vertices, [DictHyperedge(None, "e{}".format(j),
+                                        [vertices[i] for i in members[j * hyperedge_size:(j + 1) * hyperedge_size]], 1.0)
+                          for j in range(n_hyperedges)]
+
+    def incidence():
+        hype = Hypergraph.from_coo(vertex_ids, edge_ids, shape = (n_vertices, n_hyperedges))
+        hype.vertex_degrees()
+        return hype
+
+    hype = incidence()
+    rows = [("object lists (names, weights, vertex lists)", measure(objects)),
+            ("incidence storage (ids as names)", measure(incidence)),
+            ("1M vertices, former layout", measure(lambda: [DictVertex(hype, i, 1.0) for i in range(1000000)])),
+            ("1M vertex views, __dict__", measure(lambda: [DictView(hype, i) for i in range(1000000)])),
+            ("1M vertex views, __slots__", measure(lambda: [hype.vertex(i) for i in range(1000000)]))]
+
+    print("{} vertices, {} hyperedges, {} memberships".format(n_vertices, n_hyperedges, n_memberships))
+    for label, size in rows:
+        print("{:<46} {:>9.1f} MiB".format(label, size / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,166 @@
+"""Binary on-disk format for hypergraphs, designed to be opened with np.memmap.
+
+A file starts with the 8 byte magic string, the length of a JSON header as a little-endian uint64 and the header
+itself. The header records the name and shape of the hypergraph and, for every stored array, its dtype, length and
+byte offset from the start of the data section, which begins at the first multiple of ALIGNMENT after the header.
+Arrays follow, each aligned to ALIGNMENT bytes:
+
+    hyperedge_ptr, hyperedge_vertices   hyperedge-major incidence (CSC offsets and vertex ids)
+    vertex_ptr, vertex_hyperedges       vertex-major inverted index (CSR offsets and hyperedge ids)
+    vertex_weights, hyperedge_weights   float64 weights
+    removed_hyperedges                  uint8 removal flags, only present when some hyperedge has been removed
+    vertex_names_*, hyperedge_names_*   name tables: absent when every id is its own name, "_values" for integer
+                                        names, "_offsets" and "_blob" for UTF-8 packed strings
+
+Opening a file maps every array without reading it, so the operating system loads pages lazily and processes opening
+the same file share them through the page cache.
+"""
+import json
+import numpy as np
+from incidence_def import Incidence
+from name_table_def import NameTable, PackedNames
+
+MAGIC = b"HYPERPY1"
+ALIGNMENT = 64
+
+
+def write(path, name, incidence, vertex_names, hyperedge_names, vweights, eweights):
+    """Write the storage of a hypergraph to a file.
+
+    Args:
+        path (String): The file to write.
+        name (String): The name of the hypergraph.
+        incidence (Incidence): The memberships of the hypergraph.
+        vertex_names (NameTable): The names of the vertices.
+        hyperedge_names (NameTable): The names of the hyperedges.
+        vweights (np.ndarray): The weights of the vertices.
+        eweights (np.ndarray): The weights of the hyperedges.
+
+    Raises:
+        ValueError: If a name table mixes names other than strings and integers.
+    """
+    arrays = {}
+    arrays["hyperedge_ptr"], arrays["hyperedge_vertices"] = incidence.hyperedge_arrays()
+    arrays["vertex_ptr"], arrays["vertex_hyperedges"] = incidence.vertex_arrays()
+    arrays["vertex_weights"] = np.asarray(vweights, dtype = np.float64)
+    arrays["hyperedge_weights"] = np.asarray(eweights, dtype = np.float64)
+    if incidence.number_of_removed_hyperedges():
+        arrays["removed_hyperedges"] = incidence.removed_hyperedges().view(np.uint8)
+    _pack_names(arrays, "vertex_names", vertex_names)
+    _pack_names(arrays, "hyperedge_names", hyperedge_names)
+
+    entries = {}
+    offset = 0
+    for key, array in arrays.items():
+        array = np.asarray(array)
+        entries[key] = {"dtype": array.dtype.str, "length": len(array), "offset": offset}
+        offset = _align(offset + array.nbytes)
+    header = json.dumps({"name": name, "shape": list(incidence.shape()), "arrays": entries}).encode("utf-8")
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.array(len(header), dtype = "<u8").tobytes())
+        f.write(header)
+        start = _align(f.tell())
+        for key, array in arrays.items():
+            f.write(b"\0" * (start + entries[key]["offset"] - f.tell()))
+            f.write(memoryview(np.ascontiguousarray(array)).cast("B"))
+
+
+def read(path, mmap = True):
+    """Open a file written by write.
+
+    Args:
+        path (String): The file to open.
+        mmap (bool, optional): Map the arrays into memory instead of reading them. Mapped arrays are copy-on-write:
+            the hypergraph can still be modified, but changes never reach the file. Defaults to True.
+
+    Raises:
+        ValueError: If the file is not a hyperpy binary file.
+
+    Returns:
+        tuple: (name, incidence, vertex_names, hyperedge_names, vweights, eweights), ready to be attached to a
+            Hypergraph without any copy.
+    """
+    with open(path, "rb") as f:
+        if (f.read(len(MAGIC)) != MAGIC):
+            raise ValueError("{!r} is not a hyperpy binary hypergraph file".format(path))
+        length = int(np.frombuffer(f.read(8), dtype = "<u8")[0])
+        header = json.loads(f.read(length).decode("utf-8"))
+        start = _align(f.tell())
+        arrays = {}
+        for key, entry in header["arrays"].items():
+            dtype = np.dtype(entry["dtype"])
+            if (mmap) and (entry["length"] > 0):
+                arrays[key] = np.memmap(f, dtype = dtype, mode = "c", offset = start + entry["offset"],
+                                        shape = (entry["length"],))
+            else:
+                f.seek(start + entry["offset"])
+                arrays[key] = np.fromfile(f, dtype = dtype, count = entry["length"])
+
+    n_vertices, n_hyperedges = header["shape"]
+    removed = arrays["removed_hyperedges"].view(bool) if ("removed_hyperedges" in arrays) else None
+    incidence = Incidence(arrays["hyperedge_ptr"], arrays["hyperedge_vertices"], n_vertices,
+                          vertex_ptr = arrays["vertex_ptr"], vertex_hyperedges = arrays["vertex_hyperedges"],
+                          removed = removed)
+    return (header["name"], incidence, _unpack_names(arrays, "vertex_names", n_vertices),
+            _unpack_names(arrays, "hyperedge_names", n_hyperedges), arrays["vertex_weights"],
+            arrays["hyperedge_weights"])
+
+
+def _align(offset):
+    """Round an offset up to the next multiple of ALIGNMENT.
+
+    Args:
+        offset (int): The offset.
+
+    Returns:
+        int: The aligned offset.
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _pack_names(arrays, key, names):
+    """Add the arrays of a name table to the arrays to write.
+
+    Args:
+        arrays (dict): The arrays to write, by key.
+        key (String): The prefix of the name table arrays.
+        names (NameTable): The name table.
+
+    Raises:
+        ValueError: If the names are neither all strings nor all integers.
+    """
+    stored = names.stored_names()
+    if (stored is None):
+        return
+    if isinstance(stored, PackedNames):
+        arrays[key + "_offsets"], arrays[key + "_blob"] = stored.arrays()
+        return
+    if isinstance(stored, np.ndarray):
+        arrays[key + "_values"] = stored.astype(np.int64, copy = False)
+        return
+    if all(isinstance(name, str) for name in stored):
+        arrays[key + "_offsets"], arrays[key + "_blob"] = PackedNames.pack(stored).arrays()
+    elif all(isinstance(name, (int, np.integer)) and not isinstance(name, bool) for name in stored):
+        arrays[key + "_values"] = np.array(stored, dtype = np.int64)
+    else:
+        raise ValueError("Only string or integer names can be saved")
+
+
+def _unpack_names(arrays, key, size):
+    """Build a name table from the arrays read from a file.
+
+    Args:
+        arrays (dict): The arrays read, by key.
+        key (String): The prefix of the name table arrays.
+        size (int): The number of ids.
+
+    Returns:
+        NameTable: The name table, still backed by the file arrays.
+    """
+    if (key + "_values") in arrays:
+        return NameTable(arrays[key + "_values"])
+    if (key + "_offsets") in arrays:
+        return NameTable(PackedNames(arrays[key + "_offsets"], arrays[key + "_blob"]))
+    return NameTable(None, size)
@@ -0,0 +1,94 @@
+"""Connected components of a hypergraph, computed from the incidence matrix H (vertices x hyperedges).
+
+Two vertices are connected when a chain of hyperedges, each sharing a vertex with the next, joins them. This is the
+connectivity of the star expansion, whose components scipy labels in time linear in the number of memberships; the
+star expansion is passed as the incidence entries alone, which is enough for an undirected search.
+
+Two hyperedges are s-connected when a chain of hyperedges, each sharing at least s vertices with the next, joins
+them, so the s-connected components are the components of the s-line graph. Only hyperedges of at least s vertices
+take part. For s > 1 a vertex may belong to several s-connected components.
+
+Hyperedges flagged as removed belong to no component and are labelled -1, as are vertices in no component.
+"""
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+import expansion
+
+
+def connected_components(incidence, removed = None):
+    """Label the connected components of a hypergraph. An isolated vertex, or a hyperedge without vertices, forms a
+    component of its own.
+
+    Args:
+        incidence (scipy.sparse.csr_matrix): The vertex x hyperedge incidence matrix.
+        removed (np.ndarray, optional): Whether each hyperedge has been removed. Defaults to None.
+
+    Returns:
+        tuple: (n_components, vertex_labels, hyperedge_labels), the labels numbering the components from 0 in the
+            order of their smallest vertex id (then hyperedge id).
+    """
+    incidence = sparse.csr_matrix(incidence)
+    n, m = incidence.shape
+    #Upper block of the star expansion: vertex i -> node n + j for each membership, no hyperedge -> vertex rows
+    indptr = np.concatenate((incidence.indptr, np.full(m, incidence.indptr[-1], dtype = incidence.indptr.dtype)))
+    star = sparse.csr_matrix((np.ones(incidence.nnz, dtype = np.int8), incidence.indices + n, indptr),
+                             shape = (n + m, n + m))
+    _, labels = csgraph.connected_components(star, directed = False)
+    if (removed is not None) and (removed.any()):
+        labels[n:][removed] = -1
+    return _renumber(labels, n)
+
+
+def s_connected_components(incidence, s = 1, removed = None, chunk_size = None):
+    """Label the s-connected components of a hypergraph, the components of its s-line graph. The s-line graph is
+    computed by blocks (see expansion.line_graph), so the work grows with the number of overlapping pairs rather
+    than the number of memberships when s > 1.
+
+    Args:
+        incidence (scipy.sparse.csr_matrix): The vertex x hyperedge incidence matrix.
+        s (int, optional): The smallest number of vertices two hyperedges must share. Defaults to 1.
+        removed (np.ndarray, optional): Whether each hyperedge has been removed. Defaults to None.
+        chunk_size (int, optional): See expansion.line_graph. Defaults to None.
+
+    Raises:
+        ValueError: If s is smaller than 1.
+
+    Returns:
+        tuple: (n_components, vertex_labels, hyperedge_labels). Hyperedges of fewer than s vertices are labelled
+            -1. A vertex gets the smallest label among the components of its hyperedges, and -1 if it has none.
+    """
+    incidence = sparse.csr_matrix(incidence)
+    _, labels = csgraph.connected_components(expansion.line_graph(incidence, s = s, chunk_size = chunk_size),
+                                             directed = False)
+    excluded = np.bincount(incidence.indices, minlength = incidence.shape[1]) < s
+    if (removed is not None):
+        excluded |= removed
+    labels[excluded] = -1
+    n_components, _, hyperedge_labels = _renumber(labels, 0)
+
+    memberships = hyperedge_labels[incidence.indices]
+    rows = np.repeat(np.arange(incidence.shape[0]), np.diff(incidence.indptr))
+    vertex_labels = np.full(incidence.shape[0], n_components, dtype = hyperedge_labels.dtype)
+    np.minimum.at(vertex_labels, rows[memberships >= 0], memberships[memberships >= 0])
+    vertex_labels[vertex_labels == n_components] = -1
+    return n_components, vertex_labels, hyperedge_labels
+
+
+def _renumber(labels, n_vertices):
+    """Number the labelled components from 0 in the order of their first node, skipping the nodes labelled -1.
+
+    Args:
+        labels (np.ndarray): The component of each vertex then of each hyperedge, -1 for none.
+        n_vertices (int): The number of vertices leading labels.
+
+    Returns:
+        tuple: (n_components, vertex_labels, hyperedge_labels).
+    """
+    labelled = labels >= 0
+    _, first, inverse = np.unique(labels[labelled], return_index = True, return_inverse = True)
+    order = np.empty(len(first), dtype = np.int64)
+    order[np.argsort(first)] = np.arange(len(first))
+    renumbered = np.full(len(labels), -1, dtype = np.int64)
+    renumbered[labelled] = order[inverse]
+    return len(first), renumbered[:n_vertices], renumbered[n_vertices:]
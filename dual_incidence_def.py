@@ -0,0 +1,175 @@
+import numpy as np
+from incidence_def import gather_rows, neighbor_matrix
+
+class DualIncidence:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, incidence):
+        """Constructor for DualIncidence class. The dual incidence is a read-only view of an Incidence with the roles
+        of vertices and hyperedges exchanged: vertex i of the dual is hyperedge i of the incidence and hyperedge j of
+        the dual is vertex j. Nothing is copied; every access is forwarded to the other side of the incidence, so the
+        CSR view of the dual is the transposed CSC view of the incidence and the other way around.
+
+        Args:
+            incidence (Incidence): The incidence to view.
+        """
+        self.__incidence = incidence
+
+    #=========================METHODS===============================
+    def hyperedge_vertices(self, index):
+        """Access the vertex ids of a hyperedge of the dual.
+
+        Args:
+            index (int): The id of the hyperedge.
+
+        Returns:
+            np.ndarray: The sorted ids of the vertices contained in the hyperedge. This may be a view onto the
+                storage and must not be modified.
+        """
+        return self.__incidence.vertex_hyperedges(index)
+
+    def vertex_hyperedges(self, index):
+        """Access the hyperedge ids of a vertex of the dual.
+
+        Args:
+            index (int): The id of the vertex.
+
+        Returns:
+            np.ndarray: The sorted ids of the hyperedges containing the vertex.
+        """
+        return np.sort(self.__incidence.hyperedge_vertices(index))
+
+    def vertex_degrees(self):
+        """Access the degree of every vertex of the dual.
+
+        Returns:
+            np.ndarray: The number of hyperedges containing each vertex, by vertex id.
+        """
+        return self.__incidence.hyperedge_sizes()
+
+    def hyperedge_sizes(self):
+        """Access the size of every hyperedge of the dual.
+
+        Returns:
+            np.ndarray: The number of vertices contained in each hyperedge, by hyperedge id.
+        """
+        return self.__incidence.vertex_degrees()
+
+    def vertex_neighbors(self, index):
+        """Find the neighbours of a vertex of the dual: the hyperedges of the incidence sharing a vertex with
+        hyperedge index.
+
+        Args:
+            index (int): The id of the vertex.
+
+        Returns:
+            np.ndarray: The sorted ids of the neighbours of the vertex.
+        """
+        vertex_ptr, vertex_hyperedges = self.__incidence.vertex_arrays()
+        _, positions = gather_rows(vertex_ptr, self.__incidence.hyperedge_vertices(index))
+        neighbors = np.unique(vertex_hyperedges[positions])
+        return neighbors[neighbors != index]
+
+    def neighbor_matrix(self, vertices):
+        """Find the neighbours of many vertices of the dual at once with the sparse product H[vertices] H^T.
+
+        Args:
+            vertices (array_like): The ids of the vertices.
+
+        Returns:
+            scipy.sparse.csr_matrix: A len(vertices) x number of vertices matrix whose row k holds the sorted
+                neighbours of vertices[k], each with the number of hyperedges it shares with vertices[k].
+        """
+        return neighbor_matrix(self.csr(), self.csc(), vertices)
+
+    def csc(self):
+        """Access the hyperedge-major (CSC) view of the incidence matrix of the dual, the transposed CSR view of the
+        incidence. It shares its arrays with the storage and must not be modified.
+
+        Returns:
+            scipy.sparse.csc_matrix: The incidence matrix of the dual.
+        """
+        return self.__incidence.csr().T
+
+    def csr(self):
+        """Access the vertex-major (CSR) view of the incidence matrix of the dual, the transposed CSC view of the
+        incidence. It shares its arrays with the storage and must not be modified; its rows may be unsorted.
+
+        Returns:
+            scipy.sparse.csr_matrix: The incidence matrix of the dual.
+        """
+        return self.__incidence.csc().T
+
+    def hyperedge_arrays(self):
+        """Access the raw hyperedge-major arrays of the dual, the vertex-major arrays of the incidence.
+
+        Returns:
+            tuple: (hyperedge_ptr, hyperedge_vertices), views that must not be modified.
+        """
+        return self.__incidence.vertex_arrays()
+
+    def vertex_arrays(self):
+        """Access the raw vertex-major arrays of the dual, the hyperedge-major arrays of the incidence.
+
+        Returns:
+            tuple: (vertex_ptr, vertex_hyperedges), views that must not be modified.
+        """
+        return self.__incidence.hyperedge_arrays()
+
+    #=========================GETTERS AND SETTERS=========================
+    def dual(self):
+        """Access the incidence this view exchanges the roles of.
+
+        Returns:
+            Incidence: The viewed incidence.
+        """
+        return self.__incidence
+
+    def number_of_vertices(self):
+        """Access the number of vertices of the dual.
+
+        Returns:
+            int: The number of hyperedges of the incidence.
+        """
+        return self.__incidence.number_of_hyperedges()
+
+    def number_of_hyperedges(self):
+        """Access the number of hyperedges of the dual.
+
+        Returns:
+            int: The number of vertices of the incidence.
+        """
+        return self.__incidence.number_of_vertices()
+
+    def number_of_removed_hyperedges(self):
+        """Access the number of removed hyperedges of the dual. Removed hyperedges of the incidence are isolated
+        vertices of the dual, and the dual has no removed hyperedges.
+
+        Returns:
+            int: 0.
+        """
+        return 0
+
+    def removed_hyperedges(self):
+        """Access the removal flag of every hyperedge of the dual.
+
+        Returns:
+            np.ndarray: A read-only array of False values, by hyperedge id, broadcast from a single value.
+        """
+        return np.broadcast_to(False, self.number_of_hyperedges())
+
+    def number_of_memberships(self):
+        """Access the number of (vertex, hyperedge) memberships.
+
+        Returns:
+            int: The number of stored entries of the incidence.
+        """
+        return self.__incidence.number_of_memberships()
+
+    def shape(self):
+        """Access the shape of the incidence matrix of the dual.
+
+        Returns:
+            tuple: (number of vertices, number of hyperedges).
+        """
+        return (self.number_of_vertices(), self.number_of_hyperedges())
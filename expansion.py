@@ -0,0 +1,196 @@
+"""Graph projections of a hypergraph, built as sparse adjacency matrices from the incidence matrix H (vertices x
+hyperedges) and the hyperedge weights.
+
+The clique expansion (2-section) joins every two vertices sharing a hyperedge. Its adjacency is H C H^T without the
+diagonal, where C holds one coefficient per hyperedge chosen by the weighting, and is computed as a sparse product
+whose memory is bounded by its output. A hyperedge of k vertices still adds k^2 entries, so the product can also be
+computed by blocks of rows whose estimated size stays under a budget, and streamed to the caller block by block.
+
+The star expansion is the bipartite graph between the vertices and the hyperedges, with the vertices first, and the
+s-line graph joins the hyperedges sharing at least s vertices, from the thresholded overlaps H^T H.
+"""
+import numpy as np
+from scipy import sparse
+
+WEIGHTINGS = ("weight", "count", "normalized", "binary")
+
+
+def clique_expansion(incidence, eweights, weighting = "weight", chunk_size = None):
+    """Build the adjacency matrix of the clique expansion.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix, preferably CSR.
+        eweights (np.ndarray): The weight of each hyperedge.
+        weighting (String, optional): How two vertices are weighted: "weight" sums the weights of the hyperedges
+            they share, "count" counts them, "normalized" sums w(e) / (|e| - 1) so that every vertex of a hyperedge
+            receives w(e) from it in total, and "binary" puts a 1 wherever they share any. Defaults to "weight".
+        chunk_size (int, optional): Compute the product by blocks of rows of at most this many estimated entries,
+            which bounds the memory of each product. Defaults to None for a single block.
+
+    Raises:
+        ValueError: If the weighting is unknown.
+
+    Returns:
+        scipy.sparse.csr_matrix: The symmetric n_vertices x n_vertices adjacency matrix, with sorted indices.
+    """
+    blocks = [block for _, block in clique_expansion_blocks(incidence, eweights, weighting, chunk_size)]
+    if (not blocks):
+        return sparse.csr_matrix((incidence.shape[0], incidence.shape[0]))
+    if (len(blocks) == 1):
+        return blocks[0]
+    return sparse.vstack(blocks, format = "csr")
+
+
+def clique_expansion_blocks(incidence, eweights, weighting = "weight", chunk_size = None):
+    """Compute the adjacency matrix of the clique expansion by blocks of consecutive rows, for callers that write
+    each block out (out of core) instead of holding the whole matrix. The size of each row is bounded beforehand by
+    the total size of the hyperedges of its vertex, and rows are grouped while their bounds fit in chunk_size.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix, preferably CSR.
+        eweights (np.ndarray): The weight of each hyperedge.
+        weighting (String, optional): See clique_expansion. Defaults to "weight".
+        chunk_size (int, optional): The largest estimated number of entries of a block. A single row above it forms a
+            block of its own. Defaults to None for a single block.
+
+    Raises:
+        ValueError: If the weighting is unknown.
+
+    Yields:
+        tuple: (first_row, block) where block is the csr_matrix of rows [first_row, first_row + block.shape[0]) of
+            the adjacency, with sorted indices.
+    """
+    if (weighting not in WEIGHTINGS):
+        raise ValueError("Unknown weighting {!r}, expected one of {}".format(weighting, ", ".join(WEIGHTINGS)))
+    incidence = sparse.csr_matrix(incidence)
+    transposed = sparse.csc_matrix(incidence).T
+    sizes = np.asarray(incidence.sum(axis = 0)).ravel()
+    scaled = sparse.csr_matrix((incidence.data * _coefficients(eweights, sizes, weighting)[incidence.indices],
+                                incidence.indices, incidence.indptr), shape = incidence.shape)
+
+    for start, block in _product_blocks(scaled, transposed, chunk_size):
+        block = _select(block, start)
+        if (weighting == "binary"):
+            block.data[:] = 1
+        yield start, block
+
+
+def star_expansion(incidence, eweights = None):
+    """Build the adjacency matrix of the star expansion, the bipartite graph joining each hyperedge to its vertices.
+    Vertex i is node i and hyperedge j is node n_vertices + j.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix.
+        eweights (np.ndarray, optional): Weight every edge of the graph with the weight of its hyperedge. Defaults to
+            None for unit weights.
+
+    Returns:
+        scipy.sparse.csr_matrix: The symmetric (n_vertices + n_hyperedges) square adjacency matrix.
+    """
+    incidence = sparse.csr_matrix(incidence, dtype = np.float64)
+    if (eweights is not None):
+        incidence = incidence @ sparse.diags(np.asarray(eweights, dtype = np.float64))
+    return sparse.bmat([[None, incidence], [incidence.T, None]], format = "csr")
+
+
+def _coefficients(eweights, sizes, weighting):
+    """Compute the coefficient of each hyperedge in the product H C H^T.
+
+    Args:
+        eweights (np.ndarray): The weight of each hyperedge.
+        sizes (np.ndarray): The size of each hyperedge.
+        weighting (String): The weighting, see clique_expansion.
+
+    Returns:
+        np.ndarray: The coefficient of each hyperedge.
+    """
+    eweights = np.asarray(eweights, dtype = np.float64)
+    if (weighting == "weight"):
+        return eweights
+    if (weighting == "normalized"):
+        pairs = np.maximum(sizes - 1, 1)
+        return eweights / pairs
+    return np.ones(len(sizes))
+
+
+def line_graph(incidence, s = 1, chunk_size = None):
+    """Build the s-line graph, joining two hyperedges when they share at least s vertices. The overlaps are the
+    entries of H^T H, computed by blocks of rows and thresholded block by block, so memory is bounded by chunk_size
+    and by the output rather than by the number of overlapping pairs.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix.
+        s (int, optional): The smallest overlap joining two hyperedges. Defaults to 1.
+        chunk_size (int, optional): The largest estimated number of entries of H^T H computed at once. Defaults to
+            None for a single product.
+
+    Raises:
+        ValueError: If s is smaller than 1.
+
+    Returns:
+        scipy.sparse.csr_matrix: The symmetric n_hyperedges x n_hyperedges adjacency matrix, whose entries are the
+            overlaps, with sorted indices.
+    """
+    if (s < 1):
+        raise ValueError("s must be at least 1, got {}".format(s))
+    transposed = sparse.csc_matrix(incidence).T
+    blocks = [_select(block, start, s) for start, block in
+              _product_blocks(transposed, sparse.csr_matrix(incidence), chunk_size)]
+    if (not blocks):
+        return sparse.csr_matrix((incidence.shape[1], incidence.shape[1]))
+    return blocks[0] if (len(blocks) == 1) else sparse.vstack(blocks, format = "csr")
+
+
+def _product_blocks(left, right, chunk_size):
+    """Compute the sparse product left @ right by blocks of consecutive rows. The size of each row of the product is
+    bounded beforehand by the total size of the rows of right it combines, and rows are grouped while their bounds
+    fit in chunk_size.
+
+    Args:
+        left (scipy.sparse.csr_matrix): The left factor.
+        right (scipy.sparse.csr_matrix): The right factor.
+        chunk_size (int): The largest estimated number of entries of a block, or None for a single block. A single
+            row above it forms a block of its own.
+
+    Yields:
+        tuple: (first_row, block) where block is the csr_matrix of rows [first_row, first_row + block.shape[0]) of
+            the product.
+    """
+    n = left.shape[0]
+    if (chunk_size is None):
+        blocks = [(0, n)] if n else []
+    else:
+        rows = np.repeat(np.arange(n), np.diff(left.indptr))
+        estimates = np.bincount(rows, weights = np.diff(right.indptr)[left.indices], minlength = n)
+        bounds = np.concatenate(([0], np.cumsum(estimates)))
+        blocks = []
+        start = 0
+        while (start < n):
+            stop = int(np.searchsorted(bounds, bounds[start] + chunk_size, side = "right")) - 1
+            stop = min(max(stop, start + 1), n)
+            blocks.append((start, stop))
+            start = stop
+    for start, stop in blocks:
+        yield start, (left[start:stop] @ right).tocsr()
+
+
+def _select(block, first_row, minimum = None):
+    """Remove the diagonal entries, and optionally the small entries, from a block of rows of a square matrix.
+
+    Args:
+        block (scipy.sparse.csr_matrix): Rows [first_row, first_row + block.shape[0]) of the matrix.
+        first_row (int): The row of the matrix the block starts at.
+        minimum (float, optional): Also remove the entries below this value. Defaults to None.
+
+    Returns:
+        scipy.sparse.csr_matrix: The remaining entries, with sorted indices.
+    """
+    rows = np.repeat(np.arange(block.shape[0]), np.diff(block.indptr))
+    keep = block.indices != rows + first_row
+    if (minimum is not None):
+        keep &= block.data >= minimum
+    indptr = np.zeros(block.shape[0] + 1, dtype = block.indptr.dtype)
+    np.cumsum(np.bincount(rows[keep], minlength = block.shape[0]), out = indptr[1:])
+    block = sparse.csr_matrix((block.data[keep], block.indices[keep], indptr), shape = block.shape)
+    block.sort_indices()
+    return block
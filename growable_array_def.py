@@ -0,0 +1,69 @@
+import numpy as np
+
+class GrowableArray:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, dtype, values = None):
+        """Constructor for GrowableArray class. A one-dimensional NumPy array with spare capacity at its end, doubled
+        whenever it runs out, so appending n values costs amortized O(n).
+
+        Args:
+            dtype (np.dtype): The type of the values.
+            values (np.ndarray, optional): Initial values. Defaults to None for an empty array.
+        """
+        values = np.zeros(0, dtype = dtype) if (values is None) else np.asarray(values, dtype = dtype)
+        self.__data = values
+        self.__size = len(values)
+
+    def __len__(self):
+        return self.__size
+
+    #=========================METHODS===============================
+    def append(self, values):
+        """Append values at the end of the array.
+
+        Args:
+            values (array_like): The values to append, or a single value.
+        """
+        values = np.asarray(values, dtype = self.__data.dtype).ravel()
+        self.reserve(self.__size + len(values))
+        self.__data[self.__size:self.__size + len(values)] = values
+        self.__size += len(values)
+
+    def reserve(self, capacity):
+        """Make sure the array can hold a number of values without growing again.
+
+        Args:
+            capacity (int): The number of values the array must be able to hold.
+        """
+        if (capacity > len(self.__data)):
+            data = np.empty(max(capacity, 2 * len(self.__data), 16), dtype = self.__data.dtype)
+            data[:self.__size] = self.__data[:self.__size]
+            self.__data = data
+
+    def trim(self):
+        """Release the spare capacity.
+
+        Returns:
+            np.ndarray: The values, now held in an array of exactly their size.
+        """
+        if (len(self.__data) != self.__size):
+            self.__data = self.__data[:self.__size].copy()
+        return self.__data
+
+    #=========================GETTERS AND SETTERS=========================
+    def view(self):
+        """Access the values without copying them. The view is invalidated by the next append that grows the array.
+
+        Returns:
+            np.ndarray: A view of the values.
+        """
+        return self.__data[:self.__size]
+
+    def dtype(self):
+        """Access the type of the values.
+
+        Returns:
+            np.dtype: The type of the values.
+        """
+        return self.__data.dtype
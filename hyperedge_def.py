@@ -1,21 +1,28 @@
-from hypergraph_def import Hypergraph
-from vertex_def import Vertex
 class Hyperedge:
 
+    #Views are created by the million, so they carry no per-instance __dict__
+    __slots__ = ("__hype", "__index")
+
     #=========================CONSTRUCTOR=========================
-    def __init__(self, hype, name, vertices, weight):
-        """Constructor for Hyperedge class.
+    def __init__(self, hype, index):
+        """Constructor for Hyperedge class. A hyperedge is a lightweight view onto the storage of its parent
+        hypergraph and is created on demand by it, so two Hyperedge objects with the same parent and id are equal.
 
         Args:
-            name (String): The name of the hyperedge
-            vertices (list): A list of the vertices contained in the hyperedge
-            weight (Float): The weight associated with the hyepredge.
+            hype (Hypergraph): The hypergraph the hyperedge belongs to.
+            index (int): The integer id of the hyperedge within the hypergraph.
         """
         self.__set_hype(hype)
-        self.set_name(name)
-        self.set_vertices(vertices)
-        self.set_weight(weight)
-    
+        self.__index = int(index)
+
+    def __eq__(self, other):
+        if (not isinstance(other, Hyperedge)):
+            return NotImplemented
+        return (self.__hype is other.parent_hypergraph()) and (self.__index == other.index())
+
+    def __hash__(self):
+        return hash((id(self.__hype), self.__index))
+
     #=========================GETTERS AND SETTERS=========================
     def parent_hypergraph(self):
         """Return the hypergraph that the hyperedge belongs to.
@@ -25,13 +32,21 @@ class Hyperedge:
         """
         return self.__hype
 
+    def index(self):
+        """Access the integer id of the hyperedge.
+
+        Returns:
+            int: The position of the hyperedge in the hyperedge set of its hypergraph.
+        """
+        return self.__index
+
     def name(self):
         """Access the name of the hyperedge.
 
         Returns:
             String: The name of the hyperedge.
         """
-        return self.__name
+        return self.__hype._hyperedge_name(self.__index)
 
     def vertices(self):
         """Access the vertices contained in the hyperedge.
@@ -39,16 +54,24 @@ class Hyperedge:
         Returns:
             list: A list of the vertices contained in the hyperedge.
         """
-        return self.__vertices
-    
+        return self.__hype._hyperedge_vertices(self.__index)
+
     def weight(self):
         """Access the weight of the hyperedge.
 
         Returns:
             Float: The weight asspciated with the hyperedge.
         """
-        return self.__weight
-    
+        return self.__hype._hyperedge_weight(self.__index)
+
+    def size(self):
+        """Access the size of the hyperedge.
+
+        Returns:
+            int: The number of vertices contained in the hyperedge.
+        """
+        return self.__hype._hyperedge_size(self.__index)
+
     def __set_hype(self, hype):
         """Set the parent hypergraph of the hyperedge
 
@@ -56,27 +79,28 @@ class Hyperedge:
             hype (Hypergraph): The hypergraph the hyperedge is a member
         """
         self.__hype = hype
-    
+
     def set_name(self, name):
         """Set the name of the hyperedge.
 
         Args:
             name (String): The new name of the hyperedge.
         """
-        self.__name = name
-    
+        self.__hype._set_hyperedge_name(self.__index, name)
+
     def set_vertices(self, vertices):
         """Set the vertices contained in a hyperedge.
 
         Args:
-            vertices (list): A list of the vertices contained in the hyperedge.
+            vertices (list): A list of the vertices contained in the hyperedge. They must belong to the same
+                hypergraph as the hyperedge.
         """
-        self.__vertices = vertices
-    
+        self.__hype._set_hyperedge_vertices(self.__index, vertices)
+
     def set_weight(self, weight):
         """Set the weight of the hyperedge.
 
         Args:
             weight (Float): The weight to set the hyperedge weight to.
         """
-        self.__weight = weight
\ No newline at end of file
+        self.__hype._set_hyperedge_weight(self.__index, weight)
@@ -1,16 +1,32 @@
 import numpy as np
-from itertools import chain
+from scipy import sparse
+import binary_io
+import connectivity
+import expansion
+import partitioner_io
+import ranking
+import reduction
+import spectral
+import text_io
+import traversal
+import walks
+from dual_incidence_def import DualIncidence
+from growable_array_def import GrowableArray
 from hyperedge_def import Hyperedge
+from incidence_def import Incidence, distinct_members, gather_rows, group_by
+from name_table_def import NameTable
+from restricted_incidence_def import RestrictedIncidence
 from vertex_def import Vertex
-    
+
 class Hypergraph:
 
     def __init__(self, elist, vnames, enames, vweights = None, eweights = None, name = "Hypergraph"):
-        """Hypergraph Constructor
+        """Hypergraph Constructor. The hypergraph is stored as a sparse incidence structure with integer ids
+        (see Incidence); Vertex and Hyperedge objects are lightweight views created on demand.
 
         Args:
             elist (list): Each hyperedge should have a list with the name of each of the vertices it contains. elist is a
-                liist of those lists.
+                liist of those lists. A vertex repeated in a hyperedge is kept once.
             vnames (list): A list of the names of the vertices.
             enames (list): A list of the names of the hyperedges.
             vweights (list, optional): A list of the weights of the vertices. Defaults to None that will assign a weight of 1
@@ -19,30 +35,294 @@ class Hypergraph:
                 to each hyperedge.
             name (String, optional): The name of the hypergraph. Defaults to Hypergraph.
         """
+        #Translating the vertex names of each hyperedge to vertex ids
+        vertex_names = NameTable(vnames)
+        hyperedge_ptr = np.zeros(len(elist) + 1, dtype = np.int64)
+        np.cumsum([len(vertices) for vertices in elist], out = hyperedge_ptr[1:])
+        hyperedge_vertices = [self.__vertex_id(vertex_names, vname) for vertices in elist for vname in vertices]
+        hyperedge_ptr, hyperedge_vertices = distinct_members(hyperedge_ptr, hyperedge_vertices, len(vnames))
+        incidence = Incidence(hyperedge_ptr, hyperedge_vertices, len(vnames))
+
+        self.__setup(incidence, vertex_names, NameTable(enames), vweights, eweights, name)
+
+    @classmethod
+    def from_coo(cls, vertex_ids, edge_ids, vweights = None, eweights = None, vnames = None, enames = None,
+                 shape = None, name = "Hypergraph"):
+        """Build a hypergraph from its memberships given as two integer arrays, without any per-membership Python
+        work. The memberships are grouped by hyperedge with a stable counting sort, so each hyperedge keeps its
+        vertices in the order they were given. Repeated memberships are kept once.
+
+        Args:
+            vertex_ids (np.ndarray): The vertex id of each membership.
+            edge_ids (np.ndarray): The hyperedge id of each membership.
+            vweights (np.ndarray, optional): The weight of each vertex. Defaults to None that will assign a weight of 1
+                to each vertex.
+            eweights (np.ndarray, optional): The weight of each hyperedge. Defaults to None that will assign a weight of
+                1 to each hyperedge.
+            vnames (list, optional): The name of each vertex. Defaults to None, in which case vertices are named by
+                their ids.
+            enames (list, optional): The name of each hyperedge. Defaults to None, in which case hyperedges are named
+                by their ids.
+            shape (tuple, optional): (number of vertices, number of hyperedges). Defaults to None, in which case they
+                are taken from the weights or names if given, and from the largest ids otherwise.
+            name (String, optional): The name of the hypergraph. Defaults to Hypergraph.
+
+        Raises:
+            ValueError: If the arrays differ in length or hold ids out of range.
+
+        Returns:
+            Hypergraph: The new hypergraph.
+        """
+        vertex_ids = np.asarray(vertex_ids).ravel()
+        edge_ids = np.asarray(edge_ids).ravel()
+        if (len(vertex_ids) != len(edge_ids)):
+            raise ValueError("vertex_ids and edge_ids must have the same length")
+        if (shape is None):
+            shape = (cls.__count(vertex_ids, vweights, vnames), cls.__count(edge_ids, eweights, enames))
+        n_vertices, n_hyperedges = shape
+        cls.__check_ids(vertex_ids, n_vertices, "vertex")
+        cls.__check_ids(edge_ids, n_hyperedges, "hyperedge")
+
+        hyperedge_ptr, hyperedge_vertices = group_by(edge_ids, vertex_ids, n_hyperedges)
+        hyperedge_ptr, hyperedge_vertices = distinct_members(hyperedge_ptr, hyperedge_vertices, n_vertices)
+        incidence = Incidence(hyperedge_ptr, hyperedge_vertices, n_vertices)
+
+        hype = cls.__new__(cls)
+        hype.__setup(incidence, NameTable(vnames, n_vertices), NameTable(enames, n_hyperedges), vweights, eweights,
+                     name)
+        return hype
+
+    @classmethod
+    def from_sparse(cls, matrix, vweights = None, eweights = None, vnames = None, enames = None, name = "Hypergraph"):
+        """Build a hypergraph from a vertex x hyperedge incidence matrix. Every stored non-zero entry is a membership.
+        A CSC matrix with canonical indices is used without any copy beyond a possible index type conversion until the
+        hypergraph is first changed in place.
+
+        Args:
+            matrix (scipy.sparse.spmatrix): The incidence matrix, in any sparse format.
+            vweights (np.ndarray, optional): The weight of each vertex. Defaults to None that will assign a weight of 1
+                to each vertex.
+            eweights (np.ndarray, optional): The weight of each hyperedge. Defaults to None that will assign a weight of
+                1 to each hyperedge.
+            vnames (list, optional): The name of each vertex. Defaults to None, in which case vertices are named by
+                their ids.
+            enames (list, optional): The name of each hyperedge. Defaults to None, in which case hyperedges are named
+                by their ids.
+            name (String, optional): The name of the hypergraph. Defaults to Hypergraph.
+
+        Returns:
+            Hypergraph: The new hypergraph.
+        """
+        matrix = sparse.csc_matrix(matrix)
+        if (not matrix.has_canonical_format) or (matrix.nnz and (matrix.data == 0).any()):
+            matrix = matrix.copy()
+            matrix.sum_duplicates()
+            matrix.eliminate_zeros()
+        n_vertices, n_hyperedges = matrix.shape
+        incidence = Incidence(matrix.indptr, matrix.indices, n_vertices)
+
+        hype = cls.__new__(cls)
+        hype.__setup(incidence, NameTable(vnames, n_vertices), NameTable(enames, n_hyperedges), vweights, eweights,
+                     name)
+        return hype
+
+    @classmethod
+    def read_text(cls, source, delimiter = None, comment = "#", named = False, chunk_size = 65536,
+                  name = "Hypergraph"):
+        """Build a hypergraph by streaming a text file with one hyperedge per line (see text_io). Gzip compressed
+        files are decompressed on the fly. Vertices are named after the names read, in order of first appearance.
+
+        Args:
+            source (String or file): The path of the file, or an open text file.
+            delimiter (String, optional): The separator between names. Defaults to None for any whitespace.
+            comment (String, optional): Lines starting with this prefix are skipped. Defaults to "#".
+            named (bool, optional): Whether the first field of each line is the name of the hyperedge. Defaults to
+                False, in which case hyperedges are named by their ids.
+            chunk_size (int, optional): The number of lines processed at a time. Defaults to 65536.
+            name (String, optional): The name of the hypergraph. Defaults to Hypergraph.
+
+        Returns:
+            Hypergraph: The hypergraph read.
+        """
+        hyperedge_ptr, hyperedge_vertices, vnames, enames = text_io.read_hyperedges(
+            source, delimiter = delimiter, comment = comment, named = named, chunk_size = chunk_size)
+        hyperedge_ptr, hyperedge_vertices = distinct_members(hyperedge_ptr, hyperedge_vertices, len(vnames))
+        incidence = Incidence(hyperedge_ptr, hyperedge_vertices, len(vnames))
+        hype = cls.__new__(cls)
+        hype.__setup(incidence, NameTable(vnames), NameTable(enames, len(hyperedge_ptr) - 1), None, None, name)
+        return hype
+
+    @classmethod
+    def read_hmetis(cls, path, name = "Hypergraph"):
+        """Read a hypergraph from an hMETIS .hgr file, with its vertex and hyperedge weights if the file has them.
+        Vertices and hyperedges are named by their 0-based ids.
+
+        Args:
+            path (String): The file to read, possibly gzip compressed.
+            name (String, optional): The name of the hypergraph. Defaults to Hypergraph.
+
+        Returns:
+            Hypergraph: The hypergraph read.
+        """
+        return cls.__from_partitioner_format(partitioner_io.read_hmetis(path), name)
+
+    @classmethod
+    def read_patoh(cls, path, name = "Hypergraph"):
+        """Read a hypergraph from a PaToH file, with its vertex weights and hyperedge costs if the file has them.
+        Vertices and hyperedges are named by their 0-based ids.
+
+        Args:
+            path (String): The file to read, possibly gzip compressed.
+            name (String, optional): The name of the hypergraph. Defaults to Hypergraph.
+
+        Returns:
+            Hypergraph: The hypergraph read.
+        """
+        return cls.__from_partitioner_format(partitioner_io.read_patoh(path), name)
+
+    @classmethod
+    def __from_partitioner_format(cls, parsed, name):
+        """Build a hypergraph from the result of a partitioner_io reader.
+
+        Args:
+            parsed (tuple): (hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights).
+            name (String): The name of the hypergraph.
+
+        Returns:
+            Hypergraph: The new hypergraph.
+        """
+        hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights = parsed
+        hyperedge_ptr, hyperedge_vertices = distinct_members(hyperedge_ptr, hyperedge_vertices, n_vertices)
+        incidence = Incidence(hyperedge_ptr, hyperedge_vertices, n_vertices)
+        hype = cls.__new__(cls)
+        hype.__setup(incidence, NameTable(None, n_vertices), NameTable(None, len(hyperedge_ptr) - 1), vweights,
+                     eweights, name)
+        return hype
+
+    def write_hmetis(self, path, vertex_weights = None, hyperedge_weights = None):
+        """Write a hypergraph to an hMETIS .hgr file. Names and removed hyperedges are not written.
+
+        Args:
+            path (String): The file to write.
+            vertex_weights (bool, optional): Whether to write the vertex weights. Defaults to None that writes them
+                unless they are all 1.
+            hyperedge_weights (bool, optional): Whether to write the hyperedge weights. Defaults to None that writes
+                them unless they are all 1.
+
+        Raises:
+            ValueError: If a hyperedge is empty or a written weight is not an integer.
+        """
+        partitioner_io.write_hmetis(path, *self.__partitioner_arrays(vertex_weights, hyperedge_weights))
+
+    def write_patoh(self, path, vertex_weights = None, hyperedge_weights = None, base = 0):
+        """Write a hypergraph to a PaToH file. Names and removed hyperedges are not written.
+
+        Args:
+            path (String): The file to write.
+            vertex_weights (bool, optional): Whether to write the vertex weights. Defaults to None that writes them
+                unless they are all 1.
+            hyperedge_weights (bool, optional): Whether to write the hyperedge weights as net costs. Defaults to None
+                that writes them unless they are all 1.
+            base (int, optional): The index base of the file, 0 or 1. Defaults to 0.
+
+        Raises:
+            ValueError: If a hyperedge is empty or a written weight is not an integer.
+        """
+        partitioner_io.write_patoh(path, *self.__partitioner_arrays(vertex_weights, hyperedge_weights), base = base)
+
+    def __partitioner_arrays(self, vertex_weights, hyperedge_weights):
+        """Gather the arrays written by the partitioner_io writers.
+
+        Args:
+            vertex_weights (bool): Whether to include the vertex weights, or None to include them unless all 1.
+            hyperedge_weights (bool): Whether to include the hyperedge weights, or None to include them unless all 1.
+
+        Returns:
+            tuple: (hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights), without the removed
+                hyperedges.
+        """
+        eweights = self.__hyperedge_weights.view()
+        if (vertex_weights is None):
+            vertex_weights = bool(np.any(self.__vertex_weights.view() != 1))
+        hyperedge_ptr, hyperedge_vertices = self.__incidence.hyperedge_arrays()
+        if self.__incidence.number_of_removed_hyperedges():
+            kept = np.flatnonzero(~self.__incidence.removed_hyperedges())
+            hyperedge_ptr, positions = gather_rows(hyperedge_ptr, kept)
+            hyperedge_vertices, eweights = hyperedge_vertices[positions], eweights[kept]
+        if (hyperedge_weights is None):
+            hyperedge_weights = bool(np.any(eweights != 1))
+        return (hyperedge_ptr, hyperedge_vertices, self.number_of_vertices(),
+                self.__vertex_weights.view() if vertex_weights else None, eweights if hyperedge_weights else None)
+
+    @classmethod
+    def load(cls, path, mmap = True):
+        """Open a hypergraph saved with save. With mmap the arrays are memory-mapped rather than read: opening takes
+        constant time, pages are loaded lazily as they are touched, and processes opening the same file share one
+        copy of it through the page cache. Changes made to a mapped hypergraph stay private to the process.
+
+        Args:
+            path (String): The file to open.
+            mmap (bool, optional): Memory-map the file instead of reading it. Defaults to True.
+
+        Returns:
+            Hypergraph: The hypergraph stored in the file.
+        """
+        name, incidence, vertex_names, hyperedge_names, vweights, eweights = binary_io.read(path, mmap = mmap)
+        hype = cls.__new__(cls)
+        hype.__setup(incidence, vertex_names, hyperedge_names, vweights, eweights, name, copy = False)
+        return hype
+
+    def save(self, path):
+        """Save a hypergraph in the binary format of binary_io, to be opened again with load. Names must all be
+        strings or all be integers.
+
+        Args:
+            path (String): The file to write.
+        """
+        if (self.__parent is not None):
+            self.materialize().save(path)
+            return
+        binary_io.write(path, self.name(), self.__incidence, self.__vertex_names, self.__hyperedge_names,
+                        self.__vertex_weights.view(), self.__hyperedge_weights.view())
+
+    def __setup(self, incidence, vertex_names, hyperedge_names, vweights, eweights, name, copy = True):
+        """Attach the storage of a hypergraph. Shared by every constructor.
+
+        Args:
+            incidence (Incidence): The memberships of the hypergraph.
+            vertex_names (NameTable): The names of the vertices.
+            hyperedge_names (NameTable): The names of the hyperedges.
+            vweights (array_like): The weights of the vertices, or None to assign a weight of 1 to each vertex.
+            eweights (array_like): The weights of the hyperedges, or None to assign a weight of 1 to each hyperedge.
+            name (String): The name of the hypergraph.
+            copy (bool, optional): Copy the weights rather than using the given arrays. Defaults to True.
+
+        Raises:
+            ValueError: If the names or weights do not match the number of vertices or hyperedges.
+        """
         self.set_name(name)
-        
+        #The hypergraph whose storage a view shares, None for a hypergraph owning its storage
+        self.__parent = None
+
         #Adding vertex and hyepredge weights if they are not given
         if (vweights is None):
-            vweights = np.ones(len(vnames))
+            vweights = np.ones(incidence.number_of_vertices())
         if (eweights is None):
-            eweights = np.ones(len(enames))
-        
-        #Creating vertex set
-        vertex_set = []
-        for i in range(len(vnames)):
-            vertex_set.append(Vertex(hype = self, name = vnames[i], weight = vweights[i]))
-        self.__vertex_set = vertex_set
-
-        #Creating hyperedge set
-        hyperedge_set = []
-        for i in range(len(elist)):
-            vertices = []
-            for vname in elist[i]:
-                vertex = self.get_vertex_by_name(vname)
-                vertices.append(vertex)
-            hyperedge_set.append(Hyperedge(hype = self, name = enames[i], vertices = vertices, weight = eweights[i]))
-        self.__hyperedge_set = hyperedge_set
+            eweights = np.ones(incidence.number_of_hyperedges())
 
+        self.__incidence = incidence
+        self.__vertex_names = vertex_names
+        self.__hyperedge_names = hyperedge_names
+        #Weights live in growable arrays so that vertices and hyperedges can be added at amortized cost
+        as_array = np.array if copy else np.asarray
+        self.__vertex_weights = GrowableArray(np.float64, as_array(vweights, dtype = np.float64))
+        self.__hyperedge_weights = GrowableArray(np.float64, as_array(eweights, dtype = np.float64))
+        for what, n, names, weights in (("vertex", incidence.number_of_vertices(), vertex_names, self.__vertex_weights),
+                                        ("hyperedge", incidence.number_of_hyperedges(), hyperedge_names,
+                                         self.__hyperedge_weights)):
+            if (len(names) != n) or (len(weights) != n):
+                raise ValueError("Expected {} {} names and weights, got {} and {}".format(
+                    n, what, len(names), len(weights)))
 
     #=========================METHODS===============================
     def get_vertex_by_name(self, name):
@@ -54,11 +334,11 @@ class Hypergraph:
         Returns:
             Vertex: The first vertex found with the given name. If none are found will return None.
         """
-        for v in self.vertex_set():
-            if (v.name() == name):
-                return v
-        return None
-    
+        i = self.__vertex_names.find(name)
+        if (i is None):
+            return None
+        return self.vertex(i)
+
     def get_hyperedge_by_name(self, name):
         """Find a hyperedge of a hypergraph using its name. Will return the furst hyperedge it finds with the given name.
 
@@ -68,11 +348,11 @@ class Hypergraph:
         Returns:
             Hyperedge: The first hyperedge found with the given name. If none are found will return None.
         """
-        for h in self.hyperedge_set():
-            if (h.name() == name):
-                return h
+        j = self.__hyperedge_names.find(name)
+        if (j is None) or self.__incidence.removed_hyperedges()[j]:
+            return None
+        return self.hyperedge(j)
 
-    #TODO Test this vertex_neighbours function
     def vertex_neighbors(self, vertex):
         """Find the neighbours of a given vertex of a hypergraph
 
@@ -80,40 +360,1109 @@ class Hypergraph:
             vertex (Vertex): The vertex to find the neighbours of.
 
         Returns:
-            list: A list of the vertices that are adjacent to the given vertices.
+            list: A list of the vertices that are adjacent to the given vertices, ordered by id.
+        """
+        return [self.vertex(i) for i in self.__incidence.vertex_neighbors(self.__vertex_ids([vertex])[0])]
+
+    def incident_edges(self, vertex):
+        """Find the hyperedges containing a given vertex of a hypergraph, using the inverted index.
+
+        Args:
+            vertex (Vertex): The vertex to find the hyperedges of.
+
+        Returns:
+            list: A list of the hyperedges containing the vertex, ordered by id.
+        """
+        return [self.hyperedge(j) for j in self.__incidence.vertex_hyperedges(self.__vertex_ids([vertex])[0])]
+
+    def batch_vertex_neighbors(self, vertices):
+        """Find the neighbours of many vertices of a hypergraph at once.
+
+        Args:
+            vertices (list or np.ndarray): The vertices to find the neighbours of, as Vertex objects or as ids.
+
+        Returns:
+            scipy.sparse.csr_matrix: Row k holds the ids of the neighbours of the k-th given vertex (indices of the
+                row), with the number of hyperedges shared with it as values.
+        """
+        return self.__incidence.neighbor_matrix(self.__as_vertex_ids(vertices))
+
+    def add_vertices(self, vnames = None, vweights = None, count = None):
+        """Add isolated vertices to a hypergraph, after the existing ones. The storage grows geometrically, so adding
+        vertices costs amortized O(1) each.
+
+        Args:
+            vnames (list, optional): The names of the new vertices. Defaults to None, in which case they are named by
+                their ids.
+            vweights (array_like, optional): The weights of the new vertices. Defaults to None that will assign a
+                weight of 1 to each new vertex.
+            count (int, optional): The number of vertices to add. Defaults to None, in which case it is taken from the
+                names or weights if given, and is 1 otherwise.
+
+        Raises:
+            ValueError: If the names or weights do not match the number of vertices added.
+
+        Returns:
+            np.ndarray: The ids of the new vertices.
+        """
+        self.__check_owner()
+        count = self.__batch_size(count, vnames, vweights, "vertex")
+        self.__vertex_names.extend(vnames, count)
+        self.__vertex_weights.append(np.ones(count) if (vweights is None) else vweights)
+        return self.__incidence.add_vertices(count)
+
+    def add_hyperedges(self, elist, enames = None, eweights = None):
+        """Add hyperedges to a hypergraph, after the existing ones. The memberships are appended to the storage and
+        to the inverted index at amortized O(1) each.
+
+        Args:
+            elist (list): Each new hyperedge should have a list with the name of each of the vertices it contains.
+                elist is a list of those lists. A vertex repeated in a hyperedge is kept once.
+            enames (list, optional): The names of the new hyperedges. Defaults to None, in which case they are named by
+                their ids.
+            eweights (array_like, optional): The weights of the new hyperedges. Defaults to None that will assign a
+                weight of 1 to each new hyperedge.
+
+        Raises:
+            ValueError: If a vertex name is unknown, or the names or weights do not match the number of hyperedges.
+
+        Returns:
+            np.ndarray: The ids of the new hyperedges.
+        """
+        hyperedge_ptr = np.zeros(len(elist) + 1, dtype = np.int64)
+        np.cumsum([len(vertices) for vertices in elist], out = hyperedge_ptr[1:])
+        hyperedge_vertices = np.array([self.__vertex_id(self.__vertex_names, vname) for vertices in elist
+                                       for vname in vertices], dtype = np.int64)
+        return self.__add_hyperedges(hyperedge_ptr, hyperedge_vertices, enames, eweights)
+
+    def add_hyperedges_from_coo(self, vertex_ids, edge_ids, enames = None, eweights = None):
+        """Add hyperedges to a hypergraph from their memberships given as two integer arrays, without any
+        per-membership Python work.
+
+        Args:
+            vertex_ids (np.ndarray): The vertex id of each membership.
+            edge_ids (np.ndarray): The hyperedge of each membership, numbered from 0 within the batch.
+            enames (list, optional): The names of the new hyperedges. Defaults to None, in which case they are named by
+                their ids.
+            eweights (array_like, optional): The weights of the new hyperedges. Defaults to None that will assign a
+                weight of 1 to each new hyperedge.
+
+        Raises:
+            ValueError: If the arrays differ in length or hold ids out of range.
+
+        Returns:
+            np.ndarray: The ids of the new hyperedges.
+        """
+        vertex_ids = np.asarray(vertex_ids).ravel()
+        edge_ids = np.asarray(edge_ids).ravel()
+        if (len(vertex_ids) != len(edge_ids)):
+            raise ValueError("vertex_ids and edge_ids must have the same length")
+        count = self.__count(edge_ids, eweights, enames)
+        self.__check_ids(vertex_ids, self.number_of_vertices(), "vertex")
+        self.__check_ids(edge_ids, count, "hyperedge")
+        hyperedge_ptr, hyperedge_vertices = group_by(edge_ids, vertex_ids, count)
+        return self.__add_hyperedges(hyperedge_ptr, hyperedge_vertices, enames, eweights)
+
+    def __add_hyperedges(self, hyperedge_ptr, hyperedge_vertices, enames, eweights):
+        """Append hyperedges given as CSC arrays of vertex ids, with their names and weights. A vertex repeated in a
+        hyperedge is kept once.
+
+        Args:
+            hyperedge_ptr (np.ndarray): Offsets into hyperedge_vertices, one more than the number of new hyperedges.
+            hyperedge_vertices (np.ndarray): The vertex ids of every new hyperedge, concatenated.
+            enames (list): The names of the new hyperedges, or None.
+            eweights (array_like): The weights of the new hyperedges, or None.
+
+        Raises:
+            ValueError: If the names or weights do not match the number of hyperedges.
+
+        Returns:
+            np.ndarray: The ids of the new hyperedges.
+        """
+        self.__check_owner()
+        count = self.__batch_size(len(hyperedge_ptr) - 1, enames, eweights, "hyperedge")
+        self.__hyperedge_names.extend(enames, count)
+        self.__hyperedge_weights.append(np.ones(count) if (eweights is None) else eweights)
+        hyperedge_ptr, hyperedge_vertices = distinct_members(hyperedge_ptr, hyperedge_vertices,
+                                                             self.number_of_vertices())
+        return self.__incidence.add_hyperedges(hyperedge_ptr, hyperedge_vertices)
+
+    def remove_hyperedges(self, hyperedges):
+        """Remove hyperedges from a hypergraph. Their memberships are deleted from the storage and the inverted index
+        at amortized O(1) each, but they keep their ids, as empty hyperedges left out of hyperedge_set and of name
+        lookups, so that the ids of the other hyperedges do not move. Once removed hyperedges outnumber the others
+        the hypergraph is compacted, which renumbers the hyperedges.
+
+        Args:
+            hyperedges (list or np.ndarray): The hyperedges to remove, as Hyperedge objects, ids or a boolean mask.
+
+        Raises:
+            ValueError: If a hyperedge id is out of range.
+
+        Returns:
+            np.ndarray: None if the ids did not change, else the new id of every old hyperedge id as returned by
+                compact.
+        """
+        self.__check_owner()
+        ids = self.__as_hyperedge_ids(hyperedges)
+        self.__check_ids(ids, self.number_of_hyperedges(), "hyperedge")
+        self.__incidence.remove_hyperedges(ids)
+        self.__hyperedge_names.forget(ids)
+        if (2 * self.__incidence.number_of_removed_hyperedges() > self.number_of_hyperedges()):
+            return self.compact()
+        return None
+
+    def compact(self):
+        """Drop the removed hyperedges of a hypergraph for good and renumber the others, keeping their order. Every
+        Hyperedge view and hyperedge id obtained before is invalidated.
+
+        Returns:
+            np.ndarray: The new id of every old hyperedge id, -1 for the removed ones.
+        """
+        self.__check_owner()
+        renumbering = self.__incidence.compact()
+        kept = np.flatnonzero(renumbering >= 0)
+        self.__hyperedge_names = self.__hyperedge_names.take(kept)
+        self.__hyperedge_weights = GrowableArray(np.float64, self.__hyperedge_weights.view()[kept])
+        return renumbering
+
+    def dual(self, name = None):
+        """Build the dual of a hypergraph, in which hyperedge j becomes vertex j and vertex i becomes hyperedge i, as a
+        view costing O(1) time and memory: it shares the incidence storage, read from its other side (the CSR view of
+        the dual is the transposed CSC view of the hypergraph), along with the names and weights. Renaming and
+        reweighting through either side shows on both, while the structure of the view cannot be changed. Like
+        incidence_matrix, the view is only valid until the hypergraph is next changed structurally. Removed
+        hyperedges become isolated vertices of the dual.
+
+        Args:
+            name (String, optional): The name of the dual. Defaults to None for "<name> dual".
+
+        Returns:
+            Hypergraph: The dual view, or the hypergraph it is the dual of when called on a dual view.
+        """
+        if isinstance(self.__incidence, DualIncidence):
+            return self.__parent
+        hype = Hypergraph.__new__(Hypergraph)
+        hype.__setup(DualIncidence(self.__incidence), self.__hyperedge_names, self.__vertex_names,
+                     self.__hyperedge_weights.view(), self.__vertex_weights.view(),
+                     "{} dual".format(self.name()) if (name is None) else name, copy = False)
+        hype.__parent = self
+        return hype
+
+    def restrict_to_vertices(self, vertices, strict = False, name = None):
+        """Build the sub-hypergraph induced by some vertices, as a view: every hyperedge is cut down to the given
+        vertices and those left empty are dropped. Vertices and hyperedges are renumbered from 0 in the order of
+        their ids. The view only computes masks and id arrays; its incidence matrix is extracted from the hypergraph
+        when first needed, and its names are read through from the hypergraph. Weights are copied, and the
+        structure of the view cannot be changed. Like incidence_matrix, the view is only valid until the hypergraph
+        is next changed structurally.
+
+        Args:
+            vertices (list or np.ndarray): The vertices to keep, as Vertex objects, ids or a boolean mask.
+            strict (bool, optional): Only keep the hyperedges whose vertices are all given. Defaults to False.
+            name (String, optional): The name of the view. Defaults to None to keep the name of the hypergraph.
+
+        Raises:
+            ValueError: If a vertex does not belong to the hypergraph.
+
+        Returns:
+            Hypergraph: The view.
+        """
+        ids = self.__as_vertex_ids(vertices)
+        self.__check_ids(ids, self.number_of_vertices(), "vertex")
+        mask = np.zeros(self.number_of_vertices(), dtype = bool)
+        mask[ids] = True
+        return self.__restriction(RestrictedIncidence(self.__incidence, vertex_mask = mask, strict = strict), name)
+
+    def restrict_to_edges(self, hyperedges, name = None):
+        """Build the sub-hypergraph made of some hyperedges, as a view with the same vertices (and vertex ids) as the
+        hypergraph. Hyperedges are renumbered from 0 in the order of their ids and removed ones are left out. See
+        restrict_to_vertices for what the view shares with the hypergraph.
+
+        Args:
+            hyperedges (list or np.ndarray): The hyperedges to keep, as Hyperedge objects, ids or a boolean mask.
+            name (String, optional): The name of the view. Defaults to None to keep the name of the hypergraph.
+
+        Raises:
+            ValueError: If a hyperedge does not belong to the hypergraph.
+
+        Returns:
+            Hypergraph: The view.
+        """
+        ids = self.__as_hyperedge_ids(hyperedges)
+        self.__check_ids(ids, self.number_of_hyperedges(), "hyperedge")
+        mask = np.zeros(self.number_of_hyperedges(), dtype = bool)
+        mask[ids] = True
+        return self.__restriction(RestrictedIncidence(self.__incidence, hyperedge_mask = mask), name)
+
+    def __restriction(self, incidence, name):
+        """Wrap a restricted incidence of the hypergraph in a view.
+
+        Args:
+            incidence (RestrictedIncidence): The memberships of the view.
+            name (String): The name of the view, or None to keep the name of the hypergraph.
+
+        Returns:
+            Hypergraph: The view.
+        """
+        vertex_ids = incidence.vertex_ids()
+        hyperedge_ids = incidence.hyperedge_ids()
+        vertex_names = self.__vertex_names
+        vweights = self.__vertex_weights.view()
+        if (vertex_ids is not None):
+            vertex_names = vertex_names.subset(vertex_ids)
+            vweights = vweights[vertex_ids]
+        hype = Hypergraph.__new__(Hypergraph)
+        hype.__setup(incidence, vertex_names, self.__hyperedge_names.subset(hyperedge_ids), vweights,
+                     self.__hyperedge_weights.view()[hyperedge_ids], self.name() if (name is None) else name)
+        hype.__parent = self
+        return hype
+
+    def materialize(self, name = None):
+        """Copy a view into a hypergraph owning compact storage of its own, which can then be changed freely.
+
+        Args:
+            name (String, optional): The name of the copy. Defaults to None to keep the name of the view.
+
+        Returns:
+            Hypergraph: The copy, or the hypergraph itself if it is not a view.
+        """
+        if (self.__parent is None):
+            return self
+        csc = self.__incidence.csc()
+        incidence = Incidence(np.array(csc.indptr), np.array(csc.indices), csc.shape[0],
+                              removed = np.array(self.__incidence.removed_hyperedges()))
+        hype = Hypergraph.__new__(Hypergraph)
+        hype.__setup(incidence, self.__vertex_names.take(np.arange(incidence.number_of_vertices())),
+                     self.__hyperedge_names.take(np.arange(incidence.number_of_hyperedges())),
+                     self.__vertex_weights.view(), self.__hyperedge_weights.view(),
+                     self.name() if (name is None) else name)
+        return hype
+
+    def collapse_edges(self, name = None):
+        """Merge the hyperedges holding the same set of vertices into one, in a vectorized pass over the incidence
+        (see reduction). Each class of duplicates is kept as its first hyperedge, with its name and the summed
+        weight of the class. Removed hyperedges are left out.
+
+        Args:
+            name (String, optional): The name of the collapsed hypergraph. Defaults to None to keep the name of the
+                hypergraph.
+
+        Returns:
+            tuple: (collapsed, multiplicity, classes) where collapsed is a new Hypergraph with the same vertices,
+                multiplicity holds the number of hyperedges merged into each of its hyperedges and classes holds the
+                hyperedge of collapsed every hyperedge was merged into, -1 for removed ones.
+        """
+        csc = self.__incidence.csc()
+        kept = ~self.__incidence.removed_hyperedges()
+        n_classes, classes = reduction.equivalence_classes(csc.indptr, csc.indices, active = kept)
+        ids = np.flatnonzero(kept)
+        _, first = np.unique(classes[ids], return_index = True)
+        collapsed = self.restrict_to_edges(ids[first], name).materialize()
+        collapsed.set_hyperedge_weights(np.bincount(classes[ids], weights = self.__hyperedge_weights.view()[ids],
+                                                    minlength = n_classes))
+        return collapsed, np.bincount(classes[ids], minlength = n_classes), classes
+
+    def collapse_vertices(self, name = None):
+        """Merge the vertices belonging to the same set of hyperedges into super-vertices, in a vectorized pass over
+        the incidence (see reduction). Each class of equivalent vertices is kept as its first vertex, with its name
+        and the summed weight of the class; the vertices without any hyperedge form one class. Hyperedges keep their
+        order, removed ones left out.
+
+        Args:
+            name (String, optional): The name of the collapsed hypergraph. Defaults to None to keep the name of the
+                hypergraph.
+
+        Returns:
+            tuple: (collapsed, multiplicity, classes) where collapsed is a new Hypergraph, multiplicity holds the
+                number of vertices merged into each of its vertices and classes holds the vertex of collapsed every
+                vertex was merged into.
+        """
+        csr = self.__incidence.csr()
+        n_classes, classes = reduction.equivalence_classes(csr.indptr, csr.indices)
+        mask = np.zeros(self.number_of_vertices(), dtype = bool)
+        mask[np.unique(classes, return_index = True)[1]] = True
+        incidence = RestrictedIncidence(self.__incidence, vertex_mask = mask,
+                                        hyperedge_mask = np.ones(self.number_of_hyperedges(), dtype = bool))
+        collapsed = self.__restriction(incidence, name).materialize()
+        collapsed.set_vertex_weights(np.bincount(classes, weights = self.__vertex_weights.view(),
+                                                 minlength = n_classes))
+        return collapsed, np.bincount(classes, minlength = n_classes), classes
+
+    def toplexes(self, chunk_size = 1 << 24, name = None):
+        """Build the simple hypergraph of the maximal hyperedges, those contained in no other hyperedge, with the same
+        vertices. Hyperedges are tested by decreasing size against the maximal ones already found among the
+        hyperedges of their member of lowest degree (see reduction). Of identical hyperedges only the first is kept,
+        and empty or removed hyperedges are left out.
+
+        Args:
+            chunk_size (int, optional): The largest number of membership tests made at once, which bounds the
+                memory used. Defaults to 1 << 24.
+            name (String, optional): The name of the new hypergraph. Defaults to None to keep the name of the
+                hypergraph.
+
+        Returns:
+            tuple: (toplexes, ids) where toplexes is a new Hypergraph and ids holds the id in the hypergraph of each
+                of its hyperedges.
+        """
+        hyperedge_ptr, hyperedge_vertices = self.__incidence.hyperedge_arrays()
+        vertex_ptr, vertex_hyperedges = self.__incidence.vertex_arrays()
+        maximal = reduction.toplexes(hyperedge_ptr, hyperedge_vertices, vertex_ptr, vertex_hyperedges,
+                                     active = ~self.__incidence.removed_hyperedges(), chunk_size = chunk_size)
+        ids = np.flatnonzero(maximal)
+        return self.restrict_to_edges(ids, name).materialize(), ids
+
+    def vertex_degree_matrix(self):
+        """Build the vertex degree matrix Dv of a hypergraph: the diagonal of weighted vertex degrees, the degree of
+        a vertex being the total weight of the hyperedges containing it.
+
+        Returns:
+            scipy.sparse.csr_matrix: The n_vertices x n_vertices diagonal matrix.
+        """
+        degrees = spectral.vertex_degrees(self.__incidence.csr(), self.__hyperedge_weights.view())
+        return sparse.diags(degrees, format = "csr")
+
+    def hyperedge_degree_matrix(self):
+        """Build the hyperedge degree matrix De of a hypergraph: the diagonal of hyperedge sizes.
+
+        Returns:
+            scipy.sparse.csr_matrix: The n_hyperedges x n_hyperedges diagonal matrix.
+        """
+        return sparse.diags(spectral.hyperedge_degrees(self.__incidence.csc()), format = "csr")
+
+    def normalized_laplacian(self):
+        """Build the normalized Laplacian I - Dv^-1/2 H W De^-1 H^T Dv^-1/2 of a hypergraph (Zhou et al.), with W the
+        hyperedge weights. See spectral for the treatment of isolated vertices and empty hyperedges.
+
+        Returns:
+            scipy.sparse.csr_matrix: The n_vertices x n_vertices Laplacian.
+        """
+        return spectral.zhou_laplacian(self.__incidence.csr(), self.__hyperedge_weights.view())
+
+    def clique_laplacian(self, normalized = False):
+        """Build the Laplacian of the clique expansion of a hypergraph, in which two vertices are joined by the total
+        weight of the hyperedges they share.
+
+        Args:
+            normalized (bool, optional): Return I - D^-1/2 A D^-1/2 instead of D - A. Defaults to False.
+
+        Returns:
+            scipy.sparse.csr_matrix: The n_vertices x n_vertices Laplacian.
+        """
+        return spectral.clique_laplacian(self.__incidence.csr(), self.__hyperedge_weights.view(),
+                                         normalized = normalized)
+
+    def clique_expansion(self, weighting = "weight", chunk_size = None):
+        """Build the clique expansion (2-section) of a hypergraph: the graph joining every two vertices that share a
+        hyperedge, as a sparse adjacency matrix computed in one sparse product.
+
+        Args:
+            weighting (String, optional): "weight", "count", "normalized" or "binary", see
+                expansion.clique_expansion. Defaults to "weight", the total weight of the shared hyperedges.
+            chunk_size (int, optional): Compute the matrix by blocks of rows of at most this many estimated entries,
+                to bound the memory of the product when some hyperedges are very large. Defaults to None for a single
+                product.
+
+        Returns:
+            scipy.sparse.csr_matrix: The symmetric n_vertices x n_vertices adjacency matrix.
+        """
+        return expansion.clique_expansion(self.__incidence.csr(), self.__hyperedge_weights.view(),
+                                          weighting = weighting, chunk_size = chunk_size)
+
+    def clique_expansion_blocks(self, weighting = "weight", chunk_size = 1 << 24):
+        """Stream the clique expansion of a hypergraph by blocks of rows, so that it can be written out without ever
+        being held in memory as a whole.
+
+        Args:
+            weighting (String, optional): See clique_expansion. Defaults to "weight".
+            chunk_size (int, optional): The largest estimated number of entries of a block. Defaults to 2^24.
+
+        Returns:
+            generator: (first_row, block) pairs, block being the csr_matrix of the rows of the adjacency matrix
+                starting at first_row.
+        """
+        return expansion.clique_expansion_blocks(self.__incidence.csr(), self.__hyperedge_weights.view(),
+                                                 weighting = weighting, chunk_size = chunk_size)
+
+    def star_expansion(self, weighted = False):
+        """Build the star expansion of a hypergraph: the bipartite graph joining each hyperedge to its vertices, with
+        vertex i as node i and hyperedge j as node number_of_vertices() + j.
+
+        Args:
+            weighted (bool, optional): Weight each edge with the weight of its hyperedge. Defaults to False.
+
+        Returns:
+            scipy.sparse.csr_matrix: The symmetric adjacency matrix.
         """
-        #Neighbours of the vertex
-        neighbours = []
-        #Check every hyperedge as to whether it contains the vertex then append all vertices in the hyperedge to neighbours
-        for h in self.hyperedge_set():
-            if vertex in h.vertices():
-                neighbours.append(h.vertices())
-        #Unnest the neighbours list
-        neighbours = list(chain.from_iterable(neighbours))
-        #Make sure every element of the list is unique
-        neighbours_unique = []
-        for v in neighbours:
-            if (v not in neighbours_unique) & (v not in [vertex]):
-                neighbours_unique.append(v)
-        return neighbours_unique
+        return expansion.star_expansion(self.__incidence.csr(),
+                                        self.__hyperedge_weights.view() if weighted else None)
+
+    def s_line_graph(self, s = 1, chunk_size = 1 << 24):
+        """Build the s-line graph of a hypergraph: the graph joining every two hyperedges that share at least s
+        vertices, as a sparse adjacency matrix by hyperedge id. Removed hyperedges are isolated.
+
+        Args:
+            s (int, optional): The smallest number of shared vertices. Defaults to 1.
+            chunk_size (int, optional): The largest estimated number of overlaps computed at once, before
+                thresholding. Defaults to 2^24.
+
+        Returns:
+            scipy.sparse.csr_matrix: The symmetric n_hyperedges x n_hyperedges adjacency matrix, holding the number of
+                shared vertices.
+        """
+        return expansion.line_graph(self.__incidence.csr(), s = s, chunk_size = chunk_size)
+
+    def s_line_hypergraph(self, s = 1, chunk_size = 1 << 24, name = None):
+        """Build the s-line graph of a hypergraph as a new hypergraph, whose vertices are the hyperedges (with their
+        names and weights) and whose hyperedges are the pairs of hyperedges sharing at least s vertices, weighted by
+        the number they share. Removed hyperedges are left out, so vertex ids follow hyperedge_set().
+
+        Args:
+            s (int, optional): The smallest number of shared vertices. Defaults to 1.
+            chunk_size (int, optional): See s_line_graph. Defaults to 2^24.
+            name (String, optional): The name of the new hypergraph. Defaults to None for "<name> s-line graph".
+
+        Returns:
+            Hypergraph: The s-line graph, with one hyperedge of two vertices per adjacent pair.
+        """
+        kept = np.flatnonzero(~self.__incidence.removed_hyperedges())
+        adjacency = self.s_line_graph(s = s, chunk_size = chunk_size)
+        if (len(kept) != adjacency.shape[0]):
+            adjacency = adjacency[kept][:, kept]
+        pairs = sparse.triu(adjacency, k = 1, format = "coo")
+        n_pairs = len(pairs.data)
+
+        incidence = Incidence(np.arange(0, 2 * n_pairs + 1, 2), np.column_stack((pairs.row, pairs.col)).ravel(),
+                              len(kept))
+        hype = Hypergraph.__new__(Hypergraph)
+        hype.__setup(incidence, self.__hyperedge_names.take(kept), NameTable(None, n_pairs),
+                     self.__hyperedge_weights.view()[kept], pairs.data,
+                     "{} {}-line graph".format(self.name(), s) if (name is None) else name)
+        return hype
+
+    def connected_components(self):
+        """Find the connected components of a hypergraph, in time linear in the number of memberships. Removed
+        hyperedges belong to no component.
+
+        Returns:
+            tuple: (n_components, vertex_labels, hyperedge_labels), the component of each vertex and of each
+                hyperedge by id, -1 for removed hyperedges.
+        """
+        return connectivity.connected_components(self.__incidence.csr(), self.__incidence.removed_hyperedges())
+
+    def s_connected_components(self, s = 1, chunk_size = 1 << 24):
+        """Find the s-connected components of a hypergraph: the classes of hyperedges joined by chains of hyperedges
+        sharing at least s vertices with the next. Hyperedges of fewer than s vertices and removed hyperedges belong
+        to no component.
+
+        Args:
+            s (int, optional): The smallest number of shared vertices. Defaults to 1.
+            chunk_size (int, optional): See s_line_graph. Defaults to 2^24.
+
+        Returns:
+            tuple: (n_components, vertex_labels, hyperedge_labels), -1 for no component. A vertex may lie in several
+                components when s > 1 and gets the smallest of their labels.
+        """
+        return connectivity.s_connected_components(self.__incidence.csr(), s = s,
+                                                    removed = self.__incidence.removed_hyperedges(),
+                                                    chunk_size = chunk_size)
+
+    def bfs_distances(self, sources, max_depth = None):
+        """Find the hop distance, the number of hyperedges crossed, from the nearest of some source vertices to every
+        vertex of a hypergraph, by a frontier breadth-first search that expands each hyperedge once.
+
+        Args:
+            sources (list or np.ndarray): The vertices to start from, as Vertex objects, ids or a boolean mask.
+            max_depth (int, optional): Only search this many hops away. Defaults to None for no limit.
+
+        Raises:
+            ValueError: If a source is not a vertex of the hypergraph.
+
+        Returns:
+            np.ndarray: The distance of each vertex by id, -1 for the vertices not reached.
+        """
+        sources = self.__as_vertex_ids(sources)
+        self.__check_ids(sources, self.number_of_vertices(), "vertex")
+        return traversal.bfs_distances(*self.__incidence.vertex_arrays(), *self.__incidence.hyperedge_arrays(),
+                                       sources, max_depth = max_depth)
+
+    def shortest_path_lengths(self, sources, limit = None):
+        """Find the weighted distance from the nearest of some source vertices to every vertex of a hypergraph,
+        crossing a hyperedge costing its weight.
+
+        Args:
+            sources (list or np.ndarray): The vertices to start from, as Vertex objects, ids or a boolean mask.
+            limit (float, optional): Only search up to this distance. Defaults to None for no limit.
+
+        Raises:
+            ValueError: If a source is not a vertex of the hypergraph, or a hyperedge weight is negative.
+
+        Returns:
+            np.ndarray: The distance of each vertex by id, inf for the vertices not reached.
+        """
+        sources = self.__as_vertex_ids(sources)
+        self.__check_ids(sources, self.number_of_vertices(), "vertex")
+        return traversal.weighted_distances(*self.__incidence.vertex_arrays(), *self.__incidence.hyperedge_arrays(),
+                                            self.__hyperedge_weights.view(), sources, limit = limit)
+
+    def batch_bfs_distances(self, sources, max_depth = None, processes = None):
+        """Find the hop distances from each of many source vertices of a hypergraph, one breadth-first search per
+        source, spread over a pool of processes sharing one copy of the incidence arrays.
+
+        Args:
+            sources (list or np.ndarray): The vertices to search from, as Vertex objects, ids or a boolean mask.
+            max_depth (int, optional): Only search this many hops away. Defaults to None for no limit.
+            processes (int, optional): The number of worker processes. Defaults to None for one per CPU.
+
+        Raises:
+            ValueError: If a source is not a vertex of the hypergraph.
+
+        Returns:
+            np.ndarray: A len(sources) x number_of_vertices() int32 array of distances, -1 for the vertices not
+                reached.
+        """
+        sources = self.__as_vertex_ids(sources)
+        self.__check_ids(sources, self.number_of_vertices(), "vertex")
+        return traversal.batch_bfs_distances(*self.__incidence.vertex_arrays(),
+                                             *self.__incidence.hyperedge_arrays(), sources, max_depth = max_depth,
+                                             processes = processes)
+
+    def bfs_statistics(self, sources = None, max_depth = None, processes = None):
+        """Collect the distance statistics of many source vertices of a hypergraph, from which eccentricities, the
+        diameter (the largest eccentricity) and closeness ((reached - 1) / total) follow, without holding the
+        distances. The searches are spread over a pool of processes as in batch_bfs_distances.
+
+        Args:
+            sources (list or np.ndarray, optional): The vertices to search from, as Vertex objects, ids or a boolean
+                mask. Defaults to None for every vertex.
+            max_depth (int, optional): Only search this many hops away. Defaults to None for no limit.
+            processes (int, optional): The number of worker processes. Defaults to None for one per CPU.
+
+        Raises:
+            ValueError: If a source is not a vertex of the hypergraph.
+
+        Returns:
+            np.ndarray: A len(sources) x 3 int64 array holding, for each source, the largest distance reached, the
+                number of vertices reached including the source and the sum of their distances.
+        """
+        if (sources is None):
+            sources = np.arange(self.number_of_vertices())
+        sources = self.__as_vertex_ids(sources)
+        self.__check_ids(sources, self.number_of_vertices(), "vertex")
+        return traversal.batch_bfs_statistics(*self.__incidence.vertex_arrays(),
+                                              *self.__incidence.hyperedge_arrays(), sources, max_depth = max_depth,
+                                              processes = processes)
+
+    def random_walks(self, length, starts = None, walks_per_vertex = 1, edge_weighted = False,
+                     vertex_weighted = False, chunk_size = 65536, seed = None):
+        """Generate random walks on a hypergraph, each step moving to a hyperedge of the current vertex and then to
+        a vertex of that hyperedge. Walkers advance together, a chunk at a time, and walks are streamed out as int32
+        arrays of vertex ids, as used to train vertex embeddings.
+
+        Args:
+            length (int): The number of vertices of each walk, its start included.
+            starts (list or np.ndarray, optional): The start vertices, as Vertex objects, ids or a boolean mask.
+                Defaults to None for every vertex.
+            walks_per_vertex (int, optional): The number of walks from each start. Defaults to 1.
+            edge_weighted (bool, optional): Draw hyperedges with probability proportional to their weights. Defaults
+                to False for uniform draws.
+            vertex_weighted (bool, optional): Draw vertices with probability proportional to their weights. Defaults
+                to False for uniform draws.
+            chunk_size (int, optional): The number of walks per chunk. Defaults to 65536.
+            seed (int, optional): Seed of the random draws. Defaults to None.
+
+        Raises:
+            ValueError: If a start is not a vertex of the hypergraph, length is smaller than 1 or a weight used is
+                negative.
+
+        Returns:
+            generator: chunk_size x length int32 arrays, one walk per row, in the order of the starts repeated
+                walks_per_vertex times. A walk that cannot move on, from a vertex without hyperedges of positive
+                weight or through a hyperedge whose vertices all weigh 0, ends with -1.
+        """
+        if (starts is None):
+            starts = np.arange(self.number_of_vertices())
+        starts = self.__as_vertex_ids(starts)
+        self.__check_ids(starts, self.number_of_vertices(), "vertex")
+        return walks.random_walks(*self.__incidence.vertex_arrays(), *self.__incidence.hyperedge_arrays(),
+                                  np.tile(starts, walks_per_vertex), length,
+                                  eweights = self.__hyperedge_weights.view() if edge_weighted else None,
+                                  vweights = self.__vertex_weights.view() if vertex_weighted else None,
+                                  chunk_size = chunk_size, seed = seed)
+
+    def pagerank(self, personalization = None, alpha = 0.85, tol = 1e-10, maxiter = 100):
+        """Compute the PageRank of the vertices of a hypergraph for the walk that moves to a hyperedge chosen by
+        weight, then to one of its vertices chosen uniformly, by sparse power iteration on the incidence matrix.
+
+        Args:
+            personalization (np.ndarray, optional): The teleportation distribution, by vertex id, or an
+                number_of_vertices() x k matrix of k of them ranked together. Defaults to None for uniform.
+            alpha (float, optional): The probability of following the walk rather than teleporting. Defaults to 0.85.
+            tol (float, optional): The L1 change at which to stop. Defaults to 1e-10.
+            maxiter (int, optional): The maximum number of iterations. Defaults to 100.
+
+        Raises:
+            ValueError: If alpha is not in [0, 1) or a personalization is invalid.
+
+        Returns:
+            np.ndarray: The rank of each vertex by id, with one column per personalization if given a matrix.
+        """
+        return ranking.pagerank(self.__incidence.csr(), self.__hyperedge_weights.view(),
+                                personalization = personalization, alpha = alpha, tol = tol, maxiter = maxiter)
+
+    def personalized_pagerank(self, seeds, alpha = 0.85, tol = 1e-10, maxiter = 100):
+        """Compute the PageRank of the vertices of a hypergraph personalized on each of many seed vertices at once,
+        the walk teleporting back to its seed.
+
+        Args:
+            seeds (list or np.ndarray): The seed vertices, as Vertex objects, ids or a boolean mask.
+            alpha (float, optional): The probability of following the walk rather than teleporting. Defaults to 0.85.
+            tol (float, optional): The L1 change at which to stop. Defaults to 1e-10.
+            maxiter (int, optional): The maximum number of iterations. Defaults to 100.
+
+        Raises:
+            ValueError: If a seed is not a vertex of the hypergraph, or alpha is not in [0, 1).
+
+        Returns:
+            np.ndarray: A number_of_vertices() x len(seeds) matrix whose column k ranks the vertices for seeds[k].
+        """
+        seeds = self.__as_vertex_ids(seeds)
+        self.__check_ids(seeds, self.number_of_vertices(), "vertex")
+        personalization = np.zeros((self.number_of_vertices(), len(seeds)))
+        personalization[seeds, np.arange(len(seeds))] = 1
+        return self.pagerank(personalization, alpha = alpha, tol = tol, maxiter = maxiter)
+
+    def spectral_embedding(self, k, initial = None, method = None, tol = None, maxiter = None, seed = None):
+        """Embed the vertices of a hypergraph in k dimensions with the eigenvectors of the k smallest eigenvalues of
+        its normalized Laplacian. After a batch of updates, passing the previous embedding as initial warm-starts
+        LOBPCG, which then needs only a few iterations instead of a full solve.
+
+        Args:
+            k (int): The number of dimensions.
+            initial (np.ndarray, optional): A previous embedding to start from. Vertices added since get random
+                starting coordinates. Defaults to None.
+            method (String, optional): "eigsh", "lobpcg" or "dense", see spectral.smallest_eigenpairs. Defaults to
+                None to pick LOBPCG when warm-starting and ARPACK otherwise.
+            tol (float, optional): The convergence tolerance. Defaults to None for the solver default.
+            maxiter (int, optional): The maximum number of iterations. Defaults to None for the solver default.
+            seed (int, optional): Seed of the random start vectors. Defaults to None.
+
+        Returns:
+            np.ndarray: The n_vertices x k embedding, one column per eigenvector by increasing eigenvalue.
+        """
+        _, vectors = spectral.smallest_eigenpairs(self.normalized_laplacian(), k, initial = initial, method = method,
+                                                  tol = tol, maxiter = maxiter, seed = seed)
+        return vectors
+
+    def spectral_clustering(self, n_clusters, embedding = None, seed = None):
+        """Cluster the vertices of a hypergraph by k-means on a spectral embedding.
+
+        Args:
+            n_clusters (int): The number of clusters.
+            embedding (np.ndarray, optional): The embedding to cluster, for instance a warm-started one from
+                spectral_embedding. Defaults to None to compute an n_clusters-dimensional embedding.
+            seed (int, optional): Seed of the embedding and of the k-means initialization. Defaults to None.
+
+        Returns:
+            np.ndarray: The cluster of each vertex, by vertex id.
+        """
+        if (embedding is None):
+            embedding = self.spectral_embedding(n_clusters, seed = seed)
+        return spectral.kmeans(embedding, n_clusters, seed = seed)
+
+    @staticmethod
+    def __batch_size(count, names, weights, what):
+        """Find the number of vertices or hyperedges added by a batch and check the names and weights against it.
+
+        Args:
+            count (int): The number of items added, or None to take it from the names or weights.
+            names (list): The names of the items, or None.
+            weights (array_like): The weights of the items, or None.
+            what (String): What the items are, for the error message.
+
+        Raises:
+            ValueError: If the names or weights do not match the number of items.
+
+        Returns:
+            int: The number of items added.
+        """
+        if (count is None):
+            count = len(names) if (names is not None) else len(weights) if (weights is not None) else 1
+        for given in (names, weights):
+            if (given is not None) and (len(given) != count):
+                raise ValueError("Expected {} {} names and weights, got {}".format(count, what, len(given)))
+        return int(count)
+
+    @staticmethod
+    def __count(ids, weights, names):
+        """Infer the number of vertices or hyperedges of a COO hypergraph.
+
+        Args:
+            ids (np.ndarray): The vertex or hyperedge id of each membership.
+            weights (array_like): The weights, or None.
+            names (list): The names, or None.
+
+        Returns:
+            int: The length of the weights or names if given, one more than the largest id otherwise.
+        """
+        if (weights is not None):
+            return len(weights)
+        if (names is not None):
+            return len(names)
+        return int(ids.max()) + 1 if len(ids) else 0
+
+    @staticmethod
+    def __check_ids(ids, n, what):
+        """Check that ids are integers in [0, n).
+
+        Args:
+            ids (np.ndarray): The ids to check.
+            n (int): The number of valid ids.
+            what (String): What the ids refer to, for the error message.
+
+        Raises:
+            ValueError: If an id is not an integer or is out of range.
+        """
+        if (not np.issubdtype(ids.dtype, np.integer)) and len(ids):
+            raise ValueError("{} ids must be integers, got {}".format(what, ids.dtype))
+        if len(ids) and ((ids.min() < 0) or (ids.max() >= n)):
+            raise ValueError("{} ids must lie in [0, {})".format(what, n))
+
+    def __vertex_id(self, vertex_names, name):
+        """Find the id of the first vertex with the given name.
+
+        Args:
+            vertex_names (NameTable): The names of the vertices.
+            name (String): The name of the vertex.
+
+        Raises:
+            ValueError: If no vertex has the given name.
+
+        Returns:
+            int: The id of the vertex.
+        """
+        i = vertex_names.find(name)
+        if (i is None):
+            raise ValueError("No vertex named {!r}".format(name))
+        return i
+
+    def __vertex_ids(self, vertices):
+        """Translate Vertex objects to their ids, checking that they belong to this hypergraph.
+
+        Args:
+            vertices (list): A list of Vertex objects.
+
+        Raises:
+            ValueError: If a vertex belongs to another hypergraph.
+
+        Returns:
+            list: The ids of the vertices.
+        """
+        ids = []
+        for v in vertices:
+            if (v.parent_hypergraph() is not self):
+                raise ValueError("Vertex {!r} does not belong to hypergraph {!r}".format(v.name(), self.name()))
+            ids.append(v.index())
+        return ids
+
+    def __as_vertex_ids(self, vertices):
+        """Accept either Vertex objects, vertex ids or a boolean mask over the vertices and return the ids.
+
+        Args:
+            vertices (list or np.ndarray): Vertex objects of this hypergraph, integer vertex ids or a boolean mask.
+
+        Returns:
+            np.ndarray: The vertex ids.
+        """
+        if (len(vertices) > 0) and isinstance(vertices[0], Vertex):
+            vertices = self.__vertex_ids(vertices)
+        return self.__as_ids(vertices, self.number_of_vertices())
+
+    def __as_hyperedge_ids(self, hyperedges):
+        """Accept either Hyperedge objects, hyperedge ids or a boolean mask over the hyperedges and return the ids.
+
+        Args:
+            hyperedges (list or np.ndarray): Hyperedge objects of this hypergraph, integer hyperedge ids or a boolean
+                mask.
+
+        Raises:
+            ValueError: If a hyperedge belongs to another hypergraph.
+
+        Returns:
+            np.ndarray: The hyperedge ids.
+        """
+        if (len(hyperedges) > 0) and isinstance(hyperedges[0], Hyperedge):
+            ids = []
+            for h in hyperedges:
+                if (h.parent_hypergraph() is not self):
+                    raise ValueError("Hyperedge {!r} does not belong to hypergraph {!r}".format(h.name(), self.name()))
+                ids.append(h.index())
+            hyperedges = ids
+        return self.__as_ids(hyperedges, self.number_of_hyperedges())
+
+    @staticmethod
+    def __as_ids(ids, n):
+        """Turn integer ids or a boolean mask of length n into an array of ids.
+
+        Args:
+            ids (array_like): Integer ids or a boolean mask.
+            n (int): The number of vertices or hyperedges the ids refer to.
+
+        Raises:
+            ValueError: If a boolean mask does not have length n.
+
+        Returns:
+            np.ndarray: The ids.
+        """
+        ids = np.asarray(ids)
+        if (ids.dtype == bool):
+            if (len(ids) != n):
+                raise ValueError("Boolean mask of length {} given for {} items".format(len(ids), n))
+            return np.flatnonzero(ids)
+        return ids.astype(np.int64, copy = False).ravel()
+
+    @staticmethod
+    def __read_only(array):
+        """Wrap an array in a view that cannot be written through.
+
+        Args:
+            array (np.ndarray): The array to protect.
+
+        Returns:
+            np.ndarray: A read-only view of the array.
+        """
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    #=========================VIEW ACCESS=========================
+    #Called by the Vertex and Hyperedge views to read and write the storage
+    def _vertex_name(self, i):
+        """Return the name of vertex i."""
+        return self.__vertex_names.name(i)
+
+    def _set_vertex_name(self, i, name):
+        """Rename vertex i, keeping the name index in sync."""
+        self.__vertex_names.set_name(i, name)
+
+    def _vertex_weight(self, i):
+        """Return the weight of vertex i."""
+        return self.__vertex_weights.view()[i]
+
+    def _set_vertex_weight(self, i, weight):
+        """Set the weight of vertex i."""
+        self.__vertex_weights.view()[i] = weight
+
+    def _vertex_degree(self, i):
+        """Return the number of hyperedges containing vertex i."""
+        return len(self.__incidence.vertex_hyperedges(i))
+
+    def _hyperedge_name(self, j):
+        """Return the name of hyperedge j."""
+        return self.__hyperedge_names.name(j)
+
+    def _set_hyperedge_name(self, j, name):
+        """Rename hyperedge j, keeping the name index in sync."""
+        self.__check_not_removed(j)
+        self.__hyperedge_names.set_name(j, name)
+
+    def _hyperedge_weight(self, j):
+        """Return the weight of hyperedge j."""
+        return self.__hyperedge_weights.view()[j]
+
+    def _set_hyperedge_weight(self, j, weight):
+        """Set the weight of hyperedge j."""
+        self.__hyperedge_weights.view()[j] = weight
+
+    def _hyperedge_vertices(self, j):
+        """Return the vertices of hyperedge j as a list of Vertex views."""
+        return [self.vertex(i) for i in self.__incidence.hyperedge_vertices(j)]
+
+    def _hyperedge_size(self, j):
+        """Return the number of vertices contained in hyperedge j."""
+        return len(self.__incidence.hyperedge_vertices(j))
+
+    def _set_hyperedge_vertices(self, j, vertices):
+        """Replace the vertices of hyperedge j by a list of Vertex objects."""
+        self.__check_owner()
+        self.__check_not_removed(j)
+        ids = np.asarray(self.__vertex_ids(vertices), dtype = np.int64)
+        self.__incidence.set_hyperedge_vertices(j, distinct_members([0, len(ids)], ids, self.number_of_vertices())[1])
+
+    def __check_owner(self):
+        """Raise a ValueError if the hypergraph is a view, whose structure cannot be changed."""
+        if (self.__parent is not None):
+            raise ValueError("Hypergraph {!r} is a view of {!r} and cannot be changed structurally; materialize it "
+                             "first".format(self.name(), self.__parent.name()))
+
+    def __check_not_removed(self, j):
+        """Raise a ValueError if hyperedge j has been removed."""
+        if self.__incidence.removed_hyperedges()[j]:
+            raise ValueError("Hyperedge {} has been removed".format(j))
 
     #=========================GETTERS AND SETTERS=========================
+    def vertex(self, i):
+        """Access a vertex of a hypergraph by its id.
+
+        Args:
+            i (int): The id of the vertex.
+
+        Returns:
+            Vertex: A view onto the vertex.
+        """
+        return Vertex(hype = self, index = i)
+
+    def hyperedge(self, j):
+        """Access a hyperedge of a hypergraph by its id.
+
+        Args:
+            j (int): The id of the hyperedge.
+
+        Returns:
+            Hyperedge: A view onto the hyperedge.
+        """
+        return Hyperedge(hype = self, index = j)
+
     def vertex_set(self):
-        """Access the vertex set of a hypergraph.
+        """Access the vertex set of a hypergraph. The Vertex views are created on each call.
 
         Returns:
             list: A list of the vertuces contained in the hypergraph.
         """
-        return self.__vertex_set
-    
+        return [self.vertex(i) for i in range(self.number_of_vertices())]
+
     def hyperedge_set(self):
-        """Access the hyperedge set of a hypergraph.
+        """Access the hyperedge set of a hypergraph. The Hyperedge views are created on each call.
+
+        Returns:
+            list: A list of the hyperedges contained in the hypergraph, removed hyperedges excluded.
+        """
+        if self.__incidence.number_of_removed_hyperedges():
+            return [self.hyperedge(j) for j in np.flatnonzero(~self.__incidence.removed_hyperedges()).tolist()]
+        return [self.hyperedge(j) for j in range(self.number_of_hyperedges())]
+
+    def vertex_weights(self):
+        """Access the weights of all the vertices of a hypergraph.
+
+        Returns:
+            np.ndarray: A read-only float64 view of the vertex weights, by vertex id. Use set_vertex_weights to change
+                them.
+        """
+        return self.__read_only(self.__vertex_weights.view())
+
+    def hyperedge_weights(self):
+        """Access the weights of all the hyperedges of a hypergraph.
+
+        Returns:
+            np.ndarray: A read-only float64 view of the hyperedge weights, by hyperedge id. Use set_hyperedge_weights
+                to change them.
+        """
+        return self.__read_only(self.__hyperedge_weights.view())
+
+    def set_vertex_weights(self, weights, vertices = None):
+        """Set the weights of many vertices of a hypergraph in one vectorized operation.
+
+        Args:
+            weights (array_like): The new weights, or a single weight given to every selected vertex.
+            vertices (list or np.ndarray, optional): The vertices to reweight, as Vertex objects, ids or a boolean
+                mask. Defaults to None that will reweight every vertex.
+        """
+        if (vertices is None):
+            self.__vertex_weights.view()[:] = weights
+        else:
+            self.__vertex_weights.view()[self.__as_vertex_ids(vertices)] = weights
+
+    def set_hyperedge_weights(self, weights, hyperedges = None):
+        """Set the weights of many hyperedges of a hypergraph in one vectorized operation.
+
+        Args:
+            weights (array_like): The new weights, or a single weight given to every selected hyperedge.
+            hyperedges (list or np.ndarray, optional): The hyperedges to reweight, as Hyperedge objects, ids or a
+                boolean mask. Defaults to None that will reweight every hyperedge.
+        """
+        if (hyperedges is None):
+            self.__hyperedge_weights.view()[:] = weights
+        else:
+            self.__hyperedge_weights.view()[self.__as_hyperedge_ids(hyperedges)] = weights
+
+    def vertex_degrees(self):
+        """Access the degree of every vertex of a hypergraph.
 
         Returns:
-            list: A list of the hyperedges contained in the hypergraph.
+            np.ndarray: The number of hyperedges containing each vertex, by vertex id.
         """
-        return self.__hyperedge_set
-    
+        return self.__incidence.vertex_degrees()
+
+    def hyperedge_sizes(self):
+        """Access the size of every hyperedge of a hypergraph.
+
+        Returns:
+            np.ndarray: The number of vertices contained in each hyperedge, by hyperedge id.
+        """
+        return self.__incidence.hyperedge_sizes()
+
+    def number_of_vertices(self):
+        """Access the number of vertices of a hypergraph.
+
+        Returns:
+            int: The number of vertices.
+        """
+        return self.__incidence.number_of_vertices()
+
+    def number_of_hyperedges(self):
+        """Access the number of hyperedges of a hypergraph. Removed hyperedges keep their ids until the hypergraph
+        is compacted and are counted.
+
+        Returns:
+            int: The number of hyperedges, which is also the number of hyperedge ids in use.
+        """
+        return self.__incidence.number_of_hyperedges()
+
+    def removed_hyperedges(self):
+        """Access which hyperedges of a hypergraph have been removed but still hold their ids.
+
+        Returns:
+            np.ndarray: A read-only boolean view, by hyperedge id.
+        """
+        return self.__read_only(self.__incidence.removed_hyperedges())
+
+    def incidence(self):
+        """Access the incidence storage of a hypergraph.
+
+        Returns:
+            Incidence: The integer incidence structure backing the hypergraph, or the DualIncidence or
+                RestrictedIncidence of a view.
+        """
+        return self.__incidence
+
+    def incidence_matrix(self, format = "csr"):
+        """Access the vertex x hyperedge incidence matrix of a hypergraph. The matrix shares its index arrays with
+        the storage and must not be modified.
+
+        Args:
+            format (String, optional): "csr" for the vertex-major view or "csc" for the hyperedge-major view.
+                Defaults to "csr".
+
+        Raises:
+            ValueError: If the format is not "csr" or "csc".
+
+        Returns:
+            scipy.sparse.spmatrix: The incidence matrix.
+        """
+        if (format == "csr"):
+            return self.__incidence.csr()
+        if (format == "csc"):
+            return self.__incidence.csc()
+        raise ValueError("Unknown incidence matrix format {!r}, expected 'csr' or 'csc'".format(format))
+
+    def view_of(self):
+        """Access the hypergraph whose storage a view shares.
+
+        Returns:
+            Hypergraph: The viewed hypergraph, or None if the hypergraph owns its storage.
+        """
+        return self.__parent
+
     def name(self):
         """Access the name of a hypergraph.
 
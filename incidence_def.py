@@ -0,0 +1,448 @@
+import numpy as np
+from scipy import sparse
+from growable_array_def import GrowableArray
+from row_pool_def import RowPool, slot_positions
+
+
+def index_dtype(maxval):
+    """Pick the smallest integer type able to hold the ids and offsets of an incidence structure.
+
+    Args:
+        maxval (int): The largest id or offset that has to be stored.
+
+    Returns:
+        np.dtype: np.int32 when every value fits in 32 bits, np.int64 otherwise.
+    """
+    if (maxval < np.iinfo(np.int32).max):
+        return np.dtype(np.int32)
+    return np.dtype(np.int64)
+
+
+def gather_rows(ptr, rows):
+    """Locate the entries of several rows of a compressed (CSR or CSC) structure without a Python loop.
+
+    Args:
+        ptr (np.ndarray): The row offsets of the structure.
+        rows (np.ndarray): The ids of the rows to gather.
+
+    Returns:
+        tuple: (out_ptr, positions) where positions[out_ptr[k]:out_ptr[k + 1]] are the positions, in the index array
+            of the structure, of the entries of rows[k].
+    """
+    rows = np.asarray(rows, dtype = np.int64)
+    return slot_positions(ptr[rows], ptr[rows + 1] - ptr[rows])
+
+
+def group_by(keys, values, n_keys):
+    """Group values by integer key with a linear-time, stable counting sort. The sort is delegated to the compiled
+    CSR -> CSC conversion of scipy.sparse by storing value k as the entry (k, keys[k]) of a one-entry-per-row matrix.
+
+    Args:
+        keys (np.ndarray): The key of each value, in [0, n_keys).
+        values (np.ndarray): The integer values to group.
+        n_keys (int): The number of keys.
+
+    Returns:
+        tuple: (ptr, grouped) where grouped[ptr[k]:ptr[k + 1]] are the values with key k, in their original order.
+    """
+    rows = sparse.csr_matrix((values, keys, np.arange(len(keys) + 1)), shape = (len(keys), n_keys), copy = False)
+    columns = rows.tocsc()
+    return columns.indptr, columns.data
+
+
+def distinct_members(ptr, values, n_values):
+    """Drop the repeated values of each row of a compressed structure, keeping the first occurrence of each and the
+    order of the others. Repeats are found next to each other once the entries are grouped by value, with the
+    linear-time group_by when there are at least as many entries as values and with a sort by row and value
+    otherwise.
+
+    Args:
+        ptr (np.ndarray): The row offsets of the structure.
+        values (np.ndarray): The values of every row, concatenated, in [0, n_values).
+        n_values (int): The number of possible values.
+
+    Returns:
+        tuple: (ptr, values) without repeats, the arrays given when there are none.
+    """
+    values = np.asarray(values)
+    lengths = np.diff(ptr)
+    owners = np.repeat(np.arange(len(lengths)), lengths)
+    if (len(values) >= n_values):
+        value_ptr, order = group_by(values, np.arange(len(values)), n_values)
+        starts = value_ptr[1:-1]
+    else:
+        order = np.lexsort((values, owners))
+        sorted_values = values[order]
+        starts = np.flatnonzero(sorted_values[1:] != sorted_values[:-1]) + 1
+    #Grouping is stable, so within a group of equal values the first occurrence in a row comes first
+    grouped = owners[order]
+    same = grouped[1:] == grouped[:-1]
+    same[starts[(starts > 0) & (starts < len(values))] - 1] = False
+    if (not same.any()):
+        return ptr, values
+    repeated = np.zeros(len(values), dtype = bool)
+    repeated[order[1:][same]] = True
+    kept = ~repeated
+    distinct_ptr = np.zeros(len(lengths) + 1, dtype = np.int64)
+    np.cumsum(np.bincount(owners[kept], minlength = len(lengths)), out = distinct_ptr[1:])
+    return distinct_ptr, values[kept]
+
+
+def neighbor_matrix(csr, csc, vertices):
+    """Find the neighbours of many vertices at once with the sparse product H[vertices] H^T.
+
+    Args:
+        csr (scipy.sparse.csr_matrix): The vertex x hyperedge incidence matrix H.
+        csc (scipy.sparse.csc_matrix): The same matrix in CSC form.
+        vertices (array_like): The ids of the vertices.
+
+    Returns:
+        scipy.sparse.csr_matrix: A len(vertices) x number of vertices matrix whose row k holds the sorted
+            neighbours of vertices[k], each with the number of hyperedges it shares with vertices[k].
+    """
+    vertices = np.asarray(vertices, dtype = np.int64).ravel()
+    shared = (csr[vertices] @ csc.T).tocsr()
+    #Drop each vertex from its own row
+    rows = np.repeat(np.arange(len(vertices)), np.diff(shared.indptr))
+    keep = shared.indices != vertices[rows]
+    indptr = np.zeros(len(vertices) + 1, dtype = shared.indptr.dtype)
+    np.cumsum(np.bincount(rows[keep], minlength = len(vertices)), out = indptr[1:])
+    neighbors = sparse.csr_matrix((shared.data[keep], shared.indices[keep], indptr), shape = shared.shape)
+    neighbors.sort_indices()
+    return neighbors
+
+
+class Incidence:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, hyperedge_ptr, hyperedge_vertices, n_vertices, vertex_ptr = None, vertex_hyperedges = None,
+                 removed = None):
+        """Constructor for Incidence class. The incidence of a hypergraph is a sparse vertex x hyperedge matrix whose
+        columns, the vertex ids of each hyperedge, are stored as the rows of a RowPool. While nothing changes the
+        pool is plain CSC: the vertices of hyperedge j are hyperedge_vertices[hyperedge_ptr[j]:hyperedge_ptr[j + 1]].
+        The inverted, vertex-major index (the CSR view: the hyperedge ids of each vertex) is a second RowPool, built
+        from the first the first time it is needed and then updated in place by every mutation.
+
+        Hyperedges are added and removed in batches at amortized O(1) per membership. A removed hyperedge keeps its
+        id as an empty, tombstoned column until compact renumbers the hyperedges.
+
+        Args:
+            hyperedge_ptr (np.ndarray): Offsets into hyperedge_vertices, one more than the number of hyperedges.
+            hyperedge_vertices (np.ndarray): The vertex ids of every hyperedge, concatenated.
+            n_vertices (int): The number of vertices of the hypergraph.
+            vertex_ptr (np.ndarray, optional): Offsets into vertex_hyperedges, one more than the number of vertices.
+                Defaults to None, in which case the inverted index is built when first needed.
+            vertex_hyperedges (np.ndarray, optional): The sorted hyperedge ids of every vertex, concatenated. Must be
+                given together with vertex_ptr.
+            removed (np.ndarray, optional): Whether each hyperedge has been removed. Defaults to None for none.
+        """
+        dtype = index_dtype(max(n_vertices, len(hyperedge_ptr), len(hyperedge_vertices)))
+        self.__n_vertices = int(n_vertices)
+        self.__hyperedges = RowPool(hyperedge_ptr, hyperedge_vertices, dtype)
+        self.__vertices = None if (vertex_ptr is None) else RowPool(vertex_ptr, vertex_hyperedges, dtype,
+                                                                    sorted_rows = True)
+        #The removal flags are only allocated once a hyperedge is removed
+        self.__removed = None if (removed is None) else GrowableArray(bool, removed)
+        self.__n_removed = 0 if (removed is None) else int(np.count_nonzero(removed))
+        self.__invalidate()
+
+    #=========================METHODS===============================
+    def hyperedge_vertices(self, index):
+        """Access the vertex ids of a hyperedge.
+
+        Args:
+            index (int): The id of the hyperedge.
+
+        Returns:
+            np.ndarray: The ids of the vertices contained in the hyperedge, in the order they were given. This is a
+                view onto the storage and must not be modified.
+        """
+        return self.__hyperedges.row(index)
+
+    def set_hyperedge_vertices(self, index, vertices):
+        """Replace the vertex ids of a hyperedge. The hyperedge is rewritten in place when it does not grow, and the
+        inverted index only touches the rows of its old and new vertices.
+
+        Args:
+            index (int): The id of the hyperedge.
+            vertices (array_like): The ids of the vertices the hyperedge should contain.
+        """
+        vertices = np.asarray(vertices, dtype = np.int64).ravel()
+        if (self.__vertices is not None):
+            old = np.unique(self.__hyperedges.row(index))
+            self.__vertices.remove_entries(old, np.full(len(old), index))
+            self.__vertices.extend_rows(vertices, np.full(len(vertices), index))
+        self.__hyperedges.replace_row(index, vertices)
+        self.__invalidate()
+
+    def add_vertices(self, count):
+        """Add isolated vertices after the existing ones.
+
+        Args:
+            count (int): The number of vertices to add.
+
+        Returns:
+            np.ndarray: The ids of the new vertices.
+        """
+        first = self.__n_vertices
+        self.__n_vertices += int(count)
+        self.__widen()
+        if (self.__vertices is not None):
+            self.__vertices.append_rows(np.zeros(count + 1, dtype = np.int64), [])
+        self.__invalidate()
+        return np.arange(first, self.__n_vertices)
+
+    def add_hyperedges(self, hyperedge_ptr, hyperedge_vertices):
+        """Add hyperedges after the existing ones.
+
+        Args:
+            hyperedge_ptr (np.ndarray): Offsets into hyperedge_vertices, one more than the number of new hyperedges.
+            hyperedge_vertices (np.ndarray): The vertex ids of every new hyperedge, concatenated.
+
+        Returns:
+            np.ndarray: The ids of the new hyperedges.
+        """
+        hyperedge_ptr = np.asarray(hyperedge_ptr, dtype = np.int64)
+        first = self.number_of_hyperedges()
+        ids = np.arange(first, first + len(hyperedge_ptr) - 1)
+        if (self.__removed is not None):
+            self.__removed.append(np.zeros(len(ids), dtype = bool))
+        self.__hyperedges.append_rows(hyperedge_ptr, hyperedge_vertices)
+        self.__widen()
+        if (self.__vertices is not None):
+            self.__vertices.extend_rows(hyperedge_vertices, np.repeat(ids, np.diff(hyperedge_ptr)))
+        self.__invalidate()
+        return ids
+
+    def remove_hyperedges(self, indices):
+        """Remove hyperedges. Their memberships are deleted but their ids stay allocated, as empty hyperedges flagged
+        as removed, until compact is called.
+
+        Args:
+            indices (np.ndarray): The ids of the hyperedges to remove. Already removed hyperedges are ignored.
+        """
+        indices = np.unique(np.asarray(indices, dtype = np.int64))
+        if (self.__removed is None):
+            self.__removed = GrowableArray(bool, np.zeros(self.number_of_hyperedges(), dtype = bool))
+        indices = indices[~self.__removed.view()[indices]]
+        if (self.__vertices is not None):
+            ptr, members = self.__hyperedges.gather(indices)
+            self.__vertices.remove_entries(members, np.repeat(indices, np.diff(ptr)))
+        self.__hyperedges.clear_rows(indices)
+        self.__removed.view()[indices] = True
+        self.__n_removed += len(indices)
+        self.__invalidate()
+
+    def compact(self):
+        """Drop the removed hyperedges for good, renumbering the others in order.
+
+        Returns:
+            np.ndarray: The new id of every old hyperedge id, -1 for the removed ones.
+        """
+        kept = np.flatnonzero(~self.removed_hyperedges())
+        renumbering = np.full(self.number_of_hyperedges(), -1, dtype = np.int64)
+        renumbering[kept] = np.arange(len(kept))
+        hyperedge_ptr, hyperedge_vertices = self.__hyperedges.gather(kept)
+        self.__hyperedges = RowPool(hyperedge_ptr, hyperedge_vertices, self.__hyperedges.dtype())
+        self.__removed = None
+        self.__n_removed = 0
+        #Hyperedge ids all change, so the inverted index is rebuilt from scratch when next needed
+        self.__vertices = None
+        self.__invalidate()
+        return renumbering
+
+    def vertex_hyperedges(self, index):
+        """Access the ids of the hyperedges containing a vertex, using the inverted index.
+
+        Args:
+            index (int): The id of the vertex.
+
+        Returns:
+            np.ndarray: The sorted ids of the hyperedges containing the vertex. This may be a view onto the storage
+                and must not be modified.
+        """
+        vertices = self.__vertex_pool()
+        if vertices.is_sorted():
+            return vertices.row(index)
+        #Rows patched since the index was last built are appended to out of order
+        return np.sort(vertices.row(index))
+
+    def vertex_degrees(self):
+        """Access the degree of every vertex.
+
+        Returns:
+            np.ndarray: The number of hyperedges containing each vertex, by vertex id.
+        """
+        return self.__vertex_pool().lengths()
+
+    def hyperedge_sizes(self):
+        """Access the size of every hyperedge.
+
+        Returns:
+            np.ndarray: The number of vertices contained in each hyperedge, by hyperedge id.
+        """
+        return self.__hyperedges.lengths()
+
+    def vertex_neighbors(self, index):
+        """Find the neighbours of a vertex: every other vertex sharing at least one hyperedge with it. The incident
+        hyperedges are read from the vertex-major index and their members deduplicated with a sorted unique.
+
+        Args:
+            index (int): The id of the vertex.
+
+        Returns:
+            np.ndarray: The sorted ids of the neighbours of the vertex.
+        """
+        _, members = self.__hyperedges.gather(self.__vertex_pool().row(index))
+        neighbors = np.unique(members)
+        return neighbors[neighbors != index]
+
+    def neighbor_matrix(self, vertices):
+        """Find the neighbours of many vertices at once with the sparse product H[vertices] H^T.
+
+        Args:
+            vertices (array_like): The ids of the vertices.
+
+        Returns:
+            scipy.sparse.csr_matrix: A len(vertices) x number of vertices matrix whose row k holds the sorted
+                neighbours of vertices[k], each with the number of hyperedges it shares with vertices[k].
+        """
+        return neighbor_matrix(self.csr(), self.csc(), vertices)
+
+    def csc(self):
+        """Access the hyperedge-major (CSC) view of the vertex x hyperedge incidence matrix. The matrix shares its
+        index arrays with the storage, stays valid until the next mutation and must not be modified.
+
+        Returns:
+            scipy.sparse.csc_matrix: The incidence matrix, with a 1 wherever a vertex belongs to a hyperedge.
+        """
+        if (self.__csc is None):
+            hyperedge_ptr, hyperedge_vertices = self.hyperedge_arrays()
+            data = np.ones(len(hyperedge_vertices))
+            self.__csc = sparse.csc_matrix((data, hyperedge_vertices, hyperedge_ptr), shape = self.shape(), copy = False)
+        return self.__csc
+
+    def csr(self):
+        """Access the vertex-major (CSR) view of the vertex x hyperedge incidence matrix. The matrix shares its index
+        arrays with the inverted index, stays valid until the next mutation and must not be modified.
+
+        Returns:
+            scipy.sparse.csr_matrix: The incidence matrix, with the hyperedge ids of each row sorted.
+        """
+        if (self.__csr is None):
+            vertex_ptr, vertex_hyperedges = self.vertex_arrays()
+            data = np.ones(len(vertex_hyperedges))
+            self.__csr = sparse.csr_matrix((data, vertex_hyperedges, vertex_ptr), shape = self.shape(), copy = False)
+        return self.__csr
+
+    def hyperedge_arrays(self):
+        """Access the raw hyperedge-major arrays of the incidence, compacting the storage first if it has changed.
+
+        Returns:
+            tuple: (hyperedge_ptr, hyperedge_vertices) as views onto the storage that stay valid until the next
+                mutation and must not be modified.
+        """
+        return self.__hyperedges.arrays()
+
+    def vertex_arrays(self):
+        """Access the raw vertex-major arrays of the incidence (the inverted index), rebuilding them if entries were
+        added to them since they were last built, which leaves rows unsorted.
+
+        Returns:
+            tuple: (vertex_ptr, vertex_hyperedges) as views onto the storage that stay valid until the next mutation
+                and must not be modified.
+        """
+        vertices = self.__vertex_pool()
+        if (not vertices.is_sorted()):
+            vertices = self.__build_vertex_index()
+        return vertices.arrays()
+
+    def __vertex_pool(self):
+        """Access the inverted index, building it if needed.
+
+        Returns:
+            RowPool: The hyperedge ids of every vertex.
+        """
+        if (self.__vertices is None):
+            return self.__build_vertex_index()
+        return self.__vertices
+
+    def __build_vertex_index(self):
+        """Build the inverted index by a stable grouping of the memberships by vertex id, which leaves the hyperedge
+        ids of each vertex sorted. Also used to compact it, since patched rows are no longer sorted.
+
+        Returns:
+            RowPool: The new inverted index.
+        """
+        hyperedge_ptr, hyperedge_vertices = self.hyperedge_arrays()
+        dtype = hyperedge_vertices.dtype
+        hyperedges = np.repeat(np.arange(self.number_of_hyperedges(), dtype = dtype), np.diff(hyperedge_ptr))
+        vertex_ptr, vertex_hyperedges = group_by(hyperedge_vertices, hyperedges, self.__n_vertices)
+        self.__vertices = RowPool(vertex_ptr, vertex_hyperedges, dtype, sorted_rows = True)
+        return self.__vertices
+
+    def __widen(self):
+        """Switch the storage to 64-bit ids once the ids or offsets outgrow 32 bits."""
+        dtype = index_dtype(max(self.__n_vertices, self.number_of_hyperedges() + 1,
+                                self.__hyperedges.number_of_entries() + 1))
+        self.__hyperedges.widen(dtype)
+        if (self.__vertices is not None):
+            self.__vertices.widen(dtype)
+
+    def __invalidate(self):
+        """Drop the cached matrix views after the incidence has changed. The inverted index itself is kept up to
+        date by the mutators."""
+        self.__csc = None
+        self.__csr = None
+
+    #=========================GETTERS AND SETTERS=========================
+    def number_of_vertices(self):
+        """Access the number of vertices.
+
+        Returns:
+            int: The number of vertices (rows) of the incidence.
+        """
+        return self.__n_vertices
+
+    def number_of_hyperedges(self):
+        """Access the number of hyperedges, removed hyperedges that have not been compacted away included.
+
+        Returns:
+            int: The number of hyperedges (columns) of the incidence.
+        """
+        return len(self.__hyperedges)
+
+    def number_of_removed_hyperedges(self):
+        """Access the number of removed hyperedges that still hold an id.
+
+        Returns:
+            int: The number of removed hyperedges.
+        """
+        return self.__n_removed
+
+    def removed_hyperedges(self):
+        """Access the removal flag of every hyperedge.
+
+        Returns:
+            np.ndarray: Whether each hyperedge has been removed, by hyperedge id. This is a view onto the storage,
+                or a read-only array broadcast from False before any hyperedge is removed, and must not be modified.
+        """
+        if (self.__removed is None):
+            return np.broadcast_to(False, self.number_of_hyperedges())
+        return self.__removed.view()
+
+    def number_of_memberships(self):
+        """Access the number of (vertex, hyperedge) memberships.
+
+        Returns:
+            int: The number of stored entries of the incidence.
+        """
+        return self.__hyperedges.number_of_entries()
+
+    def shape(self):
+        """Access the shape of the incidence matrix.
+
+        Returns:
+            tuple: (number of vertices, number of hyperedges).
+        """
+        return (self.number_of_vertices(), self.number_of_hyperedges())
@@ -0,0 +1,310 @@
+import numpy as np
+from bisect import insort
+
+class NameTable:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, names = None, size = 0):
+        """Constructor for NameTable class. A name table maps the ids of the vertices or of the hyperedges of a
+        hypergraph to their names, and names back to ids through an index that is only built when a lookup needs it.
+
+        Args:
+            names (list, optional): The name of each id. A PackedNames table, a NameSubset or an integer array is
+                kept as it is and only copied to a list when an id is renamed. Defaults to None, in which case every
+                id is its own name and nothing is stored until an id is renamed.
+            size (int, optional): The number of ids when names is None. Defaults to 0.
+        """
+        if (names is not None) and not isinstance(names, (PackedNames, NameSubset, np.ndarray)):
+            names = list(names)
+        self.__names = names
+        self.__size = int(size) if (names is None) else len(names)
+        self.__index = None
+
+    def __len__(self):
+        return self.__size
+
+    #=========================METHODS===============================
+    def find(self, name):
+        """Find the first id holding a name.
+
+        Args:
+            name (String): The name to search for.
+
+        Returns:
+            int: The smallest id with the given name. If none are found will return None.
+        """
+        ids = self.ids_named(name)
+        if (not ids):
+            return None
+        return ids[0]
+
+    def ids_named(self, name):
+        """Find every id holding a name.
+
+        Args:
+            name (String): The name to search for.
+
+        Returns:
+            list: The ids with the given name, in increasing order.
+        """
+        if (self.__names is None):
+            if isinstance(name, (int, np.integer)) and (0 <= name < self.__size):
+                return [int(name)]
+            return []
+        if isinstance(self.__names, NameSubset):
+            #Names read through from another table are looked up in its index, which follows its renamings
+            return self.__names.ids_named(name)
+        return list(self.__build_index().get(name, ()))
+
+    def extend(self, names = None, count = 0):
+        """Add ids after the existing ones.
+
+        Args:
+            names (list, optional): The names of the new ids. Defaults to None, in which case count ids are added,
+                each named by itself.
+            count (int, optional): The number of ids to add when names is None. Defaults to 0.
+        """
+        if (names is None):
+            if (self.__names is None):
+                self.__size += int(count)
+                return
+            names = range(self.__size, self.__size + int(count))
+        names = list(names)
+        self.__materialize()
+        if (self.__index is not None):
+            #New ids are larger than every existing one, so appending keeps the id lists sorted
+            for i, name in enumerate(names, start = self.__size):
+                self.__index.setdefault(name, []).append(i)
+        self.__names.extend(names)
+        self.__size += len(names)
+
+    def forget(self, ids):
+        """Stop finding ids by name, for ids that no longer stand for anything. A table in which every id is its own
+        name stores nothing to forget, so callers must still check the ids it finds.
+
+        Args:
+            ids (array_like): The ids to forget.
+        """
+        if (self.__names is None):
+            return
+        index = self.__build_index()
+        for i in ids:
+            name = self.name(i)
+            holders = index.get(name, [])
+            if i in holders:
+                holders.remove(i)
+                if (not holders):
+                    del index[name]
+
+    def take(self, ids):
+        """Build the name table of a subset of the ids, renumbered in the order given.
+
+        Args:
+            ids (np.ndarray): The ids to keep.
+
+        Returns:
+            NameTable: The names of the kept ids. Ids that were their own names keep them as integer names.
+        """
+        ids = np.asarray(ids, dtype = np.int64)
+        if (self.__names is None):
+            if np.array_equal(ids, np.arange(len(ids))):
+                return NameTable(None, len(ids))
+            return NameTable(ids)
+        if isinstance(self.__names, np.ndarray):
+            return NameTable(self.__names[ids])
+        return NameTable([self.__names[i] for i in ids])
+
+    def subset(self, ids):
+        """Build the name table of a subset of the ids, renumbered in the order given, without copying the names:
+        stored names are read through the ids until one of the subset is renamed.
+
+        Args:
+            ids (np.ndarray): The ids to keep.
+
+        Returns:
+            NameTable: The names of the kept ids, reflecting later renamings of this table.
+        """
+        ids = np.asarray(ids, dtype = np.int64)
+        if (self.__names is None) or isinstance(self.__names, np.ndarray):
+            return self.take(ids)
+        return NameTable(NameSubset(self, ids))
+
+    def __build_index(self):
+        """Build the name index if it does not exist yet.
+
+        Returns:
+            dict: Maps each name to the sorted list of ids holding it.
+        """
+        if (self.__index is None):
+            #An index over names read through from another table would miss its renamings, so they are copied
+            if isinstance(self.__names, NameSubset):
+                self.__materialize()
+            index = {}
+            for i, name in enumerate(self.names()):
+                index.setdefault(name, []).append(i)
+            self.__index = index
+        return self.__index
+
+    def __materialize(self):
+        """Turn the stored names into a list that can be modified."""
+        if (self.__names is None):
+            self.__names = list(range(self.__size))
+        elif isinstance(self.__names, np.ndarray):
+            self.__names = self.__names.tolist()
+        elif not isinstance(self.__names, list):
+            self.__names = list(self.__names)
+
+    #=========================GETTERS AND SETTERS=========================
+    def is_identity(self):
+        """Check whether every id is still its own name.
+
+        Returns:
+            bool: True if no names are stored.
+        """
+        return self.__names is None
+
+    def stored_names(self):
+        """Access the names as they are stored, without copying them.
+
+        Returns:
+            list or PackedNames or NameSubset or np.ndarray: The stored names, or None if every id is its own name.
+        """
+        return self.__names
+
+    def name(self, i):
+        """Access the name of an id.
+
+        Args:
+            i (int): The id.
+
+        Returns:
+            String: The name of the id.
+        """
+        if (self.__names is None):
+            return int(i)
+        if isinstance(self.__names, np.ndarray):
+            return self.__names[i].item()
+        return self.__names[i]
+
+    def names(self):
+        """Access every name, by id.
+
+        Returns:
+            list: The names of the ids.
+        """
+        if (self.__names is None):
+            return list(range(self.__size))
+        if isinstance(self.__names, np.ndarray):
+            return self.__names.tolist()
+        return list(self.__names)
+
+    def set_name(self, i, name):
+        """Rename an id, keeping the name index in sync. A forgotten id is renamed but still not found by name.
+
+        Args:
+            i (int): The id to rename.
+            name (String): The new name of the id.
+        """
+        self.__materialize()
+        holders = None if (self.__index is None) else self.__index.get(self.__names[i], [])
+        if (holders is not None) and (i in holders):
+            holders.remove(i)
+            if (not holders):
+                del self.__index[self.__names[i]]
+            insort(self.__index.setdefault(name, []), i)
+        self.__names[i] = name
+
+
+class PackedNames:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, offsets, blob):
+        """Constructor for PackedNames class. A read-only sequence of strings stored as one UTF-8 byte array, suited
+        to memory-mapping: name i is blob[offsets[i]:offsets[i + 1]] and is only decoded when accessed.
+
+        Args:
+            offsets (np.ndarray): Offsets into blob, one more than the number of names.
+            blob (np.ndarray): The uint8 UTF-8 encoding of every name, concatenated.
+        """
+        self.__offsets = offsets
+        self.__blob = blob
+
+    @classmethod
+    def pack(cls, names):
+        """Pack a list of strings.
+
+        Args:
+            names (list): The strings to pack.
+
+        Returns:
+            PackedNames: The packed strings.
+        """
+        encoded = [name.encode("utf-8") for name in names]
+        offsets = np.zeros(len(encoded) + 1, dtype = np.int64)
+        np.cumsum([len(name) for name in encoded], out = offsets[1:])
+        return cls(offsets, np.frombuffer(b"".join(encoded), dtype = np.uint8))
+
+    def __len__(self):
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, i):
+        return self.__blob[self.__offsets[i]:self.__offsets[i + 1]].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    #=========================GETTERS AND SETTERS=========================
+    def arrays(self):
+        """Access the packed arrays.
+
+        Returns:
+            tuple: (offsets, blob).
+        """
+        return self.__offsets, self.__blob
+
+
+class NameSubset:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, table, ids):
+        """Constructor for NameSubset class. A read-only sequence of the names of some ids, read from the name table
+        of every id on access, so that a sub-hypergraph view can be named without copying its names.
+
+        Args:
+            table (NameTable): The names of every id.
+            ids (np.ndarray): The distinct ids whose names the sequence holds, in order.
+        """
+        self.__table = table
+        self.__ids = ids
+        self.__order = None
+        self.__ordered = None
+
+    def __len__(self):
+        return len(self.__ids)
+
+    def __getitem__(self, i):
+        return self.__table.name(self.__ids[i])
+
+    def __iter__(self):
+        for i in self.__ids:
+            yield self.__table.name(i)
+
+    #=========================METHODS===============================
+    def ids_named(self, name):
+        """Find the positions in the sequence of the ids holding a name, through the name index of the table.
+
+        Args:
+            name (String): The name to search for.
+
+        Returns:
+            list: The positions holding the given name, in increasing order.
+        """
+        holders = np.asarray(self.__table.ids_named(name), dtype = np.int64)
+        if (len(holders) == 0) or (len(self.__ids) == 0):
+            return []
+        if (self.__order is None):
+            self.__order = np.argsort(self.__ids, kind = "stable")
+            self.__ordered = self.__ids[self.__order]
+        found = np.minimum(np.searchsorted(self.__ordered, holders), len(self.__ordered) - 1)
+        return np.sort(self.__order[found[self.__ordered[found] == holders]]).tolist()
@@ -0,0 +1,322 @@
+"""Readers and writers for the hypergraph formats of the hMETIS and PaToH partitioners.
+
+hMETIS (.hgr): a header line "|E| |V| [fmt]", then one line per hyperedge listing its 1-based vertex ids, preceded by
+its weight when fmt is 1 or 11, then one line per vertex holding its weight when fmt is 10 or 11. Lines starting with
+"%" are comments.
+
+PaToH: a header line "base |V| |E| pins [scheme [ncon]]" where base is the index base (0 or 1) and scheme is 0 for
+no weights, 1 for vertex weights, 2 for hyperedge costs and 3 for both. One line per hyperedge lists its vertex ids,
+preceded by its cost when the scheme has costs, and the vertex weights follow as a stream of integers. Lines starting
+with "%" are comments.
+
+Files are parsed in bulk: the whole text is tokenized into integers with NumPy operations over its bytes, without
+creating a Python object per line or per number.
+"""
+import gzip
+import numpy as np
+
+COMMENT = ord("%")
+NEWLINE = ord("\n")
+DIGIT = np.zeros(256, dtype = bool)
+DIGIT[ord("0"):ord("9") + 1] = True
+ALLOWED = DIGIT.copy()
+ALLOWED[[ord(" "), ord("\t"), ord("\r"), NEWLINE]] = True
+POWERS_OF_TEN = 10 ** np.arange(19, dtype = np.int64)
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def read_hmetis(path):
+    """Read an hMETIS hypergraph file.
+
+    Args:
+        path (String): The file to read, possibly gzip compressed.
+
+    Raises:
+        ValueError: If the file is not a valid hMETIS hypergraph.
+
+    Returns:
+        tuple: (hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights) with 0-based vertex ids. The
+            weights are None when the file has none.
+    """
+    line_ptr, values = _parse_integer_lines(_read_bytes(path))
+    header = values[line_ptr[0]:line_ptr[1]] if len(line_ptr) > 1 else values[:0]
+    if (len(header) not in (2, 3)) or ((len(header) == 3) and (header[2] not in (0, 1, 10, 11))):
+        raise ValueError("Invalid hMETIS header, expected '|E| |V| [fmt]' with fmt in 0, 1, 10, 11")
+    n_hyperedges, n_vertices = int(header[0]), int(header[1])
+    fmt = int(header[2]) if len(header) == 3 else 0
+
+    hyperedge_ptr, hyperedge_vertices, eweights = _hyperedge_lines(line_ptr, values, n_hyperedges, fmt % 10 == 1)
+    vweights = None
+    if (fmt // 10 == 1):
+        rows = line_ptr[1 + n_hyperedges:]
+        if (len(rows) != n_vertices + 1) or np.any(np.diff(rows) != 1):
+            raise ValueError("Expected one weight line for each of the {} vertices".format(n_vertices))
+        vweights = values[rows[0]:rows[-1]].astype(np.float64)
+    elif (len(line_ptr) != n_hyperedges + 2):
+        raise ValueError("Expected {} hyperedge lines".format(n_hyperedges))
+    return hyperedge_ptr, _check_vertices(hyperedge_vertices - 1, n_vertices), n_vertices, vweights, eweights
+
+
+def write_hmetis(path, hyperedge_ptr, hyperedge_vertices, n_vertices, vweights = None, eweights = None):
+    """Write an hMETIS hypergraph file.
+
+    Args:
+        path (String): The file to write.
+        hyperedge_ptr (np.ndarray): Offsets into hyperedge_vertices, one more than the number of hyperedges.
+        hyperedge_vertices (np.ndarray): The 0-based vertex ids of every hyperedge, concatenated.
+        n_vertices (int): The number of vertices.
+        vweights (np.ndarray, optional): Integral vertex weights to write. Defaults to None to write none.
+        eweights (np.ndarray, optional): Integral hyperedge weights to write. Defaults to None to write none.
+
+    Raises:
+        ValueError: If a hyperedge is empty or a weight is not an integer.
+    """
+    n_hyperedges = len(hyperedge_ptr) - 1
+    fmt = (10 if vweights is not None else 0) + (1 if eweights is not None else 0)
+    with open(path, "w") as f:
+        f.write("{} {}{}\n".format(n_hyperedges, n_vertices, " {}".format(fmt) if fmt else ""))
+        _write_hyperedge_lines(f, hyperedge_ptr, hyperedge_vertices + 1, eweights)
+        if (vweights is not None):
+            weights = _integral(vweights)
+            _write_lines(f, np.arange(len(weights) + 1), weights)
+
+
+def read_patoh(path):
+    """Read a PaToH hypergraph file.
+
+    Args:
+        path (String): The file to read, possibly gzip compressed.
+
+    Raises:
+        ValueError: If the file is not a valid PaToH hypergraph, or has several weights per vertex.
+
+    Returns:
+        tuple: (hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights) with 0-based vertex ids. The
+            weights are None when the file has none.
+    """
+    line_ptr, values = _parse_integer_lines(_read_bytes(path))
+    header = values[line_ptr[0]:line_ptr[1]] if len(line_ptr) > 1 else values[:0]
+    if (len(header) not in (4, 5, 6)) or (header[0] not in (0, 1)) or ((len(header) > 4) and
+                                                                      (header[4] not in (0, 1, 2, 3))):
+        raise ValueError("Invalid PaToH header, expected 'base |V| |E| pins [scheme [ncon]]'")
+    base, n_vertices, n_hyperedges, pins = (int(x) for x in header[:4])
+    scheme = int(header[4]) if len(header) > 4 else 0
+    ncon = int(header[5]) if len(header) > 5 else 1
+    if (ncon != 1):
+        raise ValueError("Only one weight per vertex is supported, the file has {}".format(ncon))
+
+    hyperedge_ptr, hyperedge_vertices, eweights = _hyperedge_lines(line_ptr, values, n_hyperedges, scheme in (2, 3))
+    if (len(hyperedge_vertices) != pins):
+        raise ValueError("The header announces {} pins but the hyperedges hold {}".format(pins, len(hyperedge_vertices)))
+    rest = values[line_ptr[1 + n_hyperedges]:]
+    vweights = None
+    if (scheme in (1, 3)):
+        if (len(rest) != n_vertices):
+            raise ValueError("Expected {} vertex weights, got {}".format(n_vertices, len(rest)))
+        vweights = rest.astype(np.float64)
+    elif (len(rest) != 0):
+        raise ValueError("Unexpected data after the {} hyperedge lines".format(n_hyperedges))
+    return hyperedge_ptr, _check_vertices(hyperedge_vertices - base, n_vertices), n_vertices, vweights, eweights
+
+
+def write_patoh(path, hyperedge_ptr, hyperedge_vertices, n_vertices, vweights = None, eweights = None, base = 0):
+    """Write a PaToH hypergraph file.
+
+    Args:
+        path (String): The file to write.
+        hyperedge_ptr (np.ndarray): Offsets into hyperedge_vertices, one more than the number of hyperedges.
+        hyperedge_vertices (np.ndarray): The 0-based vertex ids of every hyperedge, concatenated.
+        n_vertices (int): The number of vertices.
+        vweights (np.ndarray, optional): Integral vertex weights to write. Defaults to None to write none.
+        eweights (np.ndarray, optional): Integral hyperedge costs to write. Defaults to None to write none.
+        base (int, optional): The index base of the file, 0 or 1. Defaults to 0.
+
+    Raises:
+        ValueError: If a hyperedge is empty or a weight is not an integer.
+    """
+    n_hyperedges = len(hyperedge_ptr) - 1
+    scheme = (1 if vweights is not None else 0) + (2 if eweights is not None else 0)
+    with open(path, "w") as f:
+        f.write("{} {} {} {} {}\n".format(base, n_vertices, n_hyperedges, len(hyperedge_vertices), scheme))
+        _write_hyperedge_lines(f, hyperedge_ptr, hyperedge_vertices + base, eweights)
+        if (vweights is not None):
+            weights = _integral(vweights)
+            _write_lines(f, np.arange(0, len(weights) + 10, 10).clip(max = len(weights)), weights)
+
+
+def _read_bytes(path):
+    """Read a whole file, decompressing it if it is gzip compressed.
+
+    Args:
+        path (String): The file to read.
+
+    Returns:
+        bytes: The content of the file.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(GZIP_MAGIC):
+        data = gzip.decompress(data)
+    return data
+
+
+def _parse_integer_lines(data):
+    """Tokenize text made of non-negative integers into lines, skipping blank and comment lines. Every step is a
+    NumPy operation over the bytes of the text: digits are found with a lookup table, grouped into numbers at the
+    boundaries of digit runs, and the value of each number is a sum of its digits times powers of ten. Line numbers
+    are only computed for the first digit of each number, by binary search among the newlines.
+
+    Args:
+        data (bytes): The text.
+
+    Raises:
+        ValueError: If a non-comment line holds something other than integers and whitespace.
+
+    Returns:
+        tuple: (line_ptr, values) where values[line_ptr[k]:line_ptr[k + 1]] are the integers of the k-th non-blank,
+            non-comment line.
+    """
+    text = np.frombuffer(data, dtype = np.uint8)
+    newlines = np.flatnonzero(text == NEWLINE)
+    digit = DIGIT[text]
+    allowed = ALLOWED[text]
+
+    #Blank out the comment lines
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_starts = line_starts[line_starts < len(text)]
+    comment_starts = line_starts[text[line_starts] == COMMENT]
+    if len(comment_starts):
+        comment_ends = np.append(newlines, len(text))[np.searchsorted(newlines, comment_starts)]
+        inside = np.zeros(len(text) + 1, dtype = np.int32)
+        np.add.at(inside, comment_starts, 1)
+        np.add.at(inside, comment_ends, -1)
+        in_comment = np.cumsum(inside[:-1]) > 0
+        digit &= ~in_comment
+        allowed |= in_comment
+
+    if (not allowed.all()):
+        position = int(np.argmin(allowed))
+        raise ValueError("Unexpected character {!r} on line {}".format(
+            chr(text[position]), int(np.searchsorted(newlines, position)) + 1))
+
+    #Numbers are the runs of consecutive digit positions
+    positions = np.flatnonzero(digit)
+    starts = np.flatnonzero(np.diff(positions, prepend = -2) != 1)
+    #Text without any digit has no number to end
+    ends = np.append(starts[1:], len(positions))[:len(starts)]
+    exponent = np.repeat(ends, ends - starts) - np.arange(len(positions)) - 1
+    if len(exponent) and (exponent.max() >= len(POWERS_OF_TEN)):
+        position = positions[np.argmax(exponent)]
+        raise ValueError("Integer too large on line {}".format(int(np.searchsorted(newlines, position)) + 1))
+    digits = (text[positions] - ord("0")).astype(np.int64) * POWERS_OF_TEN[exponent]
+    values = np.add.reduceat(digits, starts) if len(starts) else np.zeros(0, dtype = np.int64)
+
+    #Group the numbers by line, dropping the lines that hold none
+    number_line = np.searchsorted(newlines, positions[starts])
+    first = np.flatnonzero(np.diff(number_line, prepend = -1) != 0)
+    return np.append(first, len(values)), values
+
+
+def _hyperedge_lines(line_ptr, values, n_hyperedges, weighted):
+    """Extract the hyperedges from the lines following the header.
+
+    Args:
+        line_ptr (np.ndarray): The line offsets returned by _parse_integer_lines.
+        values (np.ndarray): The integers returned by _parse_integer_lines.
+        n_hyperedges (int): The number of hyperedges announced by the header.
+        weighted (bool): Whether each hyperedge line starts with its weight.
+
+    Raises:
+        ValueError: If the file has fewer lines than hyperedges.
+
+    Returns:
+        tuple: (hyperedge_ptr, hyperedge_vertices, eweights) with the vertex ids as in the file and eweights None
+            unless weighted.
+    """
+    if (len(line_ptr) < n_hyperedges + 2):
+        raise ValueError("Expected {} hyperedge lines, got {}".format(n_hyperedges, len(line_ptr) - 2))
+    hyperedge_ptr = line_ptr[1:n_hyperedges + 2] - line_ptr[1]
+    hyperedge_vertices = values[line_ptr[1]:line_ptr[n_hyperedges + 1]]
+    eweights = None
+    if (weighted):
+        eweights = hyperedge_vertices[hyperedge_ptr[:-1]].astype(np.float64)
+        hyperedge_vertices = np.delete(hyperedge_vertices, hyperedge_ptr[:-1])
+        hyperedge_ptr = hyperedge_ptr - np.arange(n_hyperedges + 1)
+    return hyperedge_ptr, hyperedge_vertices, eweights
+
+
+def _check_vertices(vertices, n_vertices):
+    """Check that vertex ids are in range.
+
+    Args:
+        vertices (np.ndarray): 0-based vertex ids.
+        n_vertices (int): The number of vertices.
+
+    Raises:
+        ValueError: If an id is out of range.
+
+    Returns:
+        np.ndarray: The vertex ids.
+    """
+    if len(vertices) and ((vertices.min() < 0) or (vertices.max() >= n_vertices)):
+        raise ValueError("Vertex ids out of range for {} vertices".format(n_vertices))
+    return vertices
+
+
+def _integral(weights):
+    """Convert weights to integers for formats that only store integers.
+
+    Args:
+        weights (np.ndarray): The weights.
+
+    Raises:
+        ValueError: If a weight is not an integer.
+
+    Returns:
+        np.ndarray: The weights as int64.
+    """
+    weights = np.asarray(weights)
+    integral = np.rint(weights).astype(np.int64)
+    if np.any(integral != weights):
+        raise ValueError("Weights must be integers to be written in this format")
+    return integral
+
+
+def _write_hyperedge_lines(f, hyperedge_ptr, hyperedge_vertices, eweights):
+    """Write one line per hyperedge, optionally starting with its weight.
+
+    Args:
+        f (file): The file to write to.
+        hyperedge_ptr (np.ndarray): Offsets into hyperedge_vertices.
+        hyperedge_vertices (np.ndarray): The vertex ids to write, concatenated.
+        eweights (np.ndarray): The weights to write first on each line, or None.
+
+    Raises:
+        ValueError: If a hyperedge is empty.
+    """
+    if np.any(np.diff(hyperedge_ptr) == 0):
+        raise ValueError("Empty hyperedges cannot be written in this format")
+    if (eweights is not None):
+        hyperedge_vertices = np.insert(hyperedge_vertices, hyperedge_ptr[:-1], _integral(eweights))
+        hyperedge_ptr = hyperedge_ptr + np.arange(len(hyperedge_ptr))
+    _write_lines(f, hyperedge_ptr, hyperedge_vertices)
+
+
+def _write_lines(f, line_ptr, values, chunk_size = 1 << 20):
+    """Write rows of integers as lines of text, formatting about chunk_size numbers at a time with NumPy.
+
+    Args:
+        f (file): The file to write to.
+        line_ptr (np.ndarray): Offsets into values, one more than the number of lines.
+        values (np.ndarray): The integers of every line, concatenated.
+        chunk_size (int, optional): The number of integers formatted at a time. Defaults to 2^20.
+    """
+    first = 0
+    while (first < len(line_ptr) - 1):
+        last = max(int(np.searchsorted(line_ptr, line_ptr[first] + chunk_size, "right")) - 1, first + 1)
+        last = min(last, len(line_ptr) - 1)
+        start, stop = line_ptr[first], line_ptr[last]
+        separators = np.full(stop - start, " ")
+        separators[line_ptr[first + 1:last + 1] - start - 1] = "\n"
+        f.write("".join(np.char.add(values[start:stop].astype(str), separators).tolist()))
+        first = last
@@ -0,0 +1,82 @@
+"""PageRank on a hypergraph, for the random walk that moves from a vertex v to one of its hyperedges e with
+probability w(e) / d(v), then to a vertex of e chosen uniformly. Its transition matrix is P = Dv^-1 H W De^-1 H^T
+(see spectral for the notation), so one step of the power iteration
+
+    x <- alpha P^T x + (1 - alpha) p
+
+is two sparse products with the incidence matrix and two diagonal scalings, without building the clique expansion.
+The walk gets stuck on vertices without hyperedges of positive weight; their mass is sent back to p.
+
+Many personalization vectors are ranked at once by iterating on the matrix whose columns they are, which turns each
+step into products of the incidence matrix with a dense block.
+"""
+import numpy as np
+from scipy import sparse
+import spectral
+
+
+def pagerank(incidence, eweights, personalization = None, alpha = 0.85, tol = 1e-10, maxiter = 100):
+    """Compute the PageRank of every vertex by power iteration.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix, preferably CSR.
+        eweights (np.ndarray): The weight of each hyperedge.
+        personalization (np.ndarray, optional): The teleportation distribution p, a vector of n_vertices values or
+            an n_vertices x k matrix of k distributions. Each is scaled to sum to 1. Defaults to None for uniform.
+        alpha (float, optional): The probability of following the walk rather than teleporting. Defaults to 0.85.
+        tol (float, optional): Stop when the L1 change of every distribution falls below this value. Defaults to
+            1e-10.
+        maxiter (int, optional): The maximum number of iterations. Defaults to 100.
+
+    Raises:
+        ValueError: If alpha is not in [0, 1), or the personalization has the wrong number of rows, negative values or
+            a zero sum.
+
+    Returns:
+        np.ndarray: The stationary distribution, of the same shape as personalization (a vector if it is None).
+    """
+    if not (0 <= alpha < 1):
+        raise ValueError("alpha must lie in [0, 1), got {}".format(alpha))
+    incidence = sparse.csr_matrix(incidence)
+    n = incidence.shape[0]
+    if (personalization is None):
+        personalization = np.full(n, 1 / n) if n else np.zeros(0)
+    teleport = np.array(personalization, dtype = np.float64)
+    if (n == 0) and (len(teleport) == 0):
+        return teleport
+    vector = teleport.ndim == 1
+    teleport = teleport.reshape(len(teleport), -1)
+    if (len(teleport) != n):
+        raise ValueError("Expected {} rows of personalization, got {}".format(n, len(teleport)))
+    sums = teleport.sum(axis = 0)
+    if (teleport < 0).any() or (sums <= 0).any():
+        raise ValueError("Personalization vectors must be non-negative with a positive sum")
+    teleport /= sums
+
+    eweights = np.asarray(eweights, dtype = np.float64)
+    degrees = spectral.vertex_degrees(incidence, eweights)
+    stuck = degrees <= 0
+    vertex_scale = np.divide(1, degrees, out = np.zeros(n), where = ~stuck)[:, None]
+    sizes = spectral.hyperedge_degrees(incidence)
+    hyperedge_scale = np.divide(eweights, sizes, out = np.zeros(len(sizes)), where = sizes > 0)[:, None]
+    transposed = incidence.T.tocsr()
+
+    #alpha is folded into the hyperedge scaling, and the dense blocks are updated in place: for a batch of
+    #personalizations, passes over the n x k blocks cost as much as the sparse products
+    hyperedge_scale *= alpha
+    ranks = teleport.copy()
+    scratch = np.empty_like(ranks)
+    for _ in range(maxiter):
+        np.multiply(vertex_scale, ranks, out = scratch)
+        walked = transposed @ scratch
+        walked *= hyperedge_scale
+        walked = incidence @ walked
+        #Mass on stuck vertices goes back to the personalization, along with the teleportation
+        restart = (1 - alpha) + alpha * ranks[stuck].sum(axis = 0)
+        walked += restart * teleport
+        np.subtract(walked, ranks, out = scratch)
+        np.abs(scratch, out = scratch)
+        ranks = walked
+        if (scratch.sum(axis = 0) < tol).all():
+            break
+    return ranks[:, 0] if (vector) else ranks
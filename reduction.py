@@ -0,0 +1,187 @@
+"""Reductions of a hypergraph that merge redundant parts, computed on compressed rows of ids: the vertices of each
+hyperedge (the columns of the incidence matrix) or the hyperedges of each vertex (its rows).
+
+Identical rows are found by hashing. Every id is scrambled into a 64-bit value, and a row hashes to the sum of the
+values of its ids, computed for all rows at once as differences of one cumulative sum, which does not depend on the
+order of the ids. Rows are grouped by (length, two independent hashes), and each row is then checked entry by entry
+against the first row of its group once both are sorted, so a hash collision can never merge different rows.
+
+The toplexes (maximal hyperedges) are found level by level in order of decreasing size. A hyperedge e is contained
+in a larger hyperedge only if that hyperedge is among those of the member of e with the fewest hyperedges, so only
+the toplexes already accepted in that one list are tested, and a candidate contains e if every vertex of e is one
+of its members, checked by binary search among the sorted (hyperedge, vertex) memberships.
+"""
+import numpy as np
+from incidence_def import gather_rows
+
+_MULTIPLIERS = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F))
+
+
+def equivalence_classes(ptr, values, active = None):
+    """Group the rows of a compressed structure holding the same set of ids.
+
+    Args:
+        ptr (np.ndarray): The row offsets of the structure.
+        values (np.ndarray): The ids of every row, concatenated. Rows must not repeat an id.
+        active (np.ndarray, optional): Which rows to group. Defaults to None for all of them.
+
+    Returns:
+        tuple: (n_classes, labels) where labels holds the class of each row, -1 for inactive rows. Classes are
+            numbered from 0 in the order of their first row.
+    """
+    ptr = np.asarray(ptr, dtype = np.int64)
+    n = len(ptr) - 1
+    active = np.ones(n, dtype = bool) if (active is None) else np.asarray(active, dtype = bool)
+    rows = np.flatnonzero(active)
+    lengths = np.diff(ptr)[rows]
+    keys = [lengths.astype(np.uint64)]
+    for multiplier in _MULTIPLIERS:
+        cumulative = np.zeros(len(values) + 1, dtype = np.uint64)
+        np.cumsum(_scramble(np.asarray(values), multiplier), out = cumulative[1:])
+        keys.append(cumulative[ptr[rows + 1]] - cumulative[ptr[rows]])
+    #Sort by length, then hashes; the sort is stable, so each group is led by its first row
+    order = np.lexsort(keys[::-1])
+    keys = np.stack(keys, axis = 1)[order]
+    starts = np.ones(len(order), dtype = bool)
+    starts[1:] = (keys[1:] != keys[:-1]).any(axis = 1)
+    leaders = np.empty(len(order), dtype = np.int64)
+    leaders[order] = order[np.maximum.accumulate(np.where(starts, np.arange(len(order)), 0))]
+
+    mismatched = _mismatched(ptr, values, rows, rows[leaders])
+    if (mismatched.any()):
+        leaders[mismatched] = _exact_leaders(ptr, values, rows, mismatched)
+
+    labels = np.full(n, -1, dtype = np.int64)
+    first = leaders == np.arange(len(rows))
+    numbers = np.cumsum(first) - 1
+    labels[rows] = numbers[leaders]
+    return int(first.sum()), labels
+
+
+def toplexes(hyperedge_ptr, hyperedge_vertices, vertex_ptr, vertex_hyperedges, active = None, chunk_size = 1 << 24):
+    """Find the hyperedges contained in no other hyperedge. Of several hyperedges with the same vertices only the
+    first can be maximal, and empty hyperedges never are.
+
+    Args:
+        hyperedge_ptr (np.ndarray): The offsets of the vertices of each hyperedge.
+        hyperedge_vertices (np.ndarray): The vertex ids of every hyperedge, concatenated.
+        vertex_ptr (np.ndarray): The offsets of the hyperedges of each vertex.
+        vertex_hyperedges (np.ndarray): The hyperedge ids of every vertex, concatenated.
+        active (np.ndarray, optional): Which hyperedges to consider. Defaults to None for all of them.
+        chunk_size (int, optional): The largest number of (vertex, candidate) membership tests made at once.
+            Defaults to 1 << 24.
+
+    Returns:
+        np.ndarray: Whether each hyperedge is a toplex.
+    """
+    hyperedge_ptr = np.asarray(hyperedge_ptr, dtype = np.int64)
+    hyperedge_vertices = np.asarray(hyperedge_vertices)
+    vertex_hyperedges = np.asarray(vertex_hyperedges)
+    m = len(hyperedge_ptr) - 1
+    n = len(vertex_ptr) - 1
+    sizes = np.diff(hyperedge_ptr)
+    active = (sizes > 0) if (active is None) else (np.asarray(active, dtype = bool) & (sizes > 0))
+    _, classes = equivalence_classes(hyperedge_ptr, hyperedge_vertices, active)
+    #Keeping the first hyperedge of each class leaves distinct sets, of which only larger ones can contain another
+    distinct = np.zeros(m, dtype = bool)
+    distinct[np.flatnonzero(active)[np.unique(classes[active], return_index = True)[1]]] = True
+    memberships = np.sort(np.repeat(np.arange(m, dtype = np.int64) * n, sizes) + hyperedge_vertices)
+    degrees = np.diff(vertex_ptr)
+
+    accepted = np.zeros(m, dtype = bool)
+    order = np.flatnonzero(distinct)
+    order = order[np.argsort(-sizes[order], kind = "stable")]
+    levels = np.flatnonzero(np.diff(sizes[order], prepend = -1, append = -1))
+    for start, stop in zip(levels[:-1], levels[1:]):
+        size = sizes[order[start]]
+        level = order[start:stop]
+        members = hyperedge_vertices[gather_rows(hyperedge_ptr, level)[1]].reshape(-1, size)
+        pivots = members[np.arange(len(level)), degrees[members].argmin(axis = 1)]
+        bounds = np.concatenate(([0], np.cumsum(degrees[pivots] * size)))
+        contained = np.zeros(len(level), dtype = bool)
+        first = 0
+        while (first < len(level)):
+            last = int(np.searchsorted(bounds, bounds[first] + chunk_size, side = "right")) - 1
+            last = min(max(last, first + 1), len(level))
+            candidate_ptr, positions = gather_rows(vertex_ptr, pivots[first:last])
+            owners = np.repeat(np.arange(first, last), np.diff(candidate_ptr))
+            candidates = vertex_hyperedges[positions]
+            tested = accepted[candidates]
+            owners, candidates = owners[tested], candidates[tested]
+            keys = (candidates.astype(np.int64) * n)[:, None] + members[owners]
+            found = np.searchsorted(memberships, keys)
+            found = memberships[np.minimum(found, len(memberships) - 1)] == keys
+            contained[owners[found.all(axis = 1)]] = True
+            first = last
+        accepted[level[~contained]] = True
+    return accepted
+
+
+def _scramble(ids, multiplier):
+    """Map ids to well-spread 64-bit values with the finalizer of splitmix64.
+
+    Args:
+        ids (np.ndarray): The ids.
+        multiplier (np.uint64): An odd constant selecting one of several independent mappings.
+
+    Returns:
+        np.ndarray: The uint64 value of each id.
+    """
+    x = ids.astype(np.uint64) * multiplier
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return x
+
+
+def _mismatched(ptr, values, rows, leaders):
+    """Compare rows with the leaders of their groups, which have the same length, as sets.
+
+    Args:
+        ptr (np.ndarray): The row offsets of the structure.
+        values (np.ndarray): The ids of every row.
+        rows (np.ndarray): The rows to check.
+        leaders (np.ndarray): The leader of each row.
+
+    Returns:
+        np.ndarray: Whether each row differs from its leader.
+    """
+    differs = np.zeros(len(rows), dtype = bool)
+    #Leaders match themselves, and only the other rows of a group need checking
+    checked = np.flatnonzero(rows != leaders)
+    if (len(checked) == 0):
+        return differs
+    values = np.asarray(values)
+    out_ptr, positions = gather_rows(ptr, rows[checked])
+    _, leader_positions = gather_rows(ptr, leaders[checked])
+    #Sorting owner * span + id sorts the ids of each row with a single sort of integers
+    span = np.int64(values.max(initial = 0)) + 1
+    owners = np.repeat(np.arange(len(checked), dtype = np.int64) * span, np.diff(out_ptr))
+    row_keys = np.sort(owners + values[positions])
+    leader_keys = np.sort(owners + values[leader_positions])
+    np.logical_or.at(differs, checked[row_keys // span], row_keys != leader_keys)
+    return differs
+
+
+def _exact_leaders(ptr, values, rows, mismatched):
+    """Regroup the rows caught in a hash collision by their exact sets of ids. Collisions of two 64-bit hashes and
+    the length are so rare that this runs in Python.
+
+    Args:
+        ptr (np.ndarray): The row offsets of the structure.
+        values (np.ndarray): The ids of every row.
+        rows (np.ndarray): The rows being grouped.
+        mismatched (np.ndarray): Which of them differ from the leader of their group.
+
+    Returns:
+        np.ndarray: The position in rows of the new leader of each mismatched row.
+    """
+    leaders = {}
+    found = []
+    for k in np.flatnonzero(mismatched):
+        row = rows[k]
+        key = tuple(sorted(np.asarray(values)[ptr[row]:ptr[row + 1]].tolist()))
+        found.append(leaders.setdefault(key, k))
+    return np.array(found, dtype = np.int64)
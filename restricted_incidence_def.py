@@ -0,0 +1,222 @@
+import numpy as np
+from incidence_def import neighbor_matrix
+
+class RestrictedIncidence:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, incidence, vertex_mask = None, hyperedge_mask = None, strict = False):
+        """Constructor for RestrictedIncidence class. The restricted incidence is a read-only view of the memberships
+        of an incidence (an Incidence or another view) between a subset of its vertices and a subset of its
+        hyperedges, renumbered from 0 in the order of their ids. Only the masks and the kept ids are held; the
+        restricted CSR and CSC matrices are extracted from the parent the first time they are needed.
+
+        Args:
+            incidence (Incidence): The incidence to view.
+            vertex_mask (np.ndarray, optional): Which vertices to keep. Defaults to None to keep them all.
+            hyperedge_mask (np.ndarray, optional): Which hyperedges to keep. Defaults to None to keep the hyperedges
+                left with a vertex once restricted to the kept vertices.
+            strict (bool, optional): When hyperedge_mask is None, only keep the non-empty hyperedges whose vertices
+                are all kept. Defaults to False.
+        """
+        self.__incidence = incidence
+        kept = ~incidence.removed_hyperedges()
+        if (hyperedge_mask is not None):
+            kept &= hyperedge_mask
+        elif (vertex_mask is not None):
+            inside = incidence.csr().T @ vertex_mask.astype(np.float64)
+            kept &= (inside == incidence.hyperedge_sizes()) & (inside > 0) if (strict) else (inside > 0)
+        self.__vertex_ids = None if (vertex_mask is None) else np.flatnonzero(vertex_mask)
+        self.__hyperedge_ids = np.flatnonzero(kept)
+        self.__vertex_local = None
+        self.__hyperedge_local = None
+        self.__csr = None
+        self.__csc = None
+
+    #=========================METHODS===============================
+    def hyperedge_vertices(self, index):
+        """Access the vertex ids of a hyperedge of the view.
+
+        Args:
+            index (int): The id of the hyperedge.
+
+        Returns:
+            np.ndarray: The ids of the kept vertices of the hyperedge, in the order of the parent.
+        """
+        vertices = self.__incidence.hyperedge_vertices(self.__hyperedge_ids[index])
+        if (self.__vertex_ids is None):
+            return vertices
+        vertices = self.__local_ids()[0][vertices]
+        return vertices[vertices >= 0]
+
+    def vertex_hyperedges(self, index):
+        """Access the hyperedge ids of a vertex of the view.
+
+        Args:
+            index (int): The id of the vertex.
+
+        Returns:
+            np.ndarray: The sorted ids of the kept hyperedges containing the vertex.
+        """
+        parent = index if (self.__vertex_ids is None) else self.__vertex_ids[index]
+        hyperedges = self.__local_ids()[1][self.__incidence.vertex_hyperedges(parent)]
+        return hyperedges[hyperedges >= 0]
+
+    def vertex_degrees(self):
+        """Access the degree of every vertex of the view.
+
+        Returns:
+            np.ndarray: The number of kept hyperedges containing each vertex, by vertex id.
+        """
+        return np.diff(self.csr().indptr)
+
+    def hyperedge_sizes(self):
+        """Access the size of every hyperedge of the view.
+
+        Returns:
+            np.ndarray: The number of kept vertices contained in each hyperedge, by hyperedge id.
+        """
+        return np.diff(self.csc().indptr)
+
+    def vertex_neighbors(self, index):
+        """Find the neighbours of a vertex of the view: every other vertex sharing at least one hyperedge with it.
+
+        Args:
+            index (int): The id of the vertex.
+
+        Returns:
+            np.ndarray: The sorted ids of the neighbours of the vertex.
+        """
+        return self.neighbor_matrix([index]).indices
+
+    def neighbor_matrix(self, vertices):
+        """Find the neighbours of many vertices of the view at once with the sparse product H[vertices] H^T.
+
+        Args:
+            vertices (array_like): The ids of the vertices.
+
+        Returns:
+            scipy.sparse.csr_matrix: A len(vertices) x number of vertices matrix whose row k holds the sorted
+                neighbours of vertices[k], each with the number of hyperedges it shares with vertices[k].
+        """
+        return neighbor_matrix(self.csr(), self.csc(), vertices)
+
+    def csc(self):
+        """Access the hyperedge-major (CSC) view of the restricted incidence matrix, extracted when first needed.
+
+        Returns:
+            scipy.sparse.csc_matrix: The incidence matrix of the view, with sorted indices.
+        """
+        if (self.__csc is None):
+            self.__csc = self.csr().tocsc()
+        return self.__csc
+
+    def csr(self):
+        """Access the vertex-major (CSR) view of the restricted incidence matrix, extracted when first needed.
+
+        Returns:
+            scipy.sparse.csr_matrix: The incidence matrix of the view.
+        """
+        if (self.__csr is None):
+            csr = self.__incidence.csr()
+            if (self.__vertex_ids is not None):
+                csr = csr[self.__vertex_ids]
+            self.__csr = csr[:, self.__hyperedge_ids].tocsr()
+        return self.__csr
+
+    def hyperedge_arrays(self):
+        """Access the raw hyperedge-major arrays of the view.
+
+        Returns:
+            tuple: (hyperedge_ptr, hyperedge_vertices), which must not be modified.
+        """
+        return self.csc().indptr, self.csc().indices
+
+    def vertex_arrays(self):
+        """Access the raw vertex-major arrays of the view.
+
+        Returns:
+            tuple: (vertex_ptr, vertex_hyperedges), which must not be modified.
+        """
+        return self.csr().indptr, self.csr().indices
+
+    def __local_ids(self):
+        """Map the ids of the parent to the ids of the view, building the maps if needed.
+
+        Returns:
+            tuple: (vertex_local, hyperedge_local), the id in the view of every parent vertex and hyperedge, -1 for
+                those left out. vertex_local is None when every vertex is kept.
+        """
+        if (self.__hyperedge_local is None):
+            if (self.__vertex_ids is not None):
+                self.__vertex_local = np.full(self.__incidence.number_of_vertices(), -1, dtype = np.int64)
+                self.__vertex_local[self.__vertex_ids] = np.arange(len(self.__vertex_ids))
+            self.__hyperedge_local = np.full(self.__incidence.number_of_hyperedges(), -1, dtype = np.int64)
+            self.__hyperedge_local[self.__hyperedge_ids] = np.arange(len(self.__hyperedge_ids))
+        return self.__vertex_local, self.__hyperedge_local
+
+    #=========================GETTERS AND SETTERS=========================
+    def vertex_ids(self):
+        """Access the parent ids of the vertices of the view.
+
+        Returns:
+            np.ndarray: The parent id of each vertex, or None if every vertex is kept with its own id.
+        """
+        return self.__vertex_ids
+
+    def hyperedge_ids(self):
+        """Access the parent ids of the hyperedges of the view.
+
+        Returns:
+            np.ndarray: The parent id of each hyperedge.
+        """
+        return self.__hyperedge_ids
+
+    def number_of_vertices(self):
+        """Access the number of vertices of the view.
+
+        Returns:
+            int: The number of kept vertices.
+        """
+        if (self.__vertex_ids is None):
+            return self.__incidence.number_of_vertices()
+        return len(self.__vertex_ids)
+
+    def number_of_hyperedges(self):
+        """Access the number of hyperedges of the view.
+
+        Returns:
+            int: The number of kept hyperedges.
+        """
+        return len(self.__hyperedge_ids)
+
+    def number_of_removed_hyperedges(self):
+        """Access the number of removed hyperedges of the view, which leaves removed hyperedges out.
+
+        Returns:
+            int: 0.
+        """
+        return 0
+
+    def removed_hyperedges(self):
+        """Access the removal flag of every hyperedge of the view.
+
+        Returns:
+            np.ndarray: A read-only array of False values, by hyperedge id, broadcast from a single value.
+        """
+        return np.broadcast_to(False, self.number_of_hyperedges())
+
+    def number_of_memberships(self):
+        """Access the number of (vertex, hyperedge) memberships of the view.
+
+        Returns:
+            int: The number of entries of the restricted incidence matrix.
+        """
+        return self.csr().nnz
+
+    def shape(self):
+        """Access the shape of the restricted incidence matrix.
+
+        Returns:
+            tuple: (number of vertices, number of hyperedges).
+        """
+        return (self.number_of_vertices(), self.number_of_hyperedges())
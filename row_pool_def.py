@@ -0,0 +1,368 @@
+import numpy as np
+from growable_array_def import GrowableArray
+
+TOMBSTONE = -1
+
+
+def slot_positions(starts, lengths):
+    """Enumerate the positions of several slots of an array without a Python loop.
+
+    Args:
+        starts (np.ndarray): The first position of each slot.
+        lengths (np.ndarray): The number of positions of each slot.
+
+    Returns:
+        tuple: (out_ptr, positions) where positions[out_ptr[k]:out_ptr[k + 1]] are the positions of slot k.
+    """
+    starts = np.asarray(starts, dtype = np.int64)
+    lengths = np.asarray(lengths, dtype = np.int64)
+    out_ptr = np.zeros(len(lengths) + 1, dtype = np.int64)
+    np.cumsum(lengths, out = out_ptr[1:])
+    positions = np.arange(out_ptr[-1], dtype = np.int64) + np.repeat(starts - out_ptr[:-1], lengths)
+    return out_ptr, positions
+
+
+class RowPool:
+
+    #=========================CONSTRUCTOR=========================
+    def __init__(self, ptr, values, dtype, sorted_rows = False):
+        """Constructor for RowPool class. A row pool stores variable-length rows of non-negative integers in one
+        growable array. Until a row is changed the pool is plain CSR, held in growable offset and entry arrays (the
+        given arrays themselves when their type matches, so memory-mapped rows are not read, copied before the first
+        change made in place), and appending rows keeps it so. The first change to a row gives every row a slot
+        [start, start + capacity) of which the first length entries are used. A row grows in place while its slot has room and is moved to the end of the pool with its
+        capacity doubled otherwise; single entries are deleted by overwriting them with a tombstone. The pool is
+        compacted back to plain CSR arrays when its garbage outweighs its live entries or when the arrays are asked
+        for, so every mutation costs amortized O(1) per entry.
+
+        Compaction keeps the entries of each row in the order they were stored, so the pool also records whether its
+        rows are known to be sorted: deleting entries keeps them so, while adding or replacing entries does not.
+
+        Args:
+            ptr (np.ndarray): CSR offsets of the initial rows.
+            values (np.ndarray): The entries of the initial rows, concatenated.
+            dtype (np.dtype): The signed integer type of the entries.
+            sorted_rows (bool, optional): Whether the entries of every initial row are sorted. Defaults to False.
+        """
+        entries = np.asarray(values, dtype = dtype)
+        #Arrays of the caller are only read: they are copied before the first change made in place
+        self.__reset(np.asarray(ptr), entries, owned = not np.may_share_memory(entries, values))
+        self.__sorted = bool(sorted_rows)
+
+    def __len__(self):
+        if (self.__ptr is not None):
+            return len(self.__ptr) - 1
+        return len(self.__start)
+
+    #=========================METHODS===============================
+    def row(self, i):
+        """Access the entries of a row.
+
+        Args:
+            i (int): The row.
+
+        Returns:
+            np.ndarray: The entries of the row, in the order they were stored. Unless the pool holds tombstones this
+                is a view that is only valid until the next mutation and must not be modified.
+        """
+        if (self.__ptr is not None):
+            ptr = self.__ptr.view()
+            return self.__pool.view()[ptr[i]:ptr[i + 1]]
+        start = self.__start.view()[i]
+        entries = self.__pool.view()[start:start + self.__length.view()[i]]
+        if (self.__tombstones):
+            entries = entries[entries != TOMBSTONE]
+        return entries
+
+    def gather(self, rows):
+        """Access the entries of several rows at once.
+
+        Args:
+            rows (np.ndarray): The rows.
+
+        Returns:
+            tuple: (out_ptr, entries) where entries[out_ptr[k]:out_ptr[k + 1]] are the entries of rows[k].
+        """
+        out_ptr, positions = self.__positions(rows)
+        entries = self.__pool.view()[positions]
+        if (self.__tombstones):
+            out_ptr, entries = self.__drop_tombstones(out_ptr, entries)
+        return out_ptr, entries
+
+    def lengths(self):
+        """Count the entries of every row.
+
+        Returns:
+            np.ndarray: The number of entries of each row.
+        """
+        if (self.__ptr is not None):
+            return np.diff(self.__ptr.view()).astype(np.int64)
+        if (self.__tombstones):
+            return np.diff(self.gather(np.arange(len(self)))[0])
+        return self.__length.view().copy()
+
+    def append_rows(self, ptr, values):
+        """Add rows at the end of the pool.
+
+        Args:
+            ptr (np.ndarray): CSR offsets of the new rows, starting at 0.
+            values (np.ndarray): The entries of the new rows, concatenated.
+        """
+        ptr = np.asarray(ptr, dtype = np.int64)
+        if (self.__ptr is not None):
+            #Rows appended to a compact pool leave it compact, with offsets that may outgrow the type of the entries
+            if (int(self.__ptr.view()[-1]) + int(ptr[-1]) > np.iinfo(self.__pool.dtype()).max):
+                self.widen(np.int64)
+            self.__ptr.append(self.__ptr.view()[-1] + ptr[1:])
+        else:
+            lengths = np.diff(ptr)
+            self.__start.append(len(self.__pool) + ptr[:-1])
+            self.__length.append(lengths)
+            self.__capacity.append(lengths)
+        self.__pool.append(values)
+        self.__live += int(ptr[-1])
+        self.__sorted &= (int(ptr[-1]) == 0)
+
+    def replace_row(self, i, values):
+        """Replace the entries of a row, in place if they fit in its slot and at the end of the pool otherwise.
+
+        Args:
+            i (int): The row.
+            values (np.ndarray): The new entries of the row.
+        """
+        values = np.asarray(values, dtype = self.__pool.dtype()).ravel()
+        self.__sorted = False
+        if (self.__ptr is not None) and (len(values) == len(self.row(i))):
+            self.__own()
+            self.row(i)[:] = values
+            return
+        self.__slots()
+        old = self.__pool.view()[self.__start.view()[i]:self.__start.view()[i] + self.__length.view()[i]]
+        dead = int(np.count_nonzero(old == TOMBSTONE)) if (self.__tombstones) else 0
+        self.__tombstones -= dead
+        self.__live += len(values) - (len(old) - dead)
+        if (len(values) > self.__capacity.view()[i]):
+            self.__start.view()[i] = len(self.__pool)
+            self.__capacity.view()[i] = len(values)
+            self.__pool.append(values)
+        else:
+            start = self.__start.view()[i]
+            self.__pool.view()[start:start + len(values)] = values
+        self.__length.view()[i] = len(values)
+        self.__collect()
+
+    def extend_rows(self, rows, values):
+        """Append entries to rows. The rows without enough room are all moved at once to the end of the pool, with
+        their capacity at least doubled.
+
+        Args:
+            rows (np.ndarray): The row of each entry.
+            values (np.ndarray): The entries, appended to each row in the order given.
+        """
+        rows = np.asarray(rows, dtype = np.int64).ravel()
+        values = np.asarray(values, dtype = self.__pool.dtype()).ravel()
+        if (len(rows) == 0):
+            return
+        self.__slots()
+        self.__sorted = False
+        order = np.argsort(rows, kind = "stable")
+        rows, values = rows[order], values[order]
+        grouped, first, counts = np.unique(rows, return_index = True, return_counts = True)
+
+        length, capacity = self.__length.view(), self.__capacity.view()
+        needed = length[grouped] + counts
+        full = needed > capacity[grouped]
+        if full.any():
+            moved = grouped[full]
+            new_capacity = np.maximum(2 * capacity[moved], needed[full])
+            new_start = len(self.__pool) + np.cumsum(new_capacity) - new_capacity
+            _, old_positions = self.__positions(moved)
+            _, new_positions = slot_positions(new_start, length[moved])
+            self.__pool.append(np.full(int(new_capacity.sum()), TOMBSTONE, dtype = self.__pool.dtype()))
+            pool = self.__pool.view()
+            pool[new_positions] = pool[old_positions]
+            self.__start.view()[moved] = new_start
+            capacity[moved] = new_capacity
+
+        rank = np.arange(len(rows)) - np.repeat(first, counts)
+        self.__pool.view()[self.__start.view()[rows] + length[rows] + rank] = values
+        length[grouped] += counts
+        self.__live += len(values)
+        self.__collect()
+
+    def remove_entries(self, rows, values):
+        """Delete entries from rows by overwriting them with tombstones. Each row is read once however many of its
+        entries are deleted, so the cost is linear in the size of the rows touched and in the number of entries
+        deleted, up to a sort.
+
+        Args:
+            rows (np.ndarray): The row of each entry to delete.
+            values (np.ndarray): The entries to delete. Every occurrence of an entry in its row is deleted.
+        """
+        rows = np.asarray(rows, dtype = np.int64).ravel()
+        if (len(rows) == 0):
+            return
+        self.__slots()
+        values = np.asarray(values, dtype = np.int64).ravel()
+        #(row, entry) pairs are matched as single integer keys
+        grouped, local = np.unique(rows, return_inverse = True)
+        out_ptr, positions = self.__positions(grouped)
+        pool = self.__pool.view()
+        entries = pool[positions].astype(np.int64)
+        owners = np.repeat(np.arange(len(grouped), dtype = np.int64), np.diff(out_ptr))
+        span = max(int(entries.max(initial = 0)), int(values.max(initial = 0))) + 1
+        matched = np.isin(owners * span + entries, local * span + values) & (entries != TOMBSTONE)
+        hits = positions[matched]
+        pool[hits] = TOMBSTONE
+        self.__tombstones += len(hits)
+        self.__live -= len(hits)
+        self.__collect()
+
+    def clear_rows(self, rows):
+        """Empty rows, leaving their slots as garbage.
+
+        Args:
+            rows (np.ndarray): The rows to empty.
+        """
+        rows = np.unique(np.asarray(rows, dtype = np.int64))
+        if (len(rows) == 0):
+            return
+        self.__slots()
+        _, positions = self.__positions(rows)
+        dead = int(np.count_nonzero(self.__pool.view()[positions] == TOMBSTONE)) if (self.__tombstones) else 0
+        self.__tombstones -= dead
+        self.__live -= len(positions) - dead
+        self.__length.view()[rows] = 0
+        self.__collect()
+
+    def arrays(self):
+        """Access the rows as plain CSR arrays, compacting the pool first if needed.
+
+        Returns:
+            tuple: (ptr, values) as views onto the pool that stay valid until the next mutation and must not be
+                modified.
+        """
+        if (self.__ptr is None):
+            self.compact()
+        return self.__ptr.view(), self.__pool.view()
+
+    def compact(self):
+        """Rewrite the pool as the concatenation of the entries of its rows, in row order, without slack or
+        tombstones."""
+        self.__reset(*self.gather(np.arange(len(self))))
+
+    def widen(self, dtype):
+        """Switch the entries to a wider integer type.
+
+        Args:
+            dtype (np.dtype): The new type, ignored unless it is wider than the current one.
+        """
+        if (np.dtype(dtype).itemsize > self.__pool.dtype().itemsize):
+            self.__pool = GrowableArray(dtype, self.__pool.view())
+            self.__owned = True
+            if (self.__ptr is not None):
+                self.__ptr = GrowableArray(dtype, self.__ptr.view())
+
+    def __reset(self, ptr, values, owned = True):
+        """Replace the content of the pool by plain CSR arrays.
+
+        Args:
+            ptr (np.ndarray): CSR offsets of the rows.
+            values (np.ndarray): The entries of the rows, concatenated.
+            owned (bool, optional): Whether values may be written in place. Defaults to True.
+        """
+        self.__pool = GrowableArray(values.dtype, values)
+        self.__owned = owned
+        self.__ptr = GrowableArray(values.dtype, ptr)
+        self.__start = None
+        self.__length = None
+        self.__capacity = None
+        self.__live = len(values)
+        self.__tombstones = 0
+
+    def __slots(self):
+        """Give every row of a compact pool a slot exactly its size, before a row is changed in place."""
+        self.__own()
+        if (self.__ptr is None):
+            return
+        ptr = self.__ptr.view()
+        lengths = np.diff(ptr).astype(np.int64)
+        #The slot arrays are written in place, so none of them may share memory with ptr or with each other
+        self.__start = GrowableArray(np.int64, np.array(ptr[:-1], dtype = np.int64))
+        self.__length = GrowableArray(np.int64, lengths)
+        self.__capacity = GrowableArray(np.int64, lengths.copy())
+        self.__ptr = None
+
+    def __own(self):
+        """Copy the entries before they are first written in place if they are still the arrays of the caller."""
+        if (not self.__owned):
+            self.__pool = GrowableArray(self.__pool.dtype(), self.__pool.view().copy())
+            self.__owned = True
+
+    def __positions(self, rows):
+        """Locate the slots entries, tombstones included, of several rows.
+
+        Args:
+            rows (np.ndarray): The rows.
+
+        Returns:
+            tuple: (out_ptr, positions) as returned by slot_positions.
+        """
+        if (self.__ptr is not None):
+            ptr = self.__ptr.view()
+            return slot_positions(ptr[rows], ptr[np.asarray(rows) + 1] - ptr[rows])
+        return slot_positions(self.__start.view()[rows], self.__length.view()[rows])
+
+    @staticmethod
+    def __drop_tombstones(out_ptr, entries):
+        """Remove the tombstones from gathered rows.
+
+        Args:
+            out_ptr (np.ndarray): The offsets of the gathered rows.
+            entries (np.ndarray): The gathered entries.
+
+        Returns:
+            tuple: (out_ptr, entries) without the tombstones.
+        """
+        keep = entries != TOMBSTONE
+        kept = np.zeros(len(entries) + 1, dtype = np.int64)
+        np.cumsum(keep, out = kept[1:])
+        return kept[out_ptr], entries[keep]
+
+    def __collect(self):
+        """Compact the pool once its garbage (slack, tombstones and abandoned slots) outweighs its live entries."""
+        if (len(self.__pool) - self.__live > max(self.__live, 1 << 16)):
+            self.compact()
+
+    #=========================GETTERS AND SETTERS=========================
+    def dtype(self):
+        """Access the type of the entries.
+
+        Returns:
+            np.dtype: The type of the entries.
+        """
+        return self.__pool.dtype()
+
+    def is_sorted(self):
+        """Check whether the entries of every row are known to be sorted.
+
+        Returns:
+            bool: True if the rows were sorted when given and have only lost entries since.
+        """
+        return self.__sorted
+
+    def is_compact(self):
+        """Check whether the pool is plain CSR, so that arrays needs no compaction.
+
+        Returns:
+            bool: True if the rows are stored back to back, in row order, without slack or tombstones.
+        """
+        return self.__ptr is not None
+
+    def number_of_entries(self):
+        """Access the number of entries.
+
+        Returns:
+            int: The number of entries of all the rows.
+        """
+        return self.__live
@@ -0,0 +1,206 @@
+"""Sparse matrices of hypergraph spectral theory, built from the incidence matrix H (vertices x hyperedges) and the
+hyperedge weights W in a few vectorized sparse operations.
+
+The normalized Laplacian is the one of Zhou, Huang and Schoelkopf (2006):
+
+    L = I - Dv^-1/2 H W De^-1 H^T Dv^-1/2
+
+where Dv holds the weighted vertex degrees d(v) = sum of w(e) over the hyperedges e containing v, and De the hyperedge
+sizes. Isolated vertices and empty hyperedges have no inverse degree; it is taken as zero, so they add nothing to the
+products (an isolated vertex keeps a lone 1 on the diagonal of the normalized Laplacian).
+
+Spectral embeddings are the eigenvectors of the smallest eigenvalues of a Laplacian, found with ARPACK (eigsh) or
+LOBPCG. LOBPCG refines a whole block of vectors at once, so it can be warm-started from the embedding of a slightly
+different hypergraph, such as the same one before a batch of updates, and then converges in a few iterations.
+"""
+import numpy as np
+from scipy import sparse
+from scipy.cluster.vq import kmeans2
+from scipy.sparse.linalg import eigsh, lobpcg
+import expansion
+
+DENSE_SIZE = 256
+
+
+def vertex_degrees(incidence, eweights):
+    """Compute the weighted degree of every vertex.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix.
+        eweights (np.ndarray): The weight of each hyperedge.
+
+    Returns:
+        np.ndarray: The sum of the weights of the hyperedges containing each vertex.
+    """
+    return incidence @ np.asarray(eweights, dtype = np.float64)
+
+
+def hyperedge_degrees(incidence):
+    """Compute the degree (size) of every hyperedge.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix.
+
+    Returns:
+        np.ndarray: The number of vertices of each hyperedge.
+    """
+    return np.asarray(incidence.sum(axis = 0)).ravel()
+
+
+def zhou_laplacian(incidence, eweights):
+    """Build the normalized Laplacian of Zhou et al. The scalings are folded into the values of one copy of H, so
+    the whole operator is a single sparse product: with B = Dv^-1/2 H (W De^-1)^1/2, L = I - B B^T.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix, preferably CSR.
+        eweights (np.ndarray): The weight of each hyperedge.
+
+    Returns:
+        scipy.sparse.csr_matrix: The n_vertices x n_vertices Laplacian.
+    """
+    incidence = sparse.csr_matrix(incidence)
+    vertex_scale = _inverse(vertex_degrees(incidence, eweights), 0.5)
+    hyperedge_scale = np.sqrt(np.asarray(eweights, dtype = np.float64) * _inverse(hyperedge_degrees(incidence), 1))
+    rows = np.repeat(np.arange(incidence.shape[0]), np.diff(incidence.indptr))
+    data = incidence.data * vertex_scale[rows] * hyperedge_scale[incidence.indices]
+    scaled = sparse.csr_matrix((data, incidence.indices, incidence.indptr), shape = incidence.shape)
+    laplacian = scaled @ scaled.T.tocsr()
+    #I - B B^T in place: cheaper than a general sparse subtraction
+    laplacian.data *= -1
+    laplacian.setdiag(1 + laplacian.diagonal())
+    return laplacian
+
+
+def clique_laplacian(incidence, eweights, normalized = False):
+    """Build the Laplacian of the clique expansion (see expansion.clique_expansion), in which two vertices are joined
+    by the total weight of the hyperedges they share.
+
+    Args:
+        incidence (scipy.sparse.spmatrix): The vertex x hyperedge incidence matrix, preferably CSR.
+        eweights (np.ndarray): The weight of each hyperedge.
+        normalized (bool, optional): Return the symmetric normalized Laplacian I - D^-1/2 A D^-1/2 instead of
+            D - A. Defaults to False.
+
+    Returns:
+        scipy.sparse.csr_matrix: The n_vertices x n_vertices Laplacian.
+    """
+    adjacency = expansion.clique_expansion(incidence, eweights)
+    degrees = np.asarray(adjacency.sum(axis = 1)).ravel()
+    n = adjacency.shape[0]
+    if (normalized):
+        scale = sparse.diags(_inverse(degrees, 0.5))
+        return (sparse.identity(n, format = "csr") - scale @ adjacency @ scale).tocsr()
+    return (sparse.diags(degrees) - adjacency).tocsr()
+
+
+def smallest_eigenpairs(matrix, k, initial = None, method = None, tol = None, maxiter = None, seed = None):
+    """Find the k smallest eigenvalues of a sparse symmetric matrix and their eigenvectors.
+
+    Args:
+        matrix (scipy.sparse.spmatrix): The symmetric matrix, typically a Laplacian.
+        k (int): The number of eigenpairs.
+        initial (np.ndarray, optional): Approximate eigenvectors to start from, one per column, for instance those of a
+            previous call. Rows missing at the end (vertices added since) and missing columns are filled with random
+            values, extra columns are dropped. Defaults to None to start from random vectors.
+        method (String, optional): "eigsh", "lobpcg" or "dense". Defaults to None, which picks "lobpcg" when initial
+            is given, "eigsh" otherwise, and "dense" whatever the choice for matrices of at most DENSE_SIZE rows.
+        tol (float, optional): The convergence tolerance. Defaults to None for the solver default.
+        maxiter (int, optional): The maximum number of iterations. Defaults to None for the solver default, and 200
+            for LOBPCG.
+        seed (int, optional): Seed of the random start vectors. Defaults to None.
+
+    Raises:
+        ValueError: If k is not smaller than the size of the matrix, initial has too many rows, or the method is
+            unknown.
+
+    Returns:
+        tuple: (eigenvalues, eigenvectors) with the eigenvalues in increasing order and the eigenvectors as the
+            columns of an n x k array.
+    """
+    n = matrix.shape[0]
+    if not (0 < k < n):
+        raise ValueError("Expected 0 < k < {}, got {}".format(n, k))
+    rng = np.random.default_rng(seed)
+    if (initial is not None):
+        initial = _start_block(initial, n, k, rng)
+    if (method is None):
+        method = "lobpcg" if (initial is not None) else "eigsh"
+    if (n <= DENSE_SIZE):
+        method = "dense"
+
+    if (method == "dense"):
+        values, vectors = np.linalg.eigh(matrix.toarray())
+        values, vectors = values[:k], vectors[:, :k]
+    elif (method == "eigsh"):
+        #ARPACK only takes one start vector: combine the columns of the warm start
+        v0 = initial.sum(axis = 1) if (initial is not None) else rng.uniform(-1, 1, n)
+        values, vectors = eigsh(matrix, k = k, which = "SA", v0 = v0, tol = 0 if (tol is None) else tol,
+                                maxiter = maxiter)
+    elif (method == "lobpcg"):
+        start = initial if (initial is not None) else rng.standard_normal((n, k))
+        values, vectors = lobpcg(matrix, start, tol = tol, maxiter = 200 if (maxiter is None) else maxiter,
+                                 largest = False)
+    else:
+        raise ValueError("Unknown eigensolver {!r}, expected 'eigsh', 'lobpcg' or 'dense'".format(method))
+    order = np.argsort(values)
+    return values[order], vectors[:, order]
+
+
+def kmeans(points, n_clusters, seed = None):
+    """Cluster the rows of a spectral embedding with k-means (k-means++ seeding), after scaling each row to unit
+    length as in the spectral clustering of Ng, Jordan and Weiss.
+
+    Args:
+        points (np.ndarray): The n x k embedding.
+        n_clusters (int): The number of clusters.
+        seed (int, optional): Seed of the k-means++ initialization. Defaults to None.
+
+    Returns:
+        np.ndarray: The cluster of each row, in [0, n_clusters).
+    """
+    points = np.asarray(points, dtype = np.float64)
+    norms = np.linalg.norm(points, axis = 1, keepdims = True)
+    points = np.divide(points, norms, out = np.zeros_like(points), where = norms > 0)
+    _, labels = kmeans2(points, n_clusters, minit = "++", seed = np.random.default_rng(seed))
+    return labels
+
+
+def _start_block(initial, n, k, rng):
+    """Shape a warm start into an n x k block, padding it with random values.
+
+    Args:
+        initial (np.ndarray): The approximate eigenvectors, one per column.
+        n (int): The size of the matrix.
+        k (int): The number of eigenvectors wanted.
+        rng (np.random.Generator): The source of the padding values.
+
+    Raises:
+        ValueError: If initial has more than n rows.
+
+    Returns:
+        np.ndarray: The n x k start block.
+    """
+    initial = np.asarray(initial, dtype = np.float64).reshape(len(initial), -1)
+    if (len(initial) > n):
+        raise ValueError("The warm start has {} rows for a matrix of size {}".format(len(initial), n))
+    block = rng.standard_normal((n, k)) * 1e-3
+    columns = min(k, initial.shape[1])
+    block[:len(initial), :columns] = initial[:, :columns]
+    return block
+
+
+def _inverse(degrees, power):
+    """Raise degrees to a negative power, leaving zero degrees at zero.
+
+    Args:
+        degrees (np.ndarray): The degrees.
+        power (float): The power p of degrees^-p.
+
+    Returns:
+        np.ndarray: degrees^-power where degrees are positive, 0 elsewhere.
+    """
+    degrees = np.asarray(degrees, dtype = np.float64)
+    inverse = np.zeros_like(degrees)
+    positive = degrees > 0
+    inverse[positive] = degrees[positive] ** -power
+    return inverse
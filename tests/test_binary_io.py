@@ -0,0 +1,87 @@
+"""Behaviour checks for saving hypergraphs in the binary format and opening them again, mapped or read.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from hypergraph_def import Hypergraph
+
+
+def snapshot(hype):
+    """Read everything a file should preserve through the public interface of a hypergraph."""
+    n, m = hype.number_of_vertices(), hype.number_of_hyperedges()
+    return {
+        "name": hype.name(),
+        "shape": (n, m),
+        "csc": hype.incidence_matrix("csc").toarray().tolist(),
+        "incident": [[e.index() for e in hype.incident_edges(hype.vertex(i))] for i in range(n)],
+        "removed": np.asarray(hype.removed_hyperedges()).tolist(),
+        "vweights": np.asarray(hype.vertex_weights()).tolist(),
+        "eweights": np.asarray(hype.hyperedge_weights()).tolist(),
+        "vnames": [hype.vertex(i).name() for i in range(n)],
+        "enames": [hype.hyperedge(j).name() for j in range(m) if (not hype.removed_hyperedges()[j])],
+        "found": [hype.get_vertex_by_name(hype.vertex(i).name()).index() for i in range(n)],
+    }
+
+
+def random_hypergraph(rng, names):
+    n, m = int(rng.integers(1, 20)), int(rng.integers(1, 20))
+    memberships = rng.integers(0, 2, (n, m)).astype(bool)
+    vertex_ids, edge_ids = np.nonzero(memberships)
+    vnames = enames = None
+    if (names == "strings"):
+        vnames = ["v{}".format(i % 7) for i in range(n)]
+        enames = ["é{}".format(j) for j in range(m)]
+    elif (names == "integers"):
+        vnames, enames = (rng.permutation(n) * 3).tolist(), (rng.permutation(m) + 100).tolist()
+    hype = Hypergraph.from_coo(vertex_ids, edge_ids, vweights = rng.random(n), eweights = rng.random(m),
+                               vnames = vnames, enames = enames, shape = (n, m), name = "h{}".format(names))
+    if (m > 2) and rng.integers(0, 2):
+        #Removing fewer than half of the hyperedges keeps their ids, and the removal flags are saved
+        hype.remove_hyperedges(rng.choice(m, (m - 1) // 2, replace = False))
+    return hype
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("names", ["ids", "strings", "integers"])
+def test_save_and_load_round_trip(tmp_path, mmap, names):
+    rng = np.random.default_rng(len(names) + mmap)
+    path = str(tmp_path / "h.hyp")
+    for _ in range(20):
+        hype = random_hypergraph(rng, names)
+        hype.save(path)
+        assert snapshot(Hypergraph.load(path, mmap = mmap)) == snapshot(hype)
+
+
+def test_changes_to_a_mapped_hypergraph_stay_private(tmp_path):
+    path = str(tmp_path / "h.hyp")
+    hype = Hypergraph([["a", "b"], ["b", "c"]], ["a", "b", "c"], ["e0", "e1"])
+    hype.save(path)
+    expected = snapshot(hype)
+    loaded = Hypergraph.load(path)
+    loaded.hyperedge(0).set_vertices([loaded.vertex(2), loaded.vertex(0)])
+    loaded.vertex(1).set_name("z")
+    loaded.remove_hyperedges([1])
+    assert snapshot(Hypergraph.load(path)) == expected
+
+
+def test_views_are_saved_as_their_own_hypergraph(tmp_path):
+    path = str(tmp_path / "h.hyp")
+    hype = Hypergraph([["a", "b"], ["b", "c"], ["c", "d"]], ["a", "b", "c", "d"], ["e0", "e1", "e2"])
+    view = hype.restrict_to_vertices([hype.vertex(1), hype.vertex(2), hype.vertex(3)])
+    view.save(path)
+    assert snapshot(Hypergraph.load(path)) == snapshot(view.materialize())
+
+
+def test_rejects_what_the_format_cannot_hold(tmp_path):
+    path = str(tmp_path / "h.hyp")
+    with open(path, "wb") as f:
+        f.write(b"not a hypergraph")
+    with pytest.raises(ValueError):
+        Hypergraph.load(path)
+    with pytest.raises(ValueError):
+        Hypergraph([["a", 1]], ["a", 1], ["e"]).save(path)
@@ -0,0 +1,40 @@
+"""Behaviour checks for NameTable lookups through views and renamings of the hypergraphs they name.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from hypergraph_def import Hypergraph
+from name_table_def import NameTable
+
+
+def test_subset_finds_names_renamed_in_its_table():
+    table = NameTable(["a", "b", "c", "b"])
+    subset = table.subset([3, 1, 2])
+    assert subset.find("b") == 0 and subset.find("a") is None
+    table.set_name(3, "zz")
+    assert (subset.find("zz"), subset.find("b"), subset.find("c")) == (0, 1, 2)
+    subset.set_name(2, "q")
+    assert (subset.find("q"), subset.find("c"), table.find("c")) == (2, None, 2)
+
+
+def test_view_finds_vertices_renamed_in_its_parent():
+    hype = Hypergraph([["a", "b"], ["b", "c"], ["c", "d"]], ["a", "b", "c", "d"], ["e0", "e1", "e2"])
+    view = hype.restrict_to_vertices([hype.vertex(1), hype.vertex(2), hype.vertex(3)])
+    assert view.get_vertex_by_name("c").index() == 1
+    hype.vertex(2).set_name("zz")
+    assert view.get_vertex_by_name("zz").index() == 1
+    assert view.get_vertex_by_name("c") is None
+
+
+def test_dual_renames_vertices_of_removed_hyperedges():
+    hype = Hypergraph([["a", "b"], ["b", "c"], ["c", "d"]], ["a", "b", "c", "d"], ["e0", "e1", "e2"])
+    hype.get_vertex_by_name("a")
+    hype.remove_hyperedges([hype.hyperedge(2)])
+    dual = hype.dual()
+    dual.vertex(2).set_name("e9")
+    dual.vertex(0).set_name("e8")
+    assert dual.get_vertex_by_name("e2") is None and dual.get_vertex_by_name("e9") is None
+    assert dual.get_vertex_by_name("e8").index() == 0
@@ -0,0 +1,134 @@
+"""Behaviour checks for the hMETIS and PaToH readers and writers: the bulk tokenizer against a line-by-line
+reference, round trips through every weight format, and malformed files.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+import gzip
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+import partitioner_io
+
+
+def reference_lines(text):
+    """Tokenize text line by line with str.split, skipping blank and comment lines."""
+    return [[int(token) for token in line.split()] for line in text.split("\n")
+            if (not line.startswith("%")) and line.split()]
+
+
+def random_text(rng):
+    """Build a text of integer lines mixed with blank lines, comments, tabs and CRLF line ends."""
+    lines = []
+    for _ in range(rng.integers(0, 30)):
+        kind = rng.integers(0, 5)
+        if (kind == 0):
+            lines.append(rng.choice(["", " ", "\t", "\r"]))
+        elif (kind == 1):
+            lines.append("%" + rng.choice([" comment 12 x", "", "%% 3 4", "\t-7 é"]))
+        else:
+            numbers = [str(x) for x in rng.integers(0, 10 ** rng.integers(1, 19), rng.integers(1, 8))]
+            separators = rng.choice([" ", "  ", "\t", " \t"], len(numbers) + 1)
+            lines.append("".join(s + x for s, x in zip(separators, numbers)) + separators[-1])
+    ending = rng.choice(["\n", "\r\n"])
+    return ending.join(lines) + (ending if rng.integers(0, 2) else "")
+
+
+def test_tokenizer_matches_reference():
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        text = random_text(rng)
+        line_ptr, values = partitioner_io._parse_integer_lines(text.encode("utf-8"))
+        lines = [values[line_ptr[k]:line_ptr[k + 1]].tolist() for k in range(len(line_ptr) - 1)]
+        assert lines == reference_lines(text), repr(text)
+
+
+@pytest.mark.parametrize("text, line", [("1 2\n3 x 4\n", 2), ("1 -2\n", 1), ("% ok\r\n 5 %\n", 2), ("1.5\n", 1),
+                                        ("1\n2\n" + "9" * 20 + "\n", 3)])
+def test_tokenizer_rejects_malformed_lines(text, line):
+    with pytest.raises(ValueError, match = "line {}".format(line)):
+        partitioner_io._parse_integer_lines(text.encode("utf-8"))
+
+
+def random_hypergraph(rng):
+    """Draw a hypergraph without empty hyperedges, with integral weights."""
+    n_vertices = int(rng.integers(1, 30))
+    sizes = rng.integers(1, n_vertices + 1, rng.integers(0, 20))
+    hyperedge_ptr = np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+    hyperedge_vertices = np.concatenate([rng.choice(n_vertices, size, replace = False) for size in sizes] +
+                                        [np.zeros(0, dtype = np.int64)]).astype(np.int64)
+    vweights = rng.integers(0, 100, n_vertices).astype(np.float64)
+    eweights = rng.integers(0, 100, len(sizes)).astype(np.float64)
+    return hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights
+
+
+def check_same(read, written):
+    for got, expected in zip(read, written):
+        if (expected is None) or (got is None):
+            assert got is expected
+        else:
+            assert np.array_equal(got, expected)
+
+
+@pytest.mark.parametrize("fmt", [0, 1, 10, 11])
+def test_hmetis_round_trip(tmp_path, fmt):
+    rng = np.random.default_rng(fmt)
+    path = str(tmp_path / "h.hgr")
+    for _ in range(20):
+        hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights = random_hypergraph(rng)
+        written = (hyperedge_ptr, hyperedge_vertices, n_vertices, vweights if (fmt >= 10) else None,
+                   eweights if (fmt % 10 == 1) else None)
+        partitioner_io.write_hmetis(path, *written)
+        check_same(partitioner_io.read_hmetis(path), written)
+
+
+@pytest.mark.parametrize("scheme", [0, 1, 2, 3])
+@pytest.mark.parametrize("base", [0, 1])
+def test_patoh_round_trip(tmp_path, scheme, base):
+    rng = np.random.default_rng(scheme + 4 * base)
+    path = str(tmp_path / "h.patoh")
+    for _ in range(20):
+        hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights = random_hypergraph(rng)
+        written = (hyperedge_ptr, hyperedge_vertices, n_vertices, vweights if (scheme in (1, 3)) else None,
+                   eweights if (scheme in (2, 3)) else None)
+        partitioner_io.write_patoh(path, *written, base = base)
+        check_same(partitioner_io.read_patoh(path), written)
+
+
+def test_reads_commented_gzip_crlf_files(tmp_path):
+    path = str(tmp_path / "h.hgr.gz")
+    with open(path, "wb") as f:
+        f.write(gzip.compress(b"% a comment\r\n2 3 11\r\n\r\n5 1 2\r\n% another 7\r\n7 3\r\n1\r\n2\r\n3\r\n"))
+    hyperedge_ptr, hyperedge_vertices, n_vertices, vweights, eweights = partitioner_io.read_hmetis(path)
+    assert (hyperedge_ptr.tolist(), hyperedge_vertices.tolist(), n_vertices) == ([0, 2, 3], [0, 1, 2], 3)
+    assert (vweights.tolist(), eweights.tolist()) == ([1, 2, 3], [5, 7])
+
+
+@pytest.mark.parametrize("text", ["", "2\n1 2\n", "1 2 2\n1 2\n", "2 2\n1 2\n", "1 2\n1 3\n", "1 2\n0 1\n",
+                                  "1 2 10\n1 2\n5\n", "1 2\n1 2\n3 4\n"])
+def test_hmetis_rejects_malformed_files(tmp_path, text):
+    path = str(tmp_path / "h.hgr")
+    with open(path, "w") as f:
+        f.write(text)
+    with pytest.raises(ValueError):
+        partitioner_io.read_hmetis(path)
+
+
+@pytest.mark.parametrize("text", ["", "2 2 1 2\n1 2\n", "0 2 1 3\n0 1\n", "0 2 1 2 4\n0 1\n", "0 2 1 2 1 2\n0 1\n",
+                                  "0 2 1 2 1\n0 1\n5\n", "0 2 1 2\n0 1\n5\n", "1 2 1 2\n0 1\n"])
+def test_patoh_rejects_malformed_files(tmp_path, text):
+    path = str(tmp_path / "h.patoh")
+    with open(path, "w") as f:
+        f.write(text)
+    with pytest.raises(ValueError):
+        partitioner_io.read_patoh(path)
+
+
+def test_writers_reject_what_the_formats_cannot_hold(tmp_path):
+    path = str(tmp_path / "h.hgr")
+    with pytest.raises(ValueError):
+        partitioner_io.write_hmetis(path, np.array([0, 1, 1]), np.array([0]), 1)
+    with pytest.raises(ValueError):
+        partitioner_io.write_patoh(path, np.array([0, 1]), np.array([0]), 1, vweights = np.array([0.5]))
@@ -0,0 +1,134 @@
+"""Behaviour checks for the hash-based reductions of hypergraphs, against brute-force oracles on Python sets.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+import reduction
+from hypergraph_def import Hypergraph
+
+
+def oracle_classes(rows, active):
+    """Number the distinct sets among the active rows in the order of their first row, -1 for inactive rows."""
+    numbers = {}
+    return [numbers.setdefault(frozenset(row), len(numbers)) if keep else -1 for row, keep in zip(rows, active)]
+
+
+def random_rows(rng, n_ids):
+    """Draw rows from a few sets, in shuffled orders, so that many rows repeat a set."""
+    sets = [rng.choice(n_ids, rng.integers(0, n_ids + 1), replace = False) for _ in range(rng.integers(1, 6))]
+    return [rng.permutation(sets[rng.integers(0, len(sets))]).tolist() for _ in range(rng.integers(0, 30))]
+
+
+def compressed(rows):
+    ptr = np.concatenate(([0], np.cumsum([len(row) for row in rows]))).astype(np.int64)
+    return ptr, np.array(sum(rows, []), dtype = np.int64)
+
+
+def random_hypergraph(rng):
+    n = int(rng.integers(1, 12))
+    rows = random_rows(rng, n) or [[0]]
+    ptr, values = compressed(rows)
+    hype = Hypergraph.from_coo(values, np.repeat(np.arange(len(rows)), np.diff(ptr)), vweights = rng.random(n),
+                               eweights = rng.random(len(rows)), enames = ["e{}".format(j) for j in range(len(rows))],
+                               shape = (n, len(rows)))
+    if (len(rows) > 2) and rng.integers(0, 2):
+        hype.remove_hyperedges(rng.choice(len(rows), (len(rows) - 1) // 2, replace = False))
+    return hype
+
+
+def hyperedge_sets(hype):
+    removed = np.asarray(hype.removed_hyperedges())
+    return [None if removed[j] else [v.index() for v in hype.hyperedge(j).vertices()]
+            for j in range(hype.number_of_hyperedges())]
+
+
+def test_equivalence_classes_match_oracle():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        rows = random_rows(rng, int(rng.integers(1, 10)))
+        active = rng.integers(0, 4, len(rows)) > 0
+        n_classes, labels = reduction.equivalence_classes(*compressed(rows), active = active)
+        expected = oracle_classes(rows, active)
+        assert labels.tolist() == expected
+        assert n_classes == len(set(expected) - {-1})
+
+
+def test_equivalence_classes_survive_hash_collisions(monkeypatch):
+    #Hashing only the parity of the ids makes every two rows of the same length and parity count collide
+    monkeypatch.setattr(reduction, "_scramble", lambda ids, multiplier: (ids % 2).astype(np.uint64))
+    exact_leaders = reduction._exact_leaders
+    calls = []
+    monkeypatch.setattr(reduction, "_exact_leaders", lambda *args: calls.append(1) or exact_leaders(*args))
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        rows = random_rows(rng, int(rng.integers(1, 10)))
+        active = rng.integers(0, 4, len(rows)) > 0
+        n_classes, labels = reduction.equivalence_classes(*compressed(rows), active = active)
+        expected = oracle_classes(rows, active)
+        assert labels.tolist() == expected
+        assert n_classes == len(set(expected) - {-1})
+    assert calls
+
+
+def test_collapse_edges_matches_oracle():
+    rng = np.random.default_rng(2)
+    for _ in range(100):
+        hype = random_hypergraph(rng)
+        sets = hyperedge_sets(hype)
+        classes = oracle_classes([row or [] for row in sets], [row is not None for row in sets])
+        firsts = [classes.index(k) for k in range(max(classes) + 1)]
+        collapsed, multiplicity, labels = hype.collapse_edges()
+        assert labels.tolist() == classes
+        assert [sorted(row) for row in hyperedge_sets(collapsed)] == [sorted(sets[j]) for j in firsts]
+        assert multiplicity.tolist() == [classes.count(k) for k in range(len(firsts))]
+        assert [collapsed.hyperedge(k).name() for k in range(len(firsts))] == ["e{}".format(j) for j in firsts]
+        weights = np.asarray(hype.hyperedge_weights())
+        assert np.allclose(collapsed.hyperedge_weights(),
+                           [weights[[j for j, k in enumerate(classes) if (k == c)]].sum() for c in range(len(firsts))])
+        assert collapsed.number_of_vertices() == hype.number_of_vertices()
+
+
+def test_collapse_vertices_matches_oracle():
+    rng = np.random.default_rng(3)
+    for _ in range(100):
+        hype = random_hypergraph(rng)
+        sets = hyperedge_sets(hype)
+        n = hype.number_of_vertices()
+        memberships = [[j for j, row in enumerate(sets) if (row is not None) and (i in row)] for i in range(n)]
+        classes = oracle_classes(memberships, [True] * n)
+        firsts = [classes.index(k) for k in range(max(classes) + 1)]
+        collapsed, multiplicity, labels = hype.collapse_vertices()
+        assert labels.tolist() == classes
+        assert multiplicity.tolist() == [classes.count(k) for k in range(len(firsts))]
+        assert [collapsed.vertex(k).name() for k in range(len(firsts))] == [hype.vertex(i).name() for i in firsts]
+        weights = np.asarray(hype.vertex_weights())
+        assert np.allclose(collapsed.vertex_weights(),
+                           [weights[[i for i, k in enumerate(classes) if (k == c)]].sum() for c in range(len(firsts))])
+        #Every hyperedge keeps one vertex of each class it held
+        assert [sorted(row) for row in hyperedge_sets(collapsed)] == [sorted({classes[i] for i in row})
+                                                                      for row in sets if (row is not None)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 24])
+def test_toplexes_match_oracle(chunk_size):
+    rng = np.random.default_rng(chunk_size)
+    for _ in range(100):
+        #Subsets of few vertices, so that hyperedges often contain or repeat one another
+        n = int(rng.integers(1, 7))
+        rows = [rng.permutation(np.flatnonzero(rng.integers(0, 2, n))).tolist() for _ in range(rng.integers(1, 20))]
+        ptr, values = compressed(rows)
+        hype = Hypergraph.from_coo(values, np.repeat(np.arange(len(rows)), np.diff(ptr)), shape = (n, len(rows)))
+        if (len(rows) > 2) and rng.integers(0, 2):
+            hype.remove_hyperedges(rng.choice(len(rows), (len(rows) - 1) // 2, replace = False))
+        sets = [None if (row is None) else frozenset(row) for row in hyperedge_sets(hype)]
+        live = [j for j, row in enumerate(sets) if row]
+        expected = [j for j in live if (sets[j] not in [sets[k] for k in live if (k < j)]) and
+                    not any(sets[j] < sets[k] for k in live)]
+        maximal, ids = hype.toplexes(chunk_size = chunk_size)
+        assert ids.tolist() == expected
+        assert [frozenset(row) for row in hyperedge_sets(maximal)] == [sets[j] for j in expected]
@@ -0,0 +1,177 @@
+"""Behaviour checks for RowPool and the mutations of Hypergraph built on it, against brute-force membership models.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+import os
+import sys
+import numpy as np
+import pytest
+from scipy import sparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from hypergraph_def import Hypergraph
+from incidence_def import Incidence
+from row_pool_def import RowPool
+
+
+def check_pool(pool, model):
+    """Compare every way of reading a pool with a list of rows."""
+    assert len(pool) == len(model)
+    assert pool.number_of_entries() == sum(len(row) for row in model)
+    assert pool.lengths().tolist() == [len(row) for row in model]
+    for i, row in enumerate(model):
+        assert pool.row(i).tolist() == row
+    rows = np.arange(len(model))[::-1]
+    out_ptr, entries = pool.gather(rows)
+    assert [entries[out_ptr[k]:out_ptr[k + 1]].tolist() for k in range(len(rows))] == [model[i] for i in rows]
+
+
+def test_row_pool_matches_model():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        model = [rng.integers(0, 20, rng.integers(0, 5)).tolist() for _ in range(rng.integers(0, 10))]
+        pool = RowPool(np.cumsum([0] + [len(row) for row in model]), np.array(sum(model, []), dtype = np.int64),
+                       np.int32)
+        for _ in range(60):
+            operation = rng.integers(0, 7)
+            if (operation == 0):
+                rows = [rng.integers(0, 20, rng.integers(0, 4)).tolist() for _ in range(rng.integers(0, 3))]
+                pool.append_rows(np.cumsum([0] + [len(row) for row in rows]), np.array(sum(rows, []), dtype = np.int64))
+                model.extend(rows)
+            elif (len(model) == 0):
+                continue
+            elif (operation == 1):
+                i = int(rng.integers(0, len(model)))
+                model[i] = rng.integers(0, 20, rng.integers(0, 2 * len(model[i]) + 2)).tolist()
+                pool.replace_row(i, model[i])
+            elif (operation == 2):
+                rows = rng.integers(0, len(model), rng.integers(1, 8))
+                values = rng.integers(0, 20, len(rows))
+                pool.extend_rows(rows, values)
+                for i, value in zip(rows.tolist(), values.tolist()):
+                    model[i].append(value)
+            elif (operation == 3):
+                rows = rng.integers(0, len(model), rng.integers(1, 4))
+                values = rng.integers(0, 20, len(rows))
+                pool.remove_entries(rows, values)
+                for i, value in zip(rows.tolist(), values.tolist()):
+                    model[i] = [entry for entry in model[i] if entry != value]
+            elif (operation == 4):
+                rows = rng.integers(0, len(model), rng.integers(1, 3))
+                pool.clear_rows(rows)
+                for i in rows.tolist():
+                    model[i] = []
+            elif (operation == 5):
+                ptr, values = pool.arrays()
+                assert pool.is_compact()
+                assert [values[ptr[i]:ptr[i + 1]].tolist() for i in range(len(model))] == model
+            else:
+                pool.compact()
+            check_pool(pool, model)
+
+
+def test_row_pool_collects_garbage():
+    model = [[1, 2], [3]]
+    pool = RowPool(np.array([0, 2, 3]), np.array([1, 2, 3]), np.int32)
+    collected = False
+    for length in range(1, 2000):
+        model[0] = list(range(length))
+        pool.replace_row(0, model[0])
+        collected |= pool.is_compact()
+    #Rows that outgrow their slot leave garbage behind, which is compacted away once it outweighs the live entries
+    assert collected
+    check_pool(pool, model)
+
+
+def test_hypergraph_mutations_match_model():
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        n = int(rng.integers(1, 15))
+        model = [rng.choice(n, rng.integers(1, n + 1), replace = False).tolist() for _ in range(rng.integers(1, 8))]
+        hype = Hypergraph([[str(i) for i in vertices] for vertices in model], [str(i) for i in range(n)],
+                          ["e{}".format(j) for j in range(len(model))])
+        for step in range(40):
+            live = [j for j, vertices in enumerate(model) if (vertices is not None)]
+            operation = rng.integers(0, 5)
+            if (operation == 0):
+                n = int(hype.add_vertices(count = int(rng.integers(1, 3)))[-1]) + 1
+            elif (operation == 1):
+                new = [rng.choice(n, rng.integers(1, n + 1), replace = False).tolist()
+                       for _ in range(rng.integers(1, 4))]
+                hype.add_hyperedges_from_coo(np.concatenate(new), np.repeat(np.arange(len(new)), [len(e) for e in new]))
+                model.extend(new)
+            elif (operation == 2) and (live):
+                j = int(rng.choice(live))
+                model[j] = rng.choice(n, rng.integers(1, n + 1), replace = False).tolist()
+                hype.hyperedge(j).set_vertices([hype.vertex(i) for i in model[j]])
+            elif (operation == 3) and (len(live) > 1):
+                removed = rng.choice(live, rng.integers(1, len(live)), replace = False)
+                for j in removed.tolist():
+                    model[j] = None
+                renumbering = hype.remove_hyperedges(removed)
+                if (renumbering is not None):
+                    #Removed hyperedges outnumbered the others and the hypergraph compacted itself
+                    kept = np.array([vertices is not None for vertices in model])
+                    assert renumbering.tolist() == np.where(kept, np.cumsum(kept) - 1, -1).tolist()
+                    model = [vertices for vertices in model if (vertices is not None)]
+            elif (operation == 4):
+                hype.incidence_matrix("csr")
+
+            assert (hype.number_of_vertices(), hype.number_of_hyperedges()) == (n, len(model))
+            for j, vertices in enumerate(model):
+                if (vertices is not None):
+                    assert [v.index() for v in hype.hyperedge(j).vertices()] == vertices
+            memberships = [[j for j, vertices in enumerate(model) if (vertices is not None) and (i in vertices)]
+                           for i in range(n)]
+            for i in range(n):
+                assert [e.index() for e in hype.incident_edges(hype.vertex(i))] == memberships[i]
+            assert hype.vertex_degrees().tolist() == [len(hyperedges) for hyperedges in memberships]
+            dense = np.zeros((n, len(model)))
+            for j, vertices in enumerate(model):
+                dense[vertices or [], j] = 1
+            assert (hype.incidence_matrix("csc").toarray() == dense).all()
+            assert (hype.incidence_matrix("csr").toarray() == dense).all()
+
+
+def test_vertex_index_stays_sorted_after_collection():
+    n_hyperedges = 100000
+    hype = Hypergraph.from_coo(np.ones(n_hyperedges, dtype = np.int64), np.arange(n_hyperedges),
+                               shape = (2, n_hyperedges))
+    hype.incident_edges(hype.vertex(1))
+    #Re-adding hyperedge 0 to vertex 1 appends it to the row, and the garbage left behind gets the pool compacted
+    hype.hyperedge(0).set_vertices([hype.vertex(0), hype.vertex(1)])
+    assert [e.index() for e in hype.incident_edges(hype.vertex(1))] == list(range(n_hyperedges))
+    csr = hype.incidence_matrix("csr")
+    assert csr.has_sorted_indices and (csr.indices[csr.indptr[1]:] == np.arange(n_hyperedges)).all()
+
+
+def test_adding_a_hyperedge_does_not_copy_the_storage():
+    n_hyperedges = 100000
+    incidence = Incidence(np.arange(n_hyperedges + 1), np.zeros(n_hyperedges, dtype = np.int64), 3)
+    buffers = []
+    for _ in range(1000):
+        incidence.add_hyperedges(np.array([0, 3]), np.array([0, 1, 2]))
+        buffers.append(tuple(array.ctypes.data for array in incidence.hyperedge_arrays()))
+    #Growing by doubling moves the offsets and the entries a logarithmic number of times, not on every call
+    moves = sum(before != after for before, after in zip(buffers, buffers[1:]))
+    assert moves <= 2 * (1 + int(np.log2(1000)))
+    ptr, values = incidence.hyperedge_arrays()
+    assert len(ptr) == n_hyperedges + 1001 and (values[n_hyperedges:] == np.tile([0, 1, 2], 1000)).all()
+
+
+def test_changes_leave_the_arrays_of_the_caller_untouched():
+    matrix = sparse.csc_matrix(np.array([[1, 0], [1, 1], [0, 1]]))
+    indptr, indices = matrix.indptr.copy(), matrix.indices.copy()
+    hype = Hypergraph.from_sparse(matrix)
+    #Same number of vertices, which a pool sharing the arrays of the caller would overwrite in place
+    hype.hyperedge(0).set_vertices([hype.vertex(2), hype.vertex(0)])
+    hype.remove_hyperedges([1])
+    assert (matrix.indptr == indptr).all() and (matrix.indices == indices).all()
+
+
+def test_removing_hyperedges_checks_their_ids():
+    hype = Hypergraph.from_coo(np.array([0, 1, 1]), np.array([0, 0, 1]), shape = (2, 2))
+    for ids in ([-1], [2]):
+        with pytest.raises(ValueError):
+            hype.remove_hyperedges(ids)
+    assert hype.removed_hyperedges().tolist() == [False, False]
@@ -0,0 +1,69 @@
+"""Behaviour checks for batches of breadth-first searches, in the calling process and in a pool of processes,
+against a brute-force search on Python sets.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+import traversal
+from hypergraph_def import Hypergraph
+
+
+def oracle_distances(hyperedges, n, source, max_depth):
+    """Search hop by hop through the hyperedges, as lists of vertices."""
+    distances = [-1] * n
+    distances[source] = 0
+    frontier, depth = {source}, 0
+    while (frontier) and ((max_depth is None) or (depth < max_depth)):
+        depth += 1
+        reached = {i for e in hyperedges if frontier.intersection(e) for i in e if (distances[i] < 0)}
+        for i in reached:
+            distances[i] = depth
+        frontier = reached
+    return distances
+
+
+def random_hypergraph(rng):
+    """Draw a sparse hypergraph, often disconnected, with some hyperedges removed."""
+    n, m = int(rng.integers(1, 25)), int(rng.integers(1, 15))
+    sizes = rng.integers(1, min(n, 4) + 1, m)
+    vertex_ids = np.concatenate([rng.choice(n, size, replace = False) for size in sizes])
+    hype = Hypergraph.from_coo(vertex_ids, np.repeat(np.arange(m), sizes), shape = (n, m))
+    if (m > 2):
+        hype.remove_hyperedges(rng.choice(m, int(rng.integers(0, (m + 1) // 2)), replace = False))
+    removed = np.asarray(hype.removed_hyperedges())
+    hyperedges = [[v.index() for v in hype.hyperedge(j).vertices()] for j in range(m) if (not removed[j])]
+    return hype, hyperedges
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+@pytest.mark.parametrize("max_depth", [None, 2])
+def test_batch_searches_match_oracle(processes, max_depth):
+    rng = np.random.default_rng(processes + (max_depth or 0))
+    for _ in range(5 if (processes > 1) else 40):
+        hype, hyperedges = random_hypergraph(rng)
+        n = hype.number_of_vertices()
+        sources = rng.integers(0, n, int(rng.integers(1, 2 * n)))
+        expected = np.array([oracle_distances(hyperedges, n, int(s), max_depth) for s in sources])
+        distances = hype.batch_bfs_distances(sources, max_depth = max_depth, processes = processes)
+        assert distances.tolist() == expected.tolist()
+        statistics = hype.bfs_statistics(sources, max_depth = max_depth, processes = processes)
+        reached = expected >= 0
+        assert statistics.tolist() == np.stack([expected.max(axis = 1), reached.sum(axis = 1),
+                                                np.where(reached, expected, 0).sum(axis = 1)], axis = 1).tolist()
+
+
+def test_every_task_writes_its_own_rows():
+    rng = np.random.default_rng(5)
+    hype, hyperedges = random_hypergraph(rng)
+    n = hype.number_of_vertices()
+    sources = rng.integers(0, n, 3 * n)
+    expected = [oracle_distances(hyperedges, n, int(s), None) for s in sources]
+    #One source per task, so that tasks finish out of order across the workers
+    distances = traversal.batch_bfs_distances(*hype.incidence().vertex_arrays(), *hype.incidence().hyperedge_arrays(),
+                                              sources, processes = 2, chunk_size = 1)
+    assert distances.tolist() == expected
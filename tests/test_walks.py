@@ -0,0 +1,25 @@
+"""Behaviour checks for weighted random walks on small hypergraphs whose walks can be told apart by hand.
+
+Run from the repository root with `python -m pytest tests`.
+"""
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+import walks
+
+
+def test_walks_stop_at_hyperedges_without_vertex_weight():
+    #Vertex 0 lies in hyperedge 0, whose vertices all weigh 0, and in hyperedge 1 = {0, 1}
+    vertex_ptr, vertex_hyperedges = np.array([0, 2, 3, 4]), np.array([0, 1, 1, 0])
+    hyperedge_ptr, hyperedge_vertices = np.array([0, 2, 4]), np.array([0, 2, 0, 1])
+    vweights = np.array([0.0, 1.0, 0.0])
+    chunks = list(walks.random_walks(vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices,
+                                     np.zeros(200, dtype = np.int64), 4, vweights = vweights, seed = 0))
+    rows = np.concatenate(chunks)
+    stopped = rows[:, 1] == -1
+    assert stopped.any() and (~stopped).any()
+    assert (rows[stopped, 1:] == -1).all()
+    #Walkers only ever move onto vertices of positive weight
+    assert np.isin(rows[:, 1:], [-1, 1]).all()
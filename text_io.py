@@ -0,0 +1,75 @@
+"""Streaming reader for hypergraphs stored as text, one hyperedge per line.
+
+Each line lists the names of the vertices of a hyperedge separated by a delimiter (whitespace by default), optionally
+preceded by the name of the hyperedge. Blank lines and lines starting with the comment prefix are skipped. Gzip
+compressed files are recognised from their magic bytes.
+"""
+import gzip
+from contextlib import nullcontext
+from itertools import chain, islice
+import numpy as np
+from growable_array_def import GrowableArray
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def read_hyperedges(source, delimiter = None, comment = "#", named = False, chunk_size = 65536):
+    """Read a hyperedge-per-line file in chunks of lines. Vertex names are interned into consecutive ids as they are
+    first seen and the memberships are appended to growable integer arrays, so memory is bounded by the incidence
+    itself plus one chunk of lines.
+
+    Args:
+        source (String or file): The path of the file, or an open text file.
+        delimiter (String, optional): The separator between names. Defaults to None for any whitespace.
+        comment (String, optional): Lines starting with this prefix are skipped. Defaults to "#".
+        named (bool, optional): Whether the first field of each line is the name of the hyperedge. Defaults to False,
+            in which case hyperedges are named by their ids.
+        chunk_size (int, optional): The number of lines processed at a time. Defaults to 65536.
+
+    Returns:
+        tuple: (hyperedge_ptr, hyperedge_vertices, vertex_names, hyperedge_names) where hyperedge_names is None unless
+            named is set.
+    """
+    vertex_ids = {}
+    intern = vertex_ids.setdefault
+    sizes = GrowableArray(np.int64, [0])
+    members = GrowableArray(np.int64)
+    hyperedge_names = [] if named else None
+
+    with _open(source) as f:
+        while True:
+            lines = list(islice(f, chunk_size))
+            if (not lines):
+                break
+            rows = [line.split(delimiter) for line in lines if line.strip() and not line.lstrip().startswith(comment)]
+            if (named):
+                hyperedge_names.extend(row[0].strip() for row in rows)
+                rows = [row[1:] for row in rows]
+            rows = [[name.strip() for name in row] for row in rows] if (delimiter is not None) else rows
+            sizes.append(np.fromiter(map(len, rows), dtype = np.int64, count = len(rows)))
+            tokens = list(chain.from_iterable(rows))
+            #setdefault gives a new name the next free id and returns the existing id of a known one
+            members.append(np.fromiter((intern(token, len(vertex_ids)) for token in tokens), dtype = np.int64,
+                                       count = len(tokens)))
+
+    hyperedge_ptr = np.cumsum(sizes.trim())
+    return hyperedge_ptr, members.trim(), list(vertex_ids), hyperedge_names
+
+
+def _open(source):
+    """Open a text source, decompressing it if it is gzip compressed.
+
+    Args:
+        source (String or file): The path of the file, or an open text file.
+
+    Returns:
+        file: A text file object usable as a context manager.
+    """
+    if hasattr(source, "read"):
+        return nullcontext(source)
+    with open(source, "rb") as f:
+        compressed = f.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    if (compressed):
+        return gzip.open(source, "rt", encoding = "utf-8")
+    return open(source, "r", encoding = "utf-8")
+
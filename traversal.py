@@ -0,0 +1,255 @@
+"""Distances between the vertices of a hypergraph, through its hyperedges, computed on the two compressed sides of
+the incidence: vertex_ptr / vertex_hyperedges (the hyperedges of each vertex) and hyperedge_ptr / hyperedge_vertices
+(the vertices of each hyperedge).
+
+Breadth-first search advances a whole frontier at a time: the hyperedges of the frontier not crossed yet are
+gathered in one vectorized step, marked as crossed, and their vertices not reached yet form the next frontier. Every
+hyperedge is therefore expanded once, and a search costs O(memberships) whatever the number of sources.
+
+Weighted distances cost w(e) to cross hyperedge e, and are found with Dijkstra's algorithm on the directed star
+expansion, in which each vertex reaches its hyperedges at cost w(e) and each hyperedge its vertices at cost 0.
+
+Batches of single-source searches, as needed for eccentricities or closeness, are spread over a multiprocessing pool.
+The incidence arrays and the output are copied once into shared memory, which every worker attaches to when it
+starts, so tasks only carry source ids and workers write their results in place.
+"""
+import os
+from multiprocessing import Pool, shared_memory
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+from incidence_def import gather_rows
+
+#The shared arrays a pool worker attached to: the four incidence arrays then the output
+_shared = None
+
+
+def bfs_distances(vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices, sources, max_depth = None):
+    """Find the number of hyperedges to cross from the nearest source to every vertex.
+
+    Args:
+        vertex_ptr (np.ndarray): The offsets of the hyperedges of each vertex.
+        vertex_hyperedges (np.ndarray): The hyperedges of each vertex.
+        hyperedge_ptr (np.ndarray): The offsets of the vertices of each hyperedge.
+        hyperedge_vertices (np.ndarray): The vertices of each hyperedge.
+        sources (array_like): The vertex ids to start from, all at distance 0.
+        max_depth (int, optional): Stop after this many hops. Defaults to None for no limit.
+
+    Returns:
+        np.ndarray: The distance of each vertex, -1 for the vertices not reached.
+    """
+    distances = np.full(len(vertex_ptr) - 1, -1, dtype = np.int64)
+    crossed = np.zeros(len(hyperedge_ptr) - 1, dtype = bool)
+    frontier = np.unique(np.asarray(sources, dtype = np.int64))
+    distances[frontier] = 0
+    depth = 0
+    slots = np.zeros(max(len(distances), len(crossed)), dtype = np.int64)
+    while (len(frontier) > 0) and ((max_depth is None) or (depth < max_depth)):
+        _, positions = gather_rows(vertex_ptr, frontier)
+        hyperedges = vertex_hyperedges[positions]
+        hyperedges = _distinct(hyperedges[~crossed[hyperedges]], slots)
+        crossed[hyperedges] = True
+        _, positions = gather_rows(hyperedge_ptr, hyperedges)
+        vertices = hyperedge_vertices[positions]
+        frontier = _distinct(vertices[distances[vertices] < 0], slots)
+        depth += 1
+        distances[frontier] = depth
+    return distances
+
+
+def weighted_distances(vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices, eweights, sources,
+                       limit = None):
+    """Find the weight of the lightest path from the nearest source to every vertex, a path costing the total weight
+    of the hyperedges it crosses.
+
+    Args:
+        vertex_ptr (np.ndarray): The offsets of the hyperedges of each vertex.
+        vertex_hyperedges (np.ndarray): The hyperedges of each vertex.
+        hyperedge_ptr (np.ndarray): The offsets of the vertices of each hyperedge.
+        hyperedge_vertices (np.ndarray): The vertices of each hyperedge.
+        eweights (np.ndarray): The weight of each hyperedge.
+        sources (array_like): The vertex ids to start from, all at distance 0.
+        limit (float, optional): Stop searching past this distance. Defaults to None for no limit.
+
+    Raises:
+        ValueError: If a hyperedge weight is negative.
+
+    Returns:
+        np.ndarray: The distance of each vertex, inf for the vertices not reached.
+    """
+    eweights = np.asarray(eweights, dtype = np.float64)
+    if (eweights < 0).any():
+        raise ValueError("Shortest paths need non-negative hyperedge weights")
+    n = len(vertex_ptr) - 1
+    m = len(hyperedge_ptr) - 1
+    #Vertex rows point to the hyperedge nodes n + j, hyperedge rows back to their vertices. Zero costs are kept as
+    #explicit entries, which csgraph treats as edges.
+    indptr = np.concatenate((vertex_ptr, len(vertex_hyperedges) + np.asarray(hyperedge_ptr[1:])))
+    indices = np.concatenate((np.asarray(vertex_hyperedges) + n, hyperedge_vertices))
+    data = np.concatenate((eweights[vertex_hyperedges], np.zeros(len(hyperedge_vertices))))
+    star = sparse.csr_matrix((data, indices, indptr), shape = (n + m, n + m))
+    sources = np.unique(np.asarray(sources, dtype = np.int64))
+    if (len(sources) == 0):
+        return np.full(n, np.inf)
+    distances = csgraph.dijkstra(star, directed = True, indices = sources, min_only = True,
+                                 limit = np.inf if (limit is None) else limit)
+    return distances[:n]
+
+
+def batch_bfs_distances(vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices, sources,
+                        max_depth = None, processes = None, chunk_size = None):
+    """Run one breadth-first search per source, spread over a pool of processes.
+
+    Args:
+        vertex_ptr (np.ndarray): The offsets of the hyperedges of each vertex.
+        vertex_hyperedges (np.ndarray): The hyperedges of each vertex.
+        hyperedge_ptr (np.ndarray): The offsets of the vertices of each hyperedge.
+        hyperedge_vertices (np.ndarray): The vertices of each hyperedge.
+        sources (array_like): The vertex ids to search from.
+        max_depth (int, optional): Stop each search after this many hops. Defaults to None for no limit.
+        processes (int, optional): The number of worker processes. Defaults to None for one per CPU; 1 searches in
+            the calling process.
+        chunk_size (int, optional): The number of sources per task. Defaults to None to give each worker about four
+            tasks.
+
+    Returns:
+        np.ndarray: A len(sources) x n_vertices int32 array whose row k holds the distances from sources[k], -1 for
+            the vertices not reached.
+    """
+    output = np.empty((len(sources), len(vertex_ptr) - 1), dtype = np.int32)
+    return _run_batch((vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices), output, sources,
+                      max_depth, False, processes, chunk_size)
+
+
+def batch_bfs_statistics(vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices, sources,
+                         max_depth = None, processes = None, chunk_size = None):
+    """Run one breadth-first search per source, spread over a pool of processes, and keep only the statistics
+    behind eccentricity, diameter and closeness, so the output stays small for any number of vertices.
+
+    Args:
+        vertex_ptr (np.ndarray): The offsets of the hyperedges of each vertex.
+        vertex_hyperedges (np.ndarray): The hyperedges of each vertex.
+        hyperedge_ptr (np.ndarray): The offsets of the vertices of each hyperedge.
+        hyperedge_vertices (np.ndarray): The vertices of each hyperedge.
+        sources (array_like): The vertex ids to search from.
+        max_depth (int, optional): Stop each search after this many hops. Defaults to None for no limit.
+        processes (int, optional): See batch_bfs_distances. Defaults to None for one per CPU.
+        chunk_size (int, optional): See batch_bfs_distances. Defaults to None.
+
+    Returns:
+        np.ndarray: A len(sources) x 3 int64 array whose row k holds, for sources[k], the largest distance reached
+            (its eccentricity within its component), the number of vertices reached including itself, and the sum of
+            their distances.
+    """
+    output = np.empty((len(sources), 3), dtype = np.int64)
+    return _run_batch((vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices), output, sources,
+                      max_depth, True, processes, chunk_size)
+
+
+def _run_batch(incidence, output, sources, max_depth, statistics, processes, chunk_size):
+    """Split a batch of searches into tasks of consecutive sources and run them, in a pool attached to a shared
+    copy of the arrays when more than one process is asked for.
+
+    Args:
+        incidence (tuple): The four incidence arrays.
+        output (np.ndarray): The array to fill, one row per source.
+        sources (array_like): The vertex ids to search from.
+        max_depth (int): Stop each search after this many hops, or None.
+        statistics (bool): Whether to write statistics rather than distances.
+        processes (int): The number of worker processes, or None for one per CPU.
+        chunk_size (int): The number of sources per task, or None.
+
+    Returns:
+        np.ndarray: The filled output.
+    """
+    sources = np.asarray(sources, dtype = np.int64).ravel()
+    processes = os.cpu_count() if (processes is None) else processes
+    if (processes <= 1) or (len(sources) <= 1):
+        _search(incidence, output, 0, sources, max_depth, statistics)
+        return output
+    if (chunk_size is None):
+        chunk_size = max(1, -(-len(sources) // (4 * processes)))
+    tasks = [(first, sources[first:first + chunk_size], max_depth, statistics)
+             for first in range(0, len(sources), chunk_size)]
+
+    blocks = []
+    try:
+        specs = []
+        for array in (*incidence, output):
+            array = np.asarray(array)
+            block = shared_memory.SharedMemory(create = True, size = max(array.nbytes, 1))
+            blocks.append(block)
+            shared = np.ndarray(array.shape, dtype = array.dtype, buffer = block.buf)
+            if (array is not output):
+                shared[...] = array
+            specs.append((block.name, array.shape, array.dtype.str))
+        with Pool(min(processes, len(tasks)), initializer = _attach, initargs = (specs,)) as pool:
+            for _ in pool.imap_unordered(_pool_search, tasks):
+                pass
+        output[...] = shared
+    finally:
+        #Views onto a block must be released before it can be closed
+        shared = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return output
+
+
+def _attach(specs):
+    """Attach a pool worker to the shared arrays.
+
+    Args:
+        specs (list): (name, shape, dtype) of each shared memory block.
+    """
+    global _shared
+    blocks = [shared_memory.SharedMemory(name = name) for name, _, _ in specs]
+    arrays = [np.ndarray(shape, dtype = dtype, buffer = block.buf) for block, (_, shape, dtype) in zip(blocks, specs)]
+    #The blocks must stay open as long as the arrays are used
+    _shared = (blocks, arrays)
+
+
+def _pool_search(task):
+    """Run one task in a pool worker, on the shared arrays.
+
+    Args:
+        task (tuple): (first, sources, max_depth, statistics), see _search.
+    """
+    _, arrays = _shared
+    _search(arrays[:4], arrays[4], *task)
+
+
+def _search(incidence, output, first, sources, max_depth, statistics):
+    """Run a search from each of some consecutive sources of a batch and write its results.
+
+    Args:
+        incidence (tuple): The four incidence arrays.
+        output (np.ndarray): The output of the whole batch.
+        first (int): The position of the first source in the batch.
+        sources (np.ndarray): The sources of the task.
+        max_depth (int): Stop each search after this many hops, or None.
+        statistics (bool): Whether to write statistics rather than distances.
+    """
+    for k, source in enumerate(sources):
+        distances = bfs_distances(*incidence, [source], max_depth = max_depth)
+        if (statistics):
+            reached = distances[distances >= 0]
+            output[first + k] = (reached.max(), len(reached), reached.sum())
+        else:
+            output[first + k] = distances
+
+
+def _distinct(ids, slots):
+    """Drop the repeated ids of an array in linear time, keeping one occurrence of each: every id writes its position
+    into a scratch array, and only the occurrence whose position was written last survives.
+
+    Args:
+        ids (np.ndarray): The ids.
+        slots (np.ndarray): A scratch integer array indexed by id.
+
+    Returns:
+        np.ndarray: The distinct ids, in the order of their last occurrence.
+    """
+    positions = np.arange(len(ids))
+    slots[ids] = positions
+    return ids[slots[ids] == positions]
@@ -1,21 +1,28 @@
-from hypergraph_def import Hypergraph
-from vertex_def import Vertex
-
 class Vertex:
 
+    #Views are created by the million, so they carry no per-instance __dict__
+    __slots__ = ("__hype", "__index")
+
     #=========================CONSTRUCTOR=========================
-    def __init__(self, hype, name, weight):
-        """Constructor for Vertex class.
+    def __init__(self, hype, index):
+        """Constructor for Vertex class. A vertex is a lightweight view onto the storage of its parent hypergraph and
+        is created on demand by it, so two Vertex objects with the same parent and id are equal.
 
         Args:
             hype (Hypergraph): The hypergraph the vertex belongs to.
-            name (String): The name of the vertex.
-            weight (Float): The weight associated with the vertex.
+            index (int): The integer id of the vertex within the hypergraph.
         """
         self.__set_hype(hype)
-        self.set_name(name)
-        self.set_weight(weight)
-    
+        self.__index = int(index)
+
+    def __eq__(self, other):
+        if (not isinstance(other, Vertex)):
+            return NotImplemented
+        return (self.__hype is other.parent_hypergraph()) and (self.__index == other.index())
+
+    def __hash__(self):
+        return hash((id(self.__hype), self.__index))
+
     #=========================GETTERS AND SETTERS=========================
     def parent_hypergraph(self):
         """Return the hypergraph that the vertex belongs to.
@@ -25,21 +32,37 @@ class Vertex:
         """
         return self.__hype
 
+    def index(self):
+        """Return the integer id of the vertex.
+
+        Returns:
+            int: The position of the vertex in the vertex set of its hypergraph.
+        """
+        return self.__index
+
     def name(self):
         """Return the name of the vertex.
 
         Returns:
             String: The name of the vertex.
         """
-        return self.__name
-    
+        return self.__hype._vertex_name(self.__index)
+
     def weight(self):
         """Return the weight of a vertex.
 
         Returns:
             Float: The weight associated with a vertex.
         """
-        return self.__weight
+        return self.__hype._vertex_weight(self.__index)
+
+    def degree(self):
+        """Return the degree of a vertex.
+
+        Returns:
+            int: The number of hyperedges containing the vertex.
+        """
+        return self.__hype._vertex_degree(self.__index)
 
     def __set_hype(self, hype):
         """Set the parent hypergraph of a vertex.
@@ -55,7 +78,7 @@ class Vertex:
         Args:
             name (String): The new name for the vertex.
         """
-        self.__name = name
+        self.__hype._set_vertex_name(self.__index, name)
 
     def set_weight(self, weight):
         """Set the weight of a vertex.
@@ -63,4 +86,4 @@ class Vertex:
         Args:
             weight (Float): The new weight for the vertex.
         """
-        self.__weight = weight
\ No newline at end of file
+        self.__hype._set_vertex_weight(self.__index, weight)
@@ -0,0 +1,120 @@
+"""Random walks on a hypergraph, alternating vertex -> hyperedge -> vertex, computed on the two compressed sides of
+the incidence: vertex_ptr / vertex_hyperedges and hyperedge_ptr / hyperedge_vertices.
+
+A step moves every walker at once. Each walker draws one of the hyperedges of its vertex, then one of the vertices
+of that hyperedge (possibly its own), either uniformly from the offsets of the row or, for biased walks, by inverting
+the cumulative weights of the row entries with a binary search, confined to the row, over one precomputed array
+of prefix sums.
+
+Walks are generated by chunks of walkers and handed out as int32 arrays, one row per walk, so that any number of
+walks can be streamed to a consumer with bounded memory.
+"""
+import numpy as np
+
+
+def random_walks(vertex_ptr, vertex_hyperedges, hyperedge_ptr, hyperedge_vertices, starts, length, eweights = None,
+                 vweights = None, chunk_size = 65536, seed = None):
+    """Generate random walks from given start vertices.
+
+    Args:
+        vertex_ptr (np.ndarray): The offsets of the hyperedges of each vertex.
+        vertex_hyperedges (np.ndarray): The hyperedges of each vertex.
+        hyperedge_ptr (np.ndarray): The offsets of the vertices of each hyperedge.
+        hyperedge_vertices (np.ndarray): The vertices of each hyperedge.
+        starts (np.ndarray): The start vertex of each walk.
+        length (int): The number of vertices of each walk, its start included.
+        eweights (np.ndarray, optional): Draw hyperedges with probability proportional to these weights. Defaults to
+            None for uniform draws.
+        vweights (np.ndarray, optional): Draw vertices with probability proportional to these weights. Defaults to
+            None for uniform draws.
+        chunk_size (int, optional): The number of walks per chunk. Defaults to 65536.
+        seed (int, optional): Seed of the random draws. Defaults to None.
+
+    Raises:
+        ValueError: If length is smaller than 1 or a weight is negative.
+
+    Yields:
+        np.ndarray: A chunk of walks, as a chunk_size x length int32 array (smaller for the last chunk). A walk
+            reaching a vertex without any hyperedge of positive weight, or drawing a hyperedge without any vertex of
+            positive weight, stops, and the rest of its row is -1.
+    """
+    if (length < 1):
+        raise ValueError("Walks must hold at least one vertex, got length {}".format(length))
+    rng = np.random.default_rng(seed)
+    starts = np.asarray(starts, dtype = np.int64).ravel()
+    hyperedge_cumulative = _cumulative(eweights, vertex_hyperedges)
+    vertex_cumulative = _cumulative(vweights, hyperedge_vertices)
+
+    for first in range(0, len(starts), chunk_size):
+        walks = np.full((min(chunk_size, len(starts) - first), length), -1, dtype = np.int32)
+        current = starts[first:first + chunk_size]
+        walkers = np.arange(len(current))
+        walks[:, 0] = current
+        for step in range(1, length):
+            positions, valid = _draw(vertex_ptr, hyperedge_cumulative, current, rng)
+            walkers, positions = walkers[valid], positions[valid]
+            if (len(walkers) == 0):
+                break
+            positions, valid = _draw(hyperedge_ptr, vertex_cumulative, vertex_hyperedges[positions], rng)
+            walkers, positions = walkers[valid], positions[valid]
+            current = hyperedge_vertices[positions]
+            walks[walkers, step] = current
+        yield walks
+
+
+def _cumulative(weights, entries):
+    """Compute the prefix sums of the weights of the entries of a compressed structure.
+
+    Args:
+        weights (np.ndarray): The weight of each id the entries refer to, or None.
+        entries (np.ndarray): The ids held by the structure.
+
+    Raises:
+        ValueError: If a weight is negative.
+
+    Returns:
+        np.ndarray: None if weights is None, and otherwise an array one longer than entries whose value k is the
+            total weight of the entries before k.
+    """
+    if (weights is None):
+        return None
+    weights = np.asarray(weights, dtype = np.float64)
+    if (weights < 0).any():
+        raise ValueError("Random walks need non-negative weights")
+    cumulative = np.zeros(len(entries) + 1)
+    np.cumsum(weights[entries], out = cumulative[1:])
+    return cumulative
+
+
+def _draw(ptr, cumulative, rows, rng):
+    """Draw one entry from each of some rows of a compressed structure.
+
+    Args:
+        ptr (np.ndarray): The row offsets of the structure.
+        cumulative (np.ndarray): The prefix sums of the entry weights (see _cumulative), or None for uniform draws.
+        rows (np.ndarray): The row of each draw.
+        rng (np.random.Generator): The source of randomness.
+
+    Returns:
+        tuple: (positions, valid) where positions are the positions of the entries drawn, and valid tells which rows
+            had an entry to draw (positions are meaningless elsewhere).
+    """
+    first = ptr[rows]
+    lengths = ptr[rows + 1] - first
+    if (cumulative is None):
+        positions = first + (rng.random(len(rows)) * lengths).astype(np.int64)
+        return positions, lengths > 0
+    base = cumulative[first]
+    total = cumulative[first + lengths] - base
+    targets = base + rng.random(len(rows)) * total
+    #Binary search for the entry covering each target, confined to its row: the searches stay in cache-friendly
+    #ranges and only the unfinished ones are advanced
+    low, high = first, first + np.maximum(lengths - 1, 0)
+    active = np.flatnonzero(low < high)
+    while (len(active) > 0):
+        middle = (low[active] + high[active]) // 2
+        after = cumulative[middle + 1] <= targets[active]
+        low[active[after]] = middle[after] + 1
+        high[active[~after]] = middle[~after]
+        active = active[low[active] < high[active]]
+    return low, total > 0